@@ -11,8 +11,12 @@ import os
 import json
 from datetime import datetime
 
-# Initialize database
-db.init_db()
+# Initialize the database once per server process, not on every rerun
+@st.cache_resource(show_spinner=False)
+def initialize_database():
+    return db.ensure_initialized()
+
+initialize_database()
 
 # Set page configuration
 st.set_page_config(
@@ -325,20 +329,20 @@ def render_dashboard():
     st.title("Dashboard")
     st.write("Welcome to your Web3 Startup Platform Dashboard")
 
+    # Counts and recent projects in one summary
+    summary = db.get_dashboard_summary(st.session_state.user['id'])
+
     # Quick Stats
     col1, col2, col3, col4 = st.columns(4)
 
     with col1:
-        projects = db.get_projects_by_user(st.session_state.user['id'])
-        st.metric("Projects", len(projects) if projects else 0)
+        st.metric("Projects", summary['projects'])
 
     with col2:
-        tokenomics_models = db.get_tokenomics_models_by_user(st.session_state.user['id'])
-        st.metric("Tokenomics Models", len(tokenomics_models) if tokenomics_models else 0)
+        st.metric("Tokenomics Models", summary['tokenomics_models'])
 
     with col3:
-        crypto_systems = db.get_cryptoeconomic_systems_by_user(st.session_state.user['id'])
-        st.metric("Cryptoeconomic Systems", len(crypto_systems) if crypto_systems else 0)
+        st.metric("Cryptoeconomic Systems", summary['cryptoeconomic_systems'])
 
     with col4:
         # User plan/status
@@ -351,10 +355,8 @@ def render_dashboard():
         st.subheader("Recent Activity")
 
         # Get recent projects
-        recent_projects = db.get_projects_by_user(st.session_state.user['id'])
+        recent_projects = summary['recent_projects']
         if recent_projects:
-            recent_projects = sorted(recent_projects, key=lambda x: x.last_edited if x.last_edited else x.created_at, reverse=True)[:5]
-
             for project in recent_projects:
                 with st.container():
                     cols = st.columns([3, 2, 1])
@@ -388,7 +390,7 @@ def render_dashboard():
     # Resources section
     st.subheader("Learning Resources")
 
-    resources = db.get_resources()
+    resources = db.list_resources()
     if resources:
         cols = st.columns(len(resources))
 
@@ -420,7 +422,7 @@ def render_projects_page():
             st.rerun()
 
     # Get user's projects
-    projects = db.get_projects_by_user(st.session_state.user['id'])
+    projects = db.list_projects(st.session_state.user['id'])
 
     if not projects:
         st.info("You don't have any projects yet. Click 'New Project' to create one.")
@@ -437,6 +439,8 @@ def render_projects_page():
                         st.markdown(f"### {project.name}")
                         st.markdown(f"**Status:** {project.status.capitalize()}")
                         st.markdown(f"**Progress:** {project.token_design_progress}%")
+                        if project.token:
+                            st.markdown(f"**Token:** {project.token.name} ({project.token.symbol})")
                         st.markdown(f"**Last edited:** {project.last_edited.strftime('%Y-%m-%d') if project.last_edited else 'Never'}")
 
                         col1, col2 = st.columns(2)
@@ -481,7 +485,7 @@ def render_model_comparison_page():
     st.write("Compare different tokenomics models to find the optimal strategy")
 
     # Get user's tokenomics models
-    models = db.get_tokenomics_models_by_user(st.session_state.user['id'])
+    models = db.list_tokenomics_models(st.session_state.user['id'])
 
     if not models:
         st.info("You don't have any tokenomics models to compare. Create models first.")
@@ -688,7 +692,44 @@ def render_admin_users_page():
 
     st.subheader("All Users")
 
-    users = db.get_all_users()
+    # Filters and sort run in the database; only the page shown is fetched
+    col1, col2, col3, col4 = st.columns([3, 2, 2, 1])
+    with col1:
+        search = st.text_input("Search username or email", key="admin_users_search")
+    with col2:
+        plan_filter = st.selectbox("Plan", ["All", "free", "premium", "enterprise"], key="admin_users_plan")
+    with col3:
+        sort = st.selectbox("Sort by", list(db.USER_SORTS.keys()), key="admin_users_sort")
+    with col4:
+        page_size = st.selectbox("Per page", [25, 50, 100], index=1, key="admin_users_page_size")
+
+    # Start cursor of every page visited so far, reset when the query changes
+    query_key = (search, plan_filter, sort, page_size)
+    if st.session_state.get('admin_users_query') != query_key:
+        st.session_state.admin_users_query = query_key
+        st.session_state.admin_users_cursors = [None]
+
+    cursors = st.session_state.admin_users_cursors
+    page = db.list_users_page(
+        after=cursors[-1],
+        limit=page_size,
+        sort=sort,
+        search=search or None,
+        plan=None if plan_filter == "All" else plan_filter
+    )
+    users = page.items
+
+    col1, col2, col3 = st.columns([1, 1, 4])
+    with col1:
+        if st.button("Previous", disabled=len(cursors) == 1, key="admin_users_previous"):
+            cursors.pop()
+            st.rerun()
+    with col2:
+        if st.button("Next", disabled=page.next_cursor is None, key="admin_users_next"):
+            cursors.append(page.next_cursor)
+            st.rerun()
+    with col3:
+        st.caption(f"Page {len(cursors)}")
 
     if not users:
         st.info("No users found")
@@ -709,6 +750,15 @@ def render_admin_users_page():
         user_df = pd.DataFrame(user_data)
         st.dataframe(user_df, use_container_width=True)
 
+        with st.expander("Database Connection Pool"):
+            st.json(db.get_pool_stats())
+
+        with st.expander("Read Cache"):
+            st.json(db.get_read_cache_stats())
+
+        with st.expander("Startup Initialization"):
+            st.json(db.get_startup_report())
+
         # User actions
         st.subheader("User Actions")
 
@@ -889,4 +939,6 @@ def main():
             render_dashboard()
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    # One database session for every read of this rerun
+    with db.unit_of_work():
+        main()
\ No newline at end of file
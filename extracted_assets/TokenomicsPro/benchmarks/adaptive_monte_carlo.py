@@ -0,0 +1,71 @@
+"""
+Benchmark for adaptive Monte Carlo runs with early stopping
+
+Runs the adaptive runner to a target precision for several seeds and
+sampling methods, and reports the paths and time it took against a fixed
+run of the Econometrics page's maximum of 100,000 paths. Coverage is the
+share of tracked estimates within the target of a large reference run,
+which should be close to the confidence level.
+
+Run from the TokenomicsPro directory:
+    python benchmarks/adaptive_monte_carlo.py
+"""
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from monte_carlo import run_adaptive_monte_carlo, run_monte_carlo
+
+INITIAL_PRICE = 0.05
+DRIFT = 0.002
+VOLATILITY = 0.05
+PERIODS = 365
+THRESHOLD = 0.03
+FIXED_SIMULATIONS = 100_000
+REFERENCE_SIMULATIONS = 2**19
+RELATIVE_PRECISION = 0.01
+CONFIDENCE = 0.95
+SEEDS = 10
+
+
+def reference():
+    """Final P5, Median, P95 and share below THRESHOLD of a large quasi-random run"""
+    result = run_monte_carlo(INITIAL_PRICE, DRIFT, VOLATILITY, PERIODS, REFERENCE_SIMULATIONS, seed=10_000,
+                             keep_paths=0, sampling='sobol', threshold=THRESHOLD)
+    values = {name: result.statistics[name][-1] for name in ('P5', 'Median', 'P95')}
+    values['Below'] = result.aggregator.probability_below()
+    return values
+
+
+def main():
+    start = time.perf_counter()
+    run_monte_carlo(INITIAL_PRICE, DRIFT, VOLATILITY, PERIODS, FIXED_SIMULATIONS, seed=0, keep_paths=0,
+                    threshold=THRESHOLD)
+    print(f"fixed run of {FIXED_SIMULATIONS:,} paths: {time.perf_counter() - start:.2f} s")
+
+    truth = reference()
+    print(f"target ±{RELATIVE_PRECISION:.0%} at {CONFIDENCE:.0%} confidence on the final P5, Median, P95 "
+          f"and ±0.5 pp on P(price < {THRESHOLD}), {SEEDS} seeds")
+    print(f"{'sampling':<16} {'paths (mean)':>13} {'time (mean)':>12} {'converged':>10} {'coverage':>9}")
+    for sampling in ('pseudo_random', 'latin_hypercube', 'sobol'):
+        paths, seconds, converged, covered, tracked = [], [], 0, 0, 0
+        for seed in range(SEEDS):
+            progress = run_adaptive_monte_carlo(INITIAL_PRICE, DRIFT, VOLATILITY, PERIODS, seed=seed,
+                                                sampling=sampling, threshold=THRESHOLD,
+                                                relative_precision=RELATIVE_PRECISION, confidence=CONFIDENCE,
+                                                time_budget=60, max_simulations=1_000_000, keep_paths=0)
+            paths.append(progress.simulations)
+            seconds.append(progress.elapsed)
+            converged += progress.stop_reason == 'precision'
+            for name, estimate in progress.estimates.items():
+                covered += abs(estimate - truth[name]) <= progress.tolerances[name]
+                tracked += 1
+        print(f"{sampling:<16} {np.mean(paths):13,.0f} {np.mean(seconds):10.2f} s "
+              f"{converged:>6}/{SEEDS} {covered / tracked:9.0%}")
+
+
+if __name__ == "__main__":
+    main()
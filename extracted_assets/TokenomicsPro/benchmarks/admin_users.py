@@ -0,0 +1,106 @@
+"""
+Benchmark for the admin user listing: full table load vs keyset pages
+
+Fills a scratch SQLite database with synthetic users, then times what the
+admin page used to do (load every user and build a DataFrame) against
+fetching single pages with list_users_page.
+
+Run from the TokenomicsPro directory:
+    python benchmarks/admin_users.py
+"""
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+import pandas as pd
+
+DATABASE_PATH = os.path.join(tempfile.mkdtemp(), "admin_users.db")
+os.environ['DATABASE_URL'] = f"sqlite:///{DATABASE_PATH}"
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import database as db
+
+N_USERS = 100_000
+PAGE_SIZE = 50
+REPEATS = 5
+PLANS = ('free', 'premium', 'enterprise')
+
+
+def populate():
+    """Insert N_USERS synthetic users in batches"""
+    db.init_db()
+    session = db.Session()
+    start = datetime(2023, 1, 1)
+    batch = 10_000
+    for offset in range(0, N_USERS, batch):
+        session.bulk_insert_mappings(db.User, [
+            {
+                'username': f"user{i:06d}",
+                'email': f"user{i:06d}@example.com",
+                'password_hash': "x",
+                'display_name': f"User {i}",
+                'plan': PLANS[i % len(PLANS)],
+                'created_at': start + timedelta(minutes=i),
+                'updated_at': start + timedelta(minutes=i)
+            }
+            for i in range(offset, min(offset + batch, N_USERS))
+        ])
+    session.commit()
+    session.close()
+
+
+def full_table():
+    """What the admin page used to run on every rerun"""
+    users = db.get_all_users()
+    return pd.DataFrame([{
+        'ID': user.id,
+        'Username': user.username,
+        'Email': user.email,
+        'Display Name': user.display_name,
+        'Plan': user.plan,
+        'Admin': "Yes" if user.is_admin else "No",
+        'Created': user.created_at.strftime('%Y-%m-%d')
+    } for user in users])
+
+
+def deep_cursor(sort, pages, **filters):
+    """Walk pages forward and return the cursor of the last one"""
+    cursor = None
+    for _ in range(pages):
+        cursor = db.list_users_page(after=cursor, limit=PAGE_SIZE, sort=sort, **filters).next_cursor
+    return cursor
+
+
+def timed(function):
+    """Best wall time of REPEATS calls, in milliseconds"""
+    best = float('inf')
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main():
+    start = time.perf_counter()
+    populate()
+    print(f"Inserted {N_USERS:,} users in {time.perf_counter() - start:.1f} s")
+
+    cursor_id = deep_cursor('id', 20)
+    cursor_newest = deep_cursor('newest', 20)
+    cases = [
+        ("full table + DataFrame", full_table),
+        ("first page, by id", lambda: db.list_users_page(limit=PAGE_SIZE)),
+        ("page 21, by id", lambda: db.list_users_page(after=cursor_id, limit=PAGE_SIZE)),
+        ("page 21, newest first", lambda: db.list_users_page(after=cursor_newest, limit=PAGE_SIZE, sort='newest')),
+        ("first page, premium plan", lambda: db.list_users_page(limit=PAGE_SIZE, plan='premium')),
+        ("first page, search 'user0999'", lambda: db.list_users_page(limit=PAGE_SIZE, search='user0999')),
+    ]
+    for name, function in cases:
+        print(f"{name:<32} {timed(function):9.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
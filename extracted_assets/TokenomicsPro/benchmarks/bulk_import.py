@@ -0,0 +1,93 @@
+"""
+Benchmark for bulk import and export of tokenomics models
+
+Writes synthetic saved_models JSON files to a scratch directory, then times
+importing them one create_tokenomics_model call at a time against
+bulk_import, and streaming them back out with export_records.
+
+Run from the TokenomicsPro directory:
+    python benchmarks/bulk_import.py
+"""
+import json
+import os
+import sys
+import tempfile
+import time
+
+SCRATCH = tempfile.mkdtemp()
+DATABASE_PATH = os.path.join(SCRATCH, "bulk_import.db")
+os.environ['DATABASE_URL'] = f"sqlite:///{DATABASE_PATH}"
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import database as db
+
+N_MODELS = 5_000
+MODEL_TYPES = ('base', 'utility', 'governance')
+
+
+def write_saved_models(directory):
+    """Write N_MODELS files in the format the simulation page saves"""
+    os.makedirs(directory)
+    for i in range(N_MODELS):
+        model = {
+            'name': f"Model {i}",
+            'total_supply': 1_000_000_000,
+            'distribution': {'Team': 20, 'Investors': 25, 'Public': 40, 'Treasury': 15},
+            'vesting_schedules': {
+                'Team': [[12 + m, 100 / 24] for m in range(24)],
+                'Investors': [[6 + m, 100 / 18] for m in range(18)]
+            },
+            'model_type': MODEL_TYPES[i % len(MODEL_TYPES)]
+        }
+        if model['model_type'] == 'utility':
+            model.update({'initial_users': 10_000, 'user_growth_rate': 0.05})
+        elif model['model_type'] == 'governance':
+            model.update({'initial_staking_rate': 0.3, 'staking_apy': 0.08})
+        with open(os.path.join(directory, f"model_{i:05d}.json"), "w") as f:
+            json.dump(model, f)
+
+
+def one_at_a_time(directory, user_id):
+    """What a migration script had to do before: one call, commit and re-query per model"""
+    for name in sorted(os.listdir(directory)):
+        with open(os.path.join(directory, name)) as f:
+            data = json.load(f)
+        extra = {key: data[key] for key in ('initial_users', 'user_growth_rate',
+                                            'initial_staking_rate', 'staking_apy') if key in data}
+        db.create_tokenomics_model(data['name'], None, user_id, data['model_type'], data['total_supply'],
+                                   distribution=data['distribution'],
+                                   vesting_schedules=data['vesting_schedules'], **extra)
+
+
+def timed(label, function):
+    start = time.perf_counter()
+    result = function()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<38} {elapsed:7.2f} s  {N_MODELS / elapsed:9,.0f} models/s")
+    return result
+
+
+def main():
+    db.init_db()
+    directory = os.path.join(SCRATCH, "saved_models")
+    write_saved_models(directory)
+    admin = db.get_user_by_username('admin')
+    demo = db.get_user_by_username('demo')
+
+    print(f"{N_MODELS:,} saved model files")
+    timed("create_tokenomics_model per file", lambda: one_at_a_time(directory, admin.id))
+    for batch_size in (100, 500, 2_000):
+        job = timed(f"bulk_import, batches of {batch_size:,}",
+                    lambda: db.bulk_import('tokenomics_models', directory, demo.id,
+                                           batch_size=batch_size, resume=False))
+        assert job['status'] == 'completed' and job['imported'] == N_MODELS
+
+    for extension in ('jsonl', 'csv'):
+        path = os.path.join(SCRATCH, f"export.{extension}")
+        count = timed(f"export_records to .{extension}",
+                      lambda: db.export_records('tokenomics_models', path, user_id=admin.id))
+        assert count == N_MODELS
+
+
+if __name__ == "__main__":
+    main()
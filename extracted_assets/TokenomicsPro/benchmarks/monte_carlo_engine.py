@@ -0,0 +1,87 @@
+"""
+Benchmark for the vectorized Monte Carlo engine
+
+Times the Econometrics page's former per-path Python loop and wide
+DataFrame statistics against run_monte_carlo, checks the sketched quantiles
+against exact ones, and reports the time and peak memory of runs up to a
+million paths.
+
+Run from the TokenomicsPro directory:
+    python benchmarks/monte_carlo_engine.py
+"""
+import os
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from monte_carlo import FAN_QUANTILES, run_monte_carlo, simulate_price_paths
+from utils import spawn_rngs
+
+INITIAL_PRICE = 0.05
+DRIFT = 0.002
+VOLATILITY = 0.05
+PERIODS = 365
+SEED = 42
+
+
+def python_loop(simulations):
+    """What the page used to run: one Python loop per path, statistics across a wide DataFrame"""
+    path_rngs = spawn_rngs(SEED, simulations)
+    price_paths = []
+    for i in range(simulations):
+        price_path = [INITIAL_PRICE]
+        for r in path_rngs[i].normal(DRIFT, VOLATILITY, PERIODS):
+            price_path.append(price_path[-1] * (1 + r))
+        price_paths.append(price_path)
+    results = pd.DataFrame({f'Sim {i+1}': path for i, path in enumerate(price_paths)})
+    return results.mean(axis=1), results.max(axis=1), results.min(axis=1), results.median(axis=1)
+
+
+def engine(simulations, convention='arithmetic'):
+    return run_monte_carlo(INITIAL_PRICE, DRIFT, VOLATILITY, PERIODS, simulations, seed=SEED,
+                           convention=convention)
+
+
+def timed(function, *args):
+    start = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - start
+
+
+def main():
+    print(f"{PERIODS} periods per path")
+    for simulations in (100, 1_000, 10_000):
+        _, loop_seconds = timed(python_loop, simulations)
+        _, engine_seconds = timed(engine, simulations)
+        print(f"{simulations:>7,} paths: Python loop {loop_seconds * 1000:8.0f} ms, "
+              f"engine {engine_seconds * 1000:6.0f} ms ({loop_seconds / engine_seconds:.0f}x)")
+
+    simulations = 20_000
+    paths = simulate_price_paths(INITIAL_PRICE, DRIFT, VOLATILITY, PERIODS, simulations, seed=SEED)
+    result = engine(simulations)
+    print(f"Sketched quantiles vs exact, {simulations:,} paths (worst step):")
+    for name, q in (('Median', 0.5),) + FAN_QUANTILES:
+        estimate = result.statistics[name][1:]
+        rank = (paths[:, 1:] < estimate).mean(axis=0)
+        print(f"  {name:<6} relative error {np.max(np.abs(estimate / np.quantile(paths[:, 1:], q, axis=0) - 1)):.2%}, "
+              f"rank error {np.max(np.abs(rank - q)):.2%}")
+    del paths
+
+    for simulations, convention in ((100_000, 'arithmetic'), (100_000, 'log'), (1_000_000, 'arithmetic')):
+        tracemalloc.start()
+        result, seconds = timed(engine, simulations, convention)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        expected = (INITIAL_PRICE * (1 + DRIFT) ** PERIODS if convention == 'arithmetic'
+                    else INITIAL_PRICE * np.exp(DRIFT * PERIODS))
+        print(f"{simulations:>9,} paths, {convention:<10}: {seconds:5.1f} s in {result.chunks} chunks, "
+              f"peak {peak / 2**20:.0f} MiB, summary {result.aggregator.nbytes / 2**20:.1f} MiB "
+              f"(paths {simulations * (PERIODS + 1) * 8 / 2**20:,.0f} MiB), "
+              f"final mean {result.statistics['Mean'][-1]:.4f}, expected {expected:.4f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+Benchmark for stored simulation runs: .npz blobs vs JSON
+
+Stores a 10,000-path Monte Carlo run in a scratch SQLite database and
+compares its size and reload time with the JSON of the results DataFrame.
+
+Run from the TokenomicsPro directory:
+    python benchmarks/simulation_runs.py
+"""
+import json
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+DATABASE_PATH = os.path.join(tempfile.mkdtemp(), "simulation_runs.db")
+os.environ['DATABASE_URL'] = f"sqlite:///{DATABASE_PATH}"
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import database as db
+
+N_PATHS = 10_000
+N_STEPS = 365
+PARAMETERS = {'simulations': N_PATHS, 'periods': N_STEPS, 'volatility': 0.05, 'drift': 0.002}
+SEED = 42
+
+
+def simulate():
+    """Geometric random walk price paths plus per-step statistics"""
+    rng = np.random.default_rng(SEED)
+    returns = rng.normal(PARAMETERS['drift'], PARAMETERS['volatility'], (N_PATHS, N_STEPS))
+    paths = np.concatenate([np.ones((N_PATHS, 1)), np.cumprod(1 + returns, axis=1)], axis=1)
+    return {
+        'Date': np.arange('2025-01-01', N_STEPS + 1, dtype='datetime64[D]').astype('datetime64[s]'),
+        'paths': paths,
+        'Mean': paths.mean(axis=0),
+        'Max': paths.max(axis=0),
+        'Min': paths.min(axis=0),
+        'Median': np.median(paths, axis=0)
+    }
+
+
+def timed(function, repeats=5):
+    """Best wall time of several calls, in milliseconds"""
+    best = float('inf')
+    for _ in range(repeats):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main():
+    db.init_db()
+    arrays = simulate()
+
+    frame = pd.DataFrame({f'Sim {i + 1}': path for i, path in enumerate(arrays['paths'])})
+    for name in ('Mean', 'Max', 'Min', 'Median'):
+        frame[name] = arrays[name]
+    json_text = json.dumps(frame.to_dict())
+
+    print(f"{N_PATHS:,} paths x {N_STEPS + 1} steps")
+    print(f"  JSON of the results DataFrame: {len(json_text) / 2**20:6.1f} MiB, "
+          f"reload {timed(lambda: pd.DataFrame(json.loads(json_text)), repeats=1):7.1f} ms")
+
+    for compress in (False, True):
+        start = time.perf_counter()
+        run = db.save_simulation_run('monte_carlo', PARAMETERS, SEED, arrays, compress=compress)
+        save_ms = (time.perf_counter() - start) * 1000
+
+        def load_summary():
+            stored = db.get_simulation_run('monte_carlo', PARAMETERS, SEED)
+            return stored['Mean']
+
+        def load_paths():
+            stored = db.get_simulation_run('monte_carlo', PARAMETERS, SEED)
+            return stored['paths']
+
+        assert np.array_equal(load_paths(), arrays['paths'])
+        print(f"  npz{' (compressed)' if compress else ''}: {run['size_bytes'] / 2**20:.1f} MiB "
+              f"({run['size_bytes'] / len(json_text):.0%} of JSON), save {save_ms:.0f} ms, "
+              f"reload statistics {timed(load_summary):.1f} ms, all paths {timed(load_paths):.1f} ms")
+
+    print(f"  list run metadata: {timed(db.list_simulation_runs):.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
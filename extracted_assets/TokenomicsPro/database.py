@@ -1,19 +1,173 @@
 import os
+import io
+import csv
+import itertools
+import logging
 import bcrypt
-from sqlalchemy import create_engine, Column, Integer, String, Text, Boolean, DateTime, ForeignKey, Float, JSON, Table
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from functools import wraps
+from dataclasses import dataclass, fields
+from decimal import Context, Decimal, InvalidOperation
+from typing import Optional
+import numpy as np
+from sqlalchemy import create_engine, event, func, select, insert, type_coerce, and_, or_, inspect, text, Index, Column, Integer, Numeric, String, Text, Boolean, DateTime, ForeignKey, Float, JSON, LargeBinary, Table, TypeDecorator, UniqueConstraint
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker, relationship
+from sqlite3 import sqlite_version
+from sqlalchemy.engine import make_url
+from sqlalchemy.pool import StaticPool
+from sqlalchemy.schema import CreateIndex
+from sqlalchemy.sql.expression import bindparam
+from sqlalchemy.orm import sessionmaker, scoped_session, relationship, selectinload, joinedload, deferred, undefer
 from datetime import datetime
 import json
 
-# Get database URL from environment variables
-DATABASE_URL = os.environ.get('DATABASE_URL')
+logger = logging.getLogger(__name__)
+
+# Get database URL from environment variables; without one, use an embedded SQLite file
+SQLITE_PATH = os.environ.get('DB_SQLITE_PATH', 'tokenomics.db')
+DATABASE_URL = os.environ.get('DATABASE_URL') or f"sqlite:///{SQLITE_PATH}"
+IS_SQLITE = make_url(DATABASE_URL).get_backend_name() == 'sqlite'
+
+# Connection pool settings, overridable from the environment
+POOL_SIZE = int(os.environ.get('DB_POOL_SIZE', 5))
+MAX_OVERFLOW = int(os.environ.get('DB_MAX_OVERFLOW', 10))
+POOL_TIMEOUT = int(os.environ.get('DB_POOL_TIMEOUT', 30))
+POOL_RECYCLE = int(os.environ.get('DB_POOL_RECYCLE', 1800))
+
+# SQLite tuning: WAL lets readers run alongside the single writer, and with WAL
+# synchronous=NORMAL only syncs at checkpoints, which cannot corrupt the file.
+# Negative cache_size is in KiB.
+SQLITE_PRAGMAS = {
+    'journal_mode': 'WAL',
+    'synchronous': os.environ.get('DB_SQLITE_SYNCHRONOUS', 'NORMAL'),
+    'cache_size': -int(os.environ.get('DB_SQLITE_CACHE_KB', 64 * 1024)),
+    'mmap_size': int(os.environ.get('DB_SQLITE_MMAP_BYTES', 256 * 2**20)),
+    'temp_store': 'MEMORY',
+    'foreign_keys': 'ON'
+}
+
+def _create_engine():
+    if not IS_SQLITE:
+        return create_engine(
+            DATABASE_URL,
+            pool_size=POOL_SIZE,
+            max_overflow=MAX_OVERFLOW,
+            pool_timeout=POOL_TIMEOUT,
+            pool_recycle=POOL_RECYCLE,
+            pool_pre_ping=True
+        )
+    
+    # Streamlit reruns scripts on other threads, so connections are shared across threads;
+    # timeout is how long a writer waits for the database lock
+    connect_args = {'check_same_thread': False, 'timeout': POOL_TIMEOUT}
+    if make_url(DATABASE_URL).database in (None, '', ':memory:'):
+        # Every connection to :memory: is a new empty database, so keep just one
+        return create_engine(DATABASE_URL, connect_args=connect_args, poolclass=StaticPool)
+    return create_engine(
+        DATABASE_URL,
+        connect_args=connect_args,
+        pool_size=POOL_SIZE,
+        max_overflow=MAX_OVERFLOW,
+        pool_timeout=POOL_TIMEOUT
+    )
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    cursor = dbapi_connection.cursor()
+    for name, value in SQLITE_PRAGMAS.items():
+        cursor.execute(f"PRAGMA {name} = {value}")
+    cursor.close()
 
 # Create SQLAlchemy engine
-engine = create_engine(DATABASE_URL)
+engine = _create_engine()
+if IS_SQLITE:
+    event.listen(engine, 'connect', _set_sqlite_pragmas)
 Base = declarative_base()
 Session = sessionmaker(bind=engine)
 
+# Session shared by every helper called inside a unit_of_work block, one per thread
+ScopedSession = scoped_session(Session)
+_unit_of_work = threading.local()
+
+# Read cache settings: seconds a per-user listing stays fresh, maximum cached listings,
+# and the approximate memory they may take, estimated at READ_CACHE_RECORD_BYTES per record
+READ_CACHE_TTL = float(os.environ.get('DB_READ_CACHE_TTL', 60))
+READ_CACHE_MAX_ENTRIES = int(os.environ.get('DB_READ_CACHE_MAX_ENTRIES', 1024))
+READ_CACHE_MAX_BYTES = int(os.environ.get('DB_READ_CACHE_MAX_BYTES', 64 * 1024 * 1024))
+READ_CACHE_RECORD_BYTES = int(os.environ.get('DB_READ_CACHE_RECORD_BYTES', 2048))
+
+# Pool event counters, see get_pool_stats
+_pool_counters = {'connects': 0, 'checkouts': 0, 'checkins': 0}
+_pool_counters_lock = threading.Lock()
+
+def _count_pool_event(name):
+    def listener(*args):
+        with _pool_counters_lock:
+            _pool_counters[name] += 1
+    return listener
+
+event.listen(engine, 'connect', _count_pool_event('connects'))
+event.listen(engine, 'checkout', _count_pool_event('checkouts'))
+event.listen(engine, 'checkin', _count_pool_event('checkins'))
+
+@contextmanager
+def unit_of_work():
+    """
+    Share one session between every database helper called inside the block
+
+    Wrap a whole Streamlit rerun in it so all of its reads use one session and
+    one pooled connection. Objects returned by helpers stay attached until the
+    block ends, so their relationships can be loaded. Nested blocks reuse the
+    outer session; the outermost block commits, or rolls back on error.
+    """
+    depth = getattr(_unit_of_work, 'depth', 0)
+    session = ScopedSession()
+    _unit_of_work.depth = depth + 1
+    try:
+        yield session
+        if depth == 0:
+            session.commit()
+    except:
+        if depth == 0:
+            session.rollback()
+        raise
+    finally:
+        _unit_of_work.depth = depth
+        if depth == 0:
+            ScopedSession.remove()
+
+def _get_session():
+    """
+    Get the session of the current unit of work, or a new one outside of it
+    """
+    if getattr(_unit_of_work, 'depth', 0):
+        return ScopedSession()
+    return Session()
+
+def _release_session(session):
+    """
+    Close a session from _get_session, unless a unit of work still owns it
+    """
+    if not getattr(_unit_of_work, 'depth', 0):
+        session.close()
+
+def get_pool_stats():
+    """
+    Get connection pool utilization and event counters
+    """
+    pool = engine.pool
+    stats = {'backend': engine.dialect.name, 'pool': type(pool).__name__,
+             'pool_size': POOL_SIZE, 'max_overflow': MAX_OVERFLOW}
+    for name in ('size', 'checkedin', 'checkedout', 'overflow'):
+        if hasattr(pool, name):
+            stats[name] = getattr(pool, name)()
+    with _pool_counters_lock:
+        stats.update(_pool_counters)
+    return stats
+
 class User(Base):
     __tablename__ = 'users'
     
@@ -56,6 +210,10 @@ class User(Base):
             'updated_at': self.updated_at.isoformat()
         }
 
+# Serve the admin user listing, sorted by signup date or filtered by plan
+Index('ix_users_created_at', User.created_at, User.id)
+Index('ix_users_plan', User.plan, User.id)
+
 # Web3 StartupBuilder Models
 class Project(Base):
     __tablename__ = 'projects'
@@ -85,6 +243,77 @@ class Project(Base):
             'created_at': self.created_at.isoformat() if self.created_at else None
         }
 
+# Serves per-user project counts and the most recently edited projects
+Index('ix_projects_user_recent', Project.user_id,
+      func.coalesce(Project.last_edited, Project.created_at).desc())
+
+# Token amounts: 78 digits hold any uint256, with 18 decimals as in ERC-20 tokens
+TOKEN_AMOUNT_PRECISION = 78
+TOKEN_AMOUNT_SCALE = 18
+TOKEN_AMOUNT_COLUMNS = ('total_supply', 'initial_price', 'initial_market_cap', 'circulating_supply')
+
+def parse_token_amount(value):
+    """
+    Convert a token amount to an exact Decimal, accepting text like '1,000,000' or '$0.05'
+
+    Amounts are supplies, prices and market caps, so negative ones are rejected.
+    """
+    if value is None:
+        return None
+    if isinstance(value, float):
+        value = repr(value)
+    if isinstance(value, (Decimal, int)):
+        amount = Decimal(value)
+    else:
+        cleaned = str(value).strip().replace(',', '').replace('_', '').replace('$', '').replace(' ', '')
+        if not cleaned:
+            return None
+        try:
+            amount = Decimal(cleaned)
+        except InvalidOperation:
+            raise ValueError(f"Invalid token amount: {value!r}")
+    if not amount.is_finite() or amount < 0:
+        raise ValueError(f"Invalid token amount: {value!r}")
+    return amount
+
+class TokenAmount(TypeDecorator):
+    """
+    Exact token amount: NUMERIC(78, 18), or fixed-width text on SQLite
+
+    SQLite stores NUMERIC values as 64-bit integers or doubles, so amounts
+    there are kept as text, zero-padded to a fixed width so that comparisons,
+    ORDER BY, MIN/MAX and indexes follow numeric order. SUM and AVG still run
+    in floating point on SQLite.
+    """
+    impl = Numeric(TOKEN_AMOUNT_PRECISION, TOKEN_AMOUNT_SCALE)
+    cache_ok = True
+
+    _context = Context(prec=TOKEN_AMOUNT_PRECISION + 2)
+    _quantum = Decimal(1).scaleb(-TOKEN_AMOUNT_SCALE)
+    _width = TOKEN_AMOUNT_PRECISION + 1
+
+    def load_dialect_impl(self, dialect):
+        if dialect.name == 'sqlite':
+            return dialect.type_descriptor(Text())
+        return dialect.type_descriptor(self.impl)
+
+    def process_bind_param(self, value, dialect):
+        value = parse_token_amount(value)
+        if value is None or dialect.name != 'sqlite':
+            return value
+        digits = format(value.quantize(self._quantum, context=self._context), f'0{self._width}.{TOKEN_AMOUNT_SCALE}f')
+        if len(digits) > self._width:
+            raise ValueError(f"Token amount out of range: {value}")
+        return digits
+
+    def process_result_value(self, value, dialect):
+        if value is None or dialect.name != 'sqlite':
+            return value
+        # Stored text, or a number from SUM or AVG
+        return parse_token_amount(value).quantize(self._quantum, context=self._context)
+
+TOKEN_AMOUNT = TokenAmount()
+
 class Token(Base):
     __tablename__ = 'tokens'
     
@@ -93,10 +322,10 @@ class Token(Base):
     name = Column(String(100), nullable=False)
     symbol = Column(String(10), nullable=False)
     type = Column(String(20), nullable=False)  # ERC-20, ERC-721, etc.
-    total_supply = Column(String(100), nullable=False)
-    initial_price = Column(String(100))
-    initial_market_cap = Column(String(100))
-    circulating_supply = Column(String(100))
+    total_supply = Column(TOKEN_AMOUNT, nullable=False)
+    initial_price = Column(TOKEN_AMOUNT)
+    initial_market_cap = Column(TOKEN_AMOUNT)
+    circulating_supply = Column(TOKEN_AMOUNT)
     distribution = Column(JSON, default=lambda: {})
     created_at = Column(DateTime, default=datetime.utcnow)
     
@@ -110,14 +339,27 @@ class Token(Base):
             'name': self.name,
             'symbol': self.symbol,
             'type': self.type,
-            'total_supply': self.total_supply,
-            'initial_price': self.initial_price,
-            'initial_market_cap': self.initial_market_cap,
-            'circulating_supply': self.circulating_supply,
+            'total_supply': _amount_text(self.total_supply),
+            'initial_price': _amount_text(self.initial_price),
+            'initial_market_cap': _amount_text(self.initial_market_cap),
+            'circulating_supply': _amount_text(self.circulating_supply),
             'distribution': self.distribution,
             'created_at': self.created_at.isoformat() if self.created_at else None
         }
 
+# Serves the all-projects listing, most recently edited first
+Index('ix_projects_recent', func.coalesce(Project.last_edited, Project.created_at).desc(), Project.id.desc())
+
+def _amount_text(value):
+    # Decimals are not JSON serializable; keep the plain-text form the columns used to hold
+    return None if value is None else format(value.normalize(), 'f')
+
+# Serves loading a project's token
+Index('ix_tokens_project_id', Token.project_id)
+
+# Serves market cap range filters and rankings
+Index('ix_tokens_initial_market_cap', Token.initial_market_cap)
+
 class Resource(Base):
     __tablename__ = 'resources'
     
@@ -200,6 +442,15 @@ class TokenomicsModel(Base):
             
         return result
 
+# Serves per-user model counts
+Index('ix_tokenomics_models_user_id', TokenomicsModel.user_id)
+
+# Serve model listings, most recently updated first, per user and overall
+Index('ix_tokenomics_models_user_recent', TokenomicsModel.user_id,
+      func.coalesce(TokenomicsModel.updated_at, TokenomicsModel.created_at).desc(), TokenomicsModel.id.desc())
+Index('ix_tokenomics_models_recent',
+      func.coalesce(TokenomicsModel.updated_at, TokenomicsModel.created_at).desc(), TokenomicsModel.id.desc())
+
 class CryptoeconomicSystem(Base):
     __tablename__ = 'cryptoeconomic_systems'
     
@@ -227,6 +478,9 @@ class CryptoeconomicSystem(Base):
             'updated_at': self.updated_at.isoformat() if self.updated_at else None
         }
 
+# Serves per-user system counts
+Index('ix_cryptoeconomic_systems_user_id', CryptoeconomicSystem.user_id)
+
 class TokenomicsComparison(Base):
     __tablename__ = 'tokenomics_comparisons'
     
@@ -251,12 +505,100 @@ class TokenomicsComparison(Base):
             'updated_at': self.updated_at.isoformat() if self.updated_at else None
         }
 
-# Create all tables
-def init_db():
-    Base.metadata.create_all(engine)
+class SimulationRun(Base):
+    __tablename__ = 'simulation_runs'
+    __table_args__ = (
+        UniqueConstraint('kind', 'model_id', 'param_hash', 'seed', name='uq_simulation_runs_key'),
+    )
+    
+    id = Column(Integer, primary_key=True)
+    kind = Column(String(50), nullable=False)  # monte_carlo, ...
+    model_id = Column(Integer, ForeignKey('tokenomics_models.id', ondelete='CASCADE'), nullable=True)
+    user_id = Column(Integer, ForeignKey('users.id', ondelete='SET NULL'), nullable=True)
+    param_hash = Column(String(64), nullable=False)
+    seed = Column(Integer, nullable=False)
+    parameters = Column(JSON, default=lambda: {})
+    
+    # Queryable metadata of the stored arrays
+    n_paths = Column(Integer)
+    n_steps = Column(Integer)
+    columns = Column(JSON, default=lambda: [])
+    size_bytes = Column(Integer)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    
+    # .npz archive of the result arrays, only loaded when accessed
+    results = deferred(Column(LargeBinary, nullable=False))
+    
+    def to_dict(self):
+        return {
+            'id': self.id,
+            'kind': self.kind,
+            'model_id': self.model_id,
+            'user_id': self.user_id,
+            'param_hash': self.param_hash,
+            'seed': self.seed,
+            'parameters': self.parameters,
+            'n_paths': self.n_paths,
+            'n_steps': self.n_steps,
+            'columns': self.columns,
+            'size_bytes': self.size_bytes,
+            'created_at': self.created_at.isoformat() if self.created_at else None
+        }
+
+# Serves listing a user's runs
+Index('ix_simulation_runs_user_id', SimulationRun.user_id)
+
+class ImportJob(Base):
+    __tablename__ = 'import_jobs'
     
+    id = Column(Integer, primary_key=True)
+    user_id = Column(Integer, ForeignKey('users.id'), nullable=False)
+    kind = Column(String(50), nullable=False)  # tokenomics_models, projects
+    source = Column(String(500), nullable=False)
+    status = Column(String(20), nullable=False, default='running')  # running, failed, completed
+    
+    # Source items consumed so far, committed together with the rows they produced
+    position = Column(Integer, nullable=False, default=0)
+    imported = Column(Integer, nullable=False, default=0)
+    rejected = Column(Integer, nullable=False, default=0)
+    errors = Column(JSON, default=lambda: [])
+    created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    
+    def to_dict(self):
+        return {
+            'id': self.id,
+            'user_id': self.user_id,
+            'kind': self.kind,
+            'source': self.source,
+            'status': self.status,
+            'position': self.position,
+            'imported': self.imported,
+            'rejected': self.rejected,
+            'errors': self.errors,
+            'created_at': self.created_at.isoformat() if self.created_at else None,
+            'updated_at': self.updated_at.isoformat() if self.updated_at else None
+        }
+
+def _check_sqlite_json1():
+    # JSON columns are plain text in SQLite; querying into them needs the JSON1 functions
+    with engine.connect() as connection:
+        try:
+            connection.execute(text("SELECT json_extract('{\"a\": 1}', '$.a')"))
+        except Exception:
+            raise RuntimeError(f"SQLite {sqlite_version} was built without the JSON1 extension, "
+                               "which the JSON columns need")
+
+def _create_missing_indexes():
+    # create_all skips existing tables, so add indexes defined after they were created
+    with engine.begin() as connection:
+        for table in Base.metadata.sorted_tables:
+            for index in table.indexes:
+                connection.execute(CreateIndex(index, if_not_exists=True))
+
+def _seed_initial_data():
     # Create an admin user if one doesn't exist
-    session = Session()
+    session = _get_session()
     admin = session.query(User).filter_by(username='admin').first()
     if not admin:
         admin = User(
@@ -317,29 +659,101 @@ def init_db():
             session.add(resource)
         
         session.commit()
-    session.close()
+    _release_session(session)
+
+@contextmanager
+def _timed_stage(timings, name):
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings[name] = round((time.perf_counter() - start) * 1000, 2)
+
+# Create all tables
+def init_db():
+    """
+    Create and migrate the schema and seed the initial users and resources
+
+    Returns a startup report with the milliseconds spent in each stage, the
+    migrated token amount columns and the ids of tokens whose amounts could
+    not be parsed by the migration (also logged as a warning).
+    """
+    started_at = datetime.utcnow()
+    timings = {}
+    with _timed_stage(timings, 'total'):
+        if IS_SQLITE:
+            with _timed_stage(timings, 'check_json1'):
+                _check_sqlite_json1()
+        with _timed_stage(timings, 'create_tables'):
+            Base.metadata.create_all(engine)
+        
+        # Tables created before the token amounts were numeric still hold them as text
+        with _timed_stage(timings, 'migrate_token_amounts'):
+            migrated = migrate_token_amount_columns()
+        with _timed_stage(timings, 'create_indexes'):
+            _create_missing_indexes()
+        with _timed_stage(timings, 'seed_data'):
+            _seed_initial_data()
+    
+    if migrated['unparsed']:
+        logger.warning("Token amounts of tokens %s could not be parsed during migration and were stored "
+                       "as NULL (0 for total_supply)", migrated['unparsed'])
+    
+    return {
+        'backend': engine.dialect.name,
+        'pid': os.getpid(),
+        'started_at': started_at.isoformat(),
+        'stages_ms': timings,
+        'migrated_token_columns': migrated['columns'],
+        'unparsed_token_ids': migrated['unparsed']
+    }
+
+# Process-wide result of the one-time initialization, see ensure_initialized
+_startup_report = None
+_startup_lock = threading.Lock()
+
+def ensure_initialized():
+    """
+    Run init_db once per process and return its startup report
+
+    Streamlit reruns the page scripts on every interaction; after the first
+    call this is a single attribute check. The lock makes concurrent first
+    sessions wait for one initialization instead of racing it.
+    """
+    global _startup_report
+    if _startup_report is None:
+        with _startup_lock:
+            if _startup_report is None:
+                _startup_report = init_db()
+    return _startup_report
+
+def get_startup_report():
+    """
+    Get the report of this process's initialization, or None before it ran
+    """
+    return _startup_report
 
 # Database utility functions
 def get_user_by_username(username):
-    session = Session()
+    session = _get_session()
     user = session.query(User).filter_by(username=username).first()
-    session.close()
+    _release_session(session)
     return user
 
 def get_user_by_id(user_id):
-    session = Session()
+    session = _get_session()
     user = session.query(User).filter_by(id=user_id).first()
-    session.close()
+    _release_session(session)
     return user
 
 def get_all_users():
-    session = Session()
+    session = _get_session()
     users = session.query(User).all()
-    session.close()
+    _release_session(session)
     return users
 
 def create_user(username, email, password, display_name=None, is_admin=False, plan='free'):
-    session = Session()
+    session = _get_session()
     
     if display_name is None:
         display_name = username
@@ -359,20 +773,21 @@ def create_user(username, email, password, display_name=None, is_admin=False, pl
     session.add(user)
     try:
         session.commit()
+        _invalidate_user_listings(None, 'list_users')
         new_user = session.query(User).filter_by(username=username).first()
-        session.close()
+        _release_session(session)
         return new_user
     except:
         session.rollback()
-        session.close()
+        _release_session(session)
         return None
 
 def update_user(user_id, **kwargs):
-    session = Session()
+    session = _get_session()
     user = session.query(User).filter_by(id=user_id).first()
     
     if not user:
-        session.close()
+        _release_session(session)
         return None
     
     for key, value in kwargs.items():
@@ -383,17 +798,18 @@ def update_user(user_id, **kwargs):
     
     try:
         session.commit()
+        _invalidate_user_listings(None, 'list_users')
         updated_user = session.query(User).filter_by(id=user_id).first()
-        session.close()
+        _release_session(session)
         return updated_user
     except:
         session.rollback()
-        session.close()
+        _release_session(session)
         return None
 
 # Project functions
 def create_project(name, user_id):
-    session = Session()
+    session = _get_session()
     project = Project(
         name=name,
         user_id=user_id,
@@ -404,38 +820,39 @@ def create_project(name, user_id):
     session.add(project)
     try:
         session.commit()
+        _invalidate_user_listings(user_id, 'list_projects')
         new_project = session.query(Project).filter_by(id=project.id).first()
-        session.close()
+        _release_session(session)
         return new_project
     except:
         session.rollback()
-        session.close()
+        _release_session(session)
         return None
 
 def get_project_by_id(project_id):
-    session = Session()
+    session = _get_session()
     project = session.query(Project).filter_by(id=project_id).first()
-    session.close()
+    _release_session(session)
     return project
 
 def get_projects_by_user(user_id):
-    session = Session()
+    session = _get_session()
     projects = session.query(Project).filter_by(user_id=user_id).all()
-    session.close()
+    _release_session(session)
     return projects
 
 def get_all_projects():
-    session = Session()
+    session = _get_session()
     projects = session.query(Project).all()
-    session.close()
+    _release_session(session)
     return projects
 
 def update_project(project_id, **kwargs):
-    session = Session()
+    session = _get_session()
     project = session.query(Project).filter_by(id=project_id).first()
     
     if not project:
-        session.close()
+        _release_session(session)
         return None
     
     for key, value in kwargs.items():
@@ -444,35 +861,43 @@ def update_project(project_id, **kwargs):
     
     try:
         session.commit()
+        _invalidate_user_listings(project.user_id, 'list_projects')
         updated_project = session.query(Project).filter_by(id=project_id).first()
-        session.close()
+        _release_session(session)
         return updated_project
     except:
         session.rollback()
-        session.close()
+        _release_session(session)
         return None
 
 def delete_project(project_id):
-    session = Session()
+    session = _get_session()
     project = session.query(Project).filter_by(id=project_id).first()
     
     if not project:
-        session.close()
+        _release_session(session)
         return False
     
+    user_id = project.user_id
     try:
         session.delete(project)
         session.commit()
-        session.close()
+        _invalidate_user_listings(user_id, 'list_projects')
+        _release_session(session)
         return True
     except:
         session.rollback()
-        session.close()
+        _release_session(session)
         return False
 
 # Token functions
 def create_token(project_id, name, symbol, token_type, total_supply, **kwargs):
-    session = Session()
+    total_supply = parse_token_amount(total_supply)
+    for key in TOKEN_AMOUNT_COLUMNS:
+        if key in kwargs:
+            kwargs[key] = parse_token_amount(kwargs[key])
+    
+    session = _get_session()
     token = Token(
         project_id=project_id,
         name=name,
@@ -484,57 +909,61 @@ def create_token(project_id, name, symbol, token_type, total_supply, **kwargs):
     session.add(token)
     try:
         session.commit()
+        _invalidate_user_listings(token.project.user_id, 'list_projects')
         new_token = session.query(Token).filter_by(id=token.id).first()
-        session.close()
+        _release_session(session)
         return new_token
     except:
         session.rollback()
-        session.close()
+        _release_session(session)
         return None
 
 def get_token_by_project_id(project_id):
-    session = Session()
+    session = _get_session()
     token = session.query(Token).filter_by(project_id=project_id).first()
-    session.close()
+    _release_session(session)
     return token
 
 def update_token(token_id, **kwargs):
-    session = Session()
+    session = _get_session()
     token = session.query(Token).filter_by(id=token_id).first()
     
     if not token:
-        session.close()
+        _release_session(session)
         return None
     
     for key, value in kwargs.items():
+        if key in TOKEN_AMOUNT_COLUMNS:
+            value = parse_token_amount(value)
         if hasattr(token, key):
             setattr(token, key, value)
     
     try:
         session.commit()
+        _invalidate_user_listings(token.project.user_id, 'list_projects')
         updated_token = session.query(Token).filter_by(id=token_id).first()
-        session.close()
+        _release_session(session)
         return updated_token
     except:
         session.rollback()
-        session.close()
+        _release_session(session)
         return None
 
 # Resource functions
 def get_resources():
-    session = Session()
+    session = _get_session()
     resources = session.query(Resource).all()
-    session.close()
+    _release_session(session)
     return resources
 
 def get_resource_by_id(resource_id):
-    session = Session()
+    session = _get_session()
     resource = session.query(Resource).filter_by(id=resource_id).first()
-    session.close()
+    _release_session(session)
     return resource
 
 def create_resource(title, description, resource_type, image_background, image_icon, link, link_text):
-    session = Session()
+    session = _get_session()
     resource = Resource(
         title=title,
         description=description,
@@ -547,17 +976,18 @@ def create_resource(title, description, resource_type, image_background, image_i
     session.add(resource)
     try:
         session.commit()
+        _invalidate_user_listings(None, 'list_resources')
         new_resource = session.query(Resource).filter_by(id=resource.id).first()
-        session.close()
+        _release_session(session)
         return new_resource
     except:
         session.rollback()
-        session.close()
+        _release_session(session)
         return None
 
 # TokenomicsModel functions
 def create_tokenomics_model(name, description, user_id, model_type, total_supply, **kwargs):
-    session = Session()
+    session = _get_session()
     model = TokenomicsModel(
         name=name,
         description=description,
@@ -569,38 +999,39 @@ def create_tokenomics_model(name, description, user_id, model_type, total_supply
     session.add(model)
     try:
         session.commit()
+        _invalidate_user_listings(user_id, 'list_tokenomics_models')
         new_model = session.query(TokenomicsModel).filter_by(id=model.id).first()
-        session.close()
+        _release_session(session)
         return new_model
     except:
         session.rollback()
-        session.close()
+        _release_session(session)
         return None
 
 def get_tokenomics_models_by_user(user_id):
-    session = Session()
+    session = _get_session()
     models = session.query(TokenomicsModel).filter_by(user_id=user_id).all()
-    session.close()
+    _release_session(session)
     return models
 
 def get_all_tokenomics_models():
-    session = Session()
+    session = _get_session()
     models = session.query(TokenomicsModel).all()
-    session.close()
+    _release_session(session)
     return models
 
 def get_tokenomics_model_by_id(model_id):
-    session = Session()
+    session = _get_session()
     model = session.query(TokenomicsModel).filter_by(id=model_id).first()
-    session.close()
+    _release_session(session)
     return model
 
 def update_tokenomics_model(model_id, **kwargs):
-    session = Session()
+    session = _get_session()
     model = session.query(TokenomicsModel).filter_by(id=model_id).first()
     
     if not model:
-        session.close()
+        _release_session(session)
         return None
     
     for key, value in kwargs.items():
@@ -609,35 +1040,41 @@ def update_tokenomics_model(model_id, **kwargs):
     
     try:
         session.commit()
+        _invalidate_user_listings(model.user_id, 'list_tokenomics_models')
         updated_model = session.query(TokenomicsModel).filter_by(id=model_id).first()
-        session.close()
+        _release_session(session)
         return updated_model
     except:
         session.rollback()
-        session.close()
+        _release_session(session)
         return None
 
 def delete_tokenomics_model(model_id):
-    session = Session()
+    session = _get_session()
     model = session.query(TokenomicsModel).filter_by(id=model_id).first()
     
     if not model:
-        session.close()
+        _release_session(session)
         return False
     
+    user_id = model.user_id
     try:
+        # Stored runs of the model go with it; deleted explicitly too, as tables
+        # created before the foreign key cascaded do not do it themselves
+        session.query(SimulationRun).filter_by(model_id=model_id).delete(synchronize_session=False)
         session.delete(model)
         session.commit()
-        session.close()
+        _invalidate_user_listings(user_id, 'list_tokenomics_models')
+        _release_session(session)
         return True
     except:
         session.rollback()
-        session.close()
+        _release_session(session)
         return False
 
 # CryptoeconomicSystem functions
 def create_cryptoeconomic_system(name, description, user_id, data):
-    session = Session()
+    session = _get_session()
     system = CryptoeconomicSystem(
         name=name,
         description=description,
@@ -647,38 +1084,39 @@ def create_cryptoeconomic_system(name, description, user_id, data):
     session.add(system)
     try:
         session.commit()
+        _invalidate_user_listings(user_id, 'list_cryptoeconomic_systems')
         new_system = session.query(CryptoeconomicSystem).filter_by(id=system.id).first()
-        session.close()
+        _release_session(session)
         return new_system
     except:
         session.rollback()
-        session.close()
+        _release_session(session)
         return None
 
 def get_cryptoeconomic_systems_by_user(user_id):
-    session = Session()
+    session = _get_session()
     systems = session.query(CryptoeconomicSystem).filter_by(user_id=user_id).all()
-    session.close()
+    _release_session(session)
     return systems
 
 def get_all_cryptoeconomic_systems():
-    session = Session()
+    session = _get_session()
     systems = session.query(CryptoeconomicSystem).all()
-    session.close()
+    _release_session(session)
     return systems
 
 def get_cryptoeconomic_system_by_id(system_id):
-    session = Session()
+    session = _get_session()
     system = session.query(CryptoeconomicSystem).filter_by(id=system_id).first()
-    session.close()
+    _release_session(session)
     return system
 
 def update_cryptoeconomic_system(system_id, **kwargs):
-    session = Session()
+    session = _get_session()
     system = session.query(CryptoeconomicSystem).filter_by(id=system_id).first()
     
     if not system:
-        session.close()
+        _release_session(session)
         return None
     
     for key, value in kwargs.items():
@@ -687,35 +1125,38 @@ def update_cryptoeconomic_system(system_id, **kwargs):
     
     try:
         session.commit()
+        _invalidate_user_listings(system.user_id, 'list_cryptoeconomic_systems')
         updated_system = session.query(CryptoeconomicSystem).filter_by(id=system_id).first()
-        session.close()
+        _release_session(session)
         return updated_system
     except:
         session.rollback()
-        session.close()
+        _release_session(session)
         return None
 
 def delete_cryptoeconomic_system(system_id):
-    session = Session()
+    session = _get_session()
     system = session.query(CryptoeconomicSystem).filter_by(id=system_id).first()
     
     if not system:
-        session.close()
+        _release_session(session)
         return False
     
+    user_id = system.user_id
     try:
         session.delete(system)
         session.commit()
-        session.close()
+        _invalidate_user_listings(user_id, 'list_cryptoeconomic_systems')
+        _release_session(session)
         return True
     except:
         session.rollback()
-        session.close()
+        _release_session(session)
         return False
 
 # TokenomicsComparison functions
 def create_tokenomics_comparison(name, description, user_id, model_ids, parameters=None):
-    session = Session()
+    session = _get_session()
     comparison = TokenomicsComparison(
         name=name,
         description=description,
@@ -727,31 +1168,31 @@ def create_tokenomics_comparison(name, description, user_id, model_ids, paramete
     try:
         session.commit()
         new_comparison = session.query(TokenomicsComparison).filter_by(id=comparison.id).first()
-        session.close()
+        _release_session(session)
         return new_comparison
     except:
         session.rollback()
-        session.close()
+        _release_session(session)
         return None
 
 def get_tokenomics_comparisons_by_user(user_id):
-    session = Session()
+    session = _get_session()
     comparisons = session.query(TokenomicsComparison).filter_by(user_id=user_id).all()
-    session.close()
+    _release_session(session)
     return comparisons
 
 def get_tokenomics_comparison_by_id(comparison_id):
-    session = Session()
+    session = _get_session()
     comparison = session.query(TokenomicsComparison).filter_by(id=comparison_id).first()
-    session.close()
+    _release_session(session)
     return comparison
 
 def update_tokenomics_comparison(comparison_id, **kwargs):
-    session = Session()
+    session = _get_session()
     comparison = session.query(TokenomicsComparison).filter_by(id=comparison_id).first()
     
     if not comparison:
-        session.close()
+        _release_session(session)
         return None
     
     for key, value in kwargs.items():
@@ -761,30 +1202,1111 @@ def update_tokenomics_comparison(comparison_id, **kwargs):
     try:
         session.commit()
         updated_comparison = session.query(TokenomicsComparison).filter_by(id=comparison_id).first()
-        session.close()
+        _release_session(session)
         return updated_comparison
     except:
         session.rollback()
-        session.close()
+        _release_session(session)
         return None
 
 def delete_tokenomics_comparison(comparison_id):
-    session = Session()
+    session = _get_session()
     comparison = session.query(TokenomicsComparison).filter_by(id=comparison_id).first()
     
     if not comparison:
-        session.close()
+        _release_session(session)
         return False
     
     try:
         session.delete(comparison)
         session.commit()
-        session.close()
+        _release_session(session)
         return True
     except:
         session.rollback()
-        session.close()
+        _release_session(session)
+        return False
+
+# Read cache in front of the record listings
+def _estimated_size(value):
+    """
+    Estimate the memory of a cached listing from its number of records
+    """
+    if isinstance(value, dict):
+        records = 1 + sum(len(item) for item in value.values() if isinstance(item, tuple))
+    else:
+        records = max(len(value), 1)
+    return records * READ_CACHE_RECORD_BYTES
+
+class ReadCache:
+    """
+    LRU cache of record listings keyed by (listing, user id), with a TTL
+
+    Write helpers invalidate the listings they change, so the TTL only bounds
+    staleness from writes made outside this module. Each key has a generation
+    that invalidate bumps: a listing read before an invalidation is not cached
+    when it is put afterwards. Listings are evicted once there are more than
+    max_entries or their estimated size exceeds max_bytes.
+    """
+
+    def __init__(self, ttl=READ_CACHE_TTL, max_entries=READ_CACHE_MAX_ENTRIES, max_bytes=READ_CACHE_MAX_BYTES):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._generations = {}
+        self._epoch = 0
+        self._size = 0
+        self._lock = threading.Lock()
+        self._stats = {'hits': 0, 'misses': 0, 'expirations': 0, 'evictions': 0, 'invalidations': 0,
+                       'stale_puts': 0}
+
+    def _drop(self, key):
+        # Called with the lock held
+        self._size -= self._entries.pop(key)[2]
+
+    def generation(self, key):
+        """
+        Get the current generation of a key, to pass to put after reading the listing
+        """
+        with self._lock:
+            return (self._epoch, self._generations.get(key, 0))
+
+    def get(self, key):
+        """
+        Get a fresh cached value, or None
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._stats['misses'] += 1
+                return None
+            value, expires, size = entry
+            if expires is not None and time.monotonic() >= expires:
+                self._drop(key)
+                self._stats['expirations'] += 1
+                self._stats['misses'] += 1
+                return None
+            self._entries.move_to_end(key)
+            self._stats['hits'] += 1
+            return value
+
+    def put(self, key, value, ttl=None, generation=None):
+        """
+        Cache a value, with the default TTL unless ttl is given (0 to never expire)
+
+        With a generation from generation(), the value is dropped if the key was
+        invalidated since, as it may have been read before the write.
+        """
+        ttl = self.ttl if ttl is None else ttl
+        size = _estimated_size(value)
+        with self._lock:
+            if generation is not None and generation != (self._epoch, self._generations.get(key, 0)):
+                self._stats['stale_puts'] += 1
+                return
+            if key in self._entries:
+                self._drop(key)
+            if size > self.max_bytes:
+                return
+            self._entries[key] = (value, time.monotonic() + ttl if ttl else None, size)
+            self._size += size
+            while len(self._entries) > self.max_entries or self._size > self.max_bytes:
+                self._drop(next(iter(self._entries)))
+                self._stats['evictions'] += 1
+
+    def invalidate(self, listing, user_id=None):
+        """
+        Drop one cached listing and bump its generation
+        """
+        key = (listing, user_id)
+        with self._lock:
+            self._generations[key] = self._generations.get(key, 0) + 1
+            if key in self._entries:
+                self._drop(key)
+                self._stats['invalidations'] += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+            self._epoch += 1
+
+    def stats(self):
+        """
+        Get hit and miss counters, the hit rate, the number of cached listings and their estimated bytes
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats['entries'] = len(self._entries)
+            stats['estimated_bytes'] = self._size
+        lookups = stats['hits'] + stats['misses']
+        stats['hit_rate'] = stats['hits'] / lookups if lookups else 0.0
+        return stats
+
+read_cache = ReadCache()
+
+def _cached_listing(ttl=None):
+    """
+    Cache a record listing per user id (the only argument), or once if it takes none
+    """
+    def decorator(function):
+        @wraps(function)
+        def wrapper(user_id=None):
+            key = (function.__name__, user_id)
+            records = read_cache.get(key)
+            if records is None:
+                # Taken before the read, so a write that lands during it keeps the result out of the cache
+                generation = read_cache.generation(key)
+                records = function(user_id) if user_id is not None else function()
+                read_cache.put(key, records, ttl, generation)
+            return records
+        return wrapper
+    return decorator
+
+def _invalidate_user_listings(user_id, *listings):
+    for listing in listings:
+        read_cache.invalidate(listing, user_id)
+    # Every listing change can change the user's dashboard counts or recent projects
+    read_cache.invalidate('get_dashboard_summary', user_id)
+
+def get_read_cache_stats():
+    """
+    Get read cache hit-rate metrics
+    """
+    return read_cache.stats()
+
+# Token analytics, computed in SQL over the numeric amount columns
+def get_token_portfolio_stats(user_id):
+    """
+    Get aggregate statistics over all tokens of a user's projects in one query
+
+    Returns a dict with the token count, total and largest initial market cap,
+    total and circulating supply, the circulating share of supply and the
+    min, max and average initial price.
+    """
+    session = _get_session()
+    row = (session.query(
+                func.count(Token.id),
+                func.sum(Token.initial_market_cap),
+                func.max(Token.initial_market_cap),
+                func.sum(Token.total_supply),
+                func.sum(Token.circulating_supply),
+                func.min(Token.initial_price),
+                func.max(Token.initial_price),
+                type_coerce(func.avg(Token.initial_price), TOKEN_AMOUNT))
+           .join(Project, Token.project_id == Project.id)
+           .filter(Project.user_id == user_id)
+           .one())
+    _release_session(session)
+    
+    count, market_cap, largest_market_cap, supply, circulating, min_price, max_price, avg_price = row
+    return {
+        'tokens': count,
+        'total_market_cap': market_cap,
+        'largest_market_cap': largest_market_cap,
+        'total_supply': supply,
+        'circulating_supply': circulating,
+        'circulating_ratio': circulating / supply if circulating is not None and supply else None,
+        'min_price': min_price,
+        'max_price': max_price,
+        'avg_price': avg_price
+    }
+
+def rank_tokens_by_market_cap(user_id=None, min_market_cap=None, max_market_cap=None, limit=50):
+    """
+    Get tokens ordered by initial market cap, largest first, optionally within a range
+    """
+    session = _get_session()
+    query = session.query(Token).filter(Token.initial_market_cap.isnot(None))
+    if user_id is not None:
+        query = query.join(Project, Token.project_id == Project.id).filter(Project.user_id == user_id)
+    if min_market_cap is not None:
+        query = query.filter(Token.initial_market_cap >= parse_token_amount(min_market_cap))
+    if max_market_cap is not None:
+        query = query.filter(Token.initial_market_cap <= parse_token_amount(max_market_cap))
+    records = tuple(_to_record(TokenRecord, token)
+                    for token in query.order_by(Token.initial_market_cap.desc(), Token.id).limit(limit))
+    _release_session(session)
+    return records
+
+def migrate_token_amount_columns():
+    """
+    Convert token amount columns created as free-form text to TokenAmount, parsing the stored values
+
+    PostgreSQL adds NUMERIC copies of the columns and swaps them in. SQLite
+    cannot change column types, so the table is rebuilt and the rows copied
+    over; this also converts NUMERIC columns of earlier SQLite databases to
+    the exact TEXT storage. Returns the migrated column names and the ids of
+    tokens whose text could not be parsed (stored as NULL, or 0 for total_supply).
+    """
+    inspector = inspect(engine)
+    if not inspector.has_table('tokens'):
+        return {'columns': [], 'unparsed': []}
+    columns = {column['name']: column['type'] for column in inspector.get_columns('tokens')}
+    if engine.dialect.name == 'sqlite':
+        to_migrate = [name for name in TOKEN_AMOUNT_COLUMNS if not isinstance(columns.get(name), Text)]
+    else:
+        to_migrate = [name for name in TOKEN_AMOUNT_COLUMNS if isinstance(columns.get(name), String)]
+    report = {'columns': to_migrate, 'unparsed': []}
+    if not to_migrate:
+        return report
+    
+    with engine.begin() as connection:
+        rows = connection.execute(text(f"SELECT id, {', '.join(TOKEN_AMOUNT_COLUMNS)} FROM tokens")).fetchall()
+        
+        # Parse in Python so values like '1,000,000' convert the same way on every backend
+        parsed = []
+        for row in rows:
+            values = {'id': row[0]}
+            for name, value in zip(TOKEN_AMOUNT_COLUMNS, row[1:]):
+                try:
+                    values[name] = parse_token_amount(value)
+                except ValueError:
+                    values[name] = Decimal(0) if name == 'total_supply' else None
+                    report['unparsed'].append(row[0])
+                if values[name] is None and name == 'total_supply':
+                    values[name] = Decimal(0)
+            parsed.append(values)
+        
+        if engine.dialect.name == 'postgresql':
+            # Add a numeric copy of each column to fill, then swap it in
+            for name in to_migrate:
+                connection.execute(text(f"ALTER TABLE tokens ADD COLUMN {name}_numeric "
+                                        f"NUMERIC({TOKEN_AMOUNT_PRECISION}, {TOKEN_AMOUNT_SCALE})"))
+            targets = {name: f"{name}_numeric" if name in to_migrate else name for name in TOKEN_AMOUNT_COLUMNS}
+        else:
+            # Rebuild the table with the new column types, copying every other column as is
+            connection.execute(text("ALTER TABLE tokens RENAME TO tokens_before_numeric"))
+            for index in Token.__table__.indexes:
+                connection.execute(text(f"DROP INDEX IF EXISTS {index.name}"))
+            Token.__table__.create(connection)
+            other_columns = ', '.join(column.name for column in Token.__table__.columns
+                                      if column.name not in TOKEN_AMOUNT_COLUMNS)
+            connection.execute(text(f"INSERT INTO tokens ({other_columns}, total_supply) "
+                                    f"SELECT {other_columns}, 0 FROM tokens_before_numeric"))
+            connection.execute(text("DROP TABLE tokens_before_numeric"))
+            targets = {name: name for name in TOKEN_AMOUNT_COLUMNS}
+        
+        if parsed:
+            assignments = ', '.join(f"{targets[name]} = :{name}" for name in TOKEN_AMOUNT_COLUMNS)
+            connection.execute(
+                text(f"UPDATE tokens SET {assignments} WHERE id = :id").bindparams(
+                    *[bindparam(name, type_=TOKEN_AMOUNT) for name in TOKEN_AMOUNT_COLUMNS]),
+                parsed
+            )
+        
+        if engine.dialect.name == 'postgresql':
+            for name in to_migrate:
+                connection.execute(text(f"ALTER TABLE tokens DROP COLUMN {name}"))
+                connection.execute(text(f"ALTER TABLE tokens RENAME COLUMN {name}_numeric TO {name}"))
+            if 'total_supply' in to_migrate:
+                connection.execute(text("ALTER TABLE tokens ALTER COLUMN total_supply SET NOT NULL"))
+    
+    report['unparsed'] = sorted(set(report['unparsed']))
+    return report
+
+# Simulation run storage
+def simulation_param_hash(parameters):
+    """
+    Get a stable hash of simulation parameters
+    """
+    content = json.dumps(parameters, sort_keys=True, default=str)
+    return hashlib.sha256(content.encode('utf-8')).hexdigest()
+
+class StoredSimulation:
+    """
+    Result arrays of a stored simulation run, decompressed one column at a time on access
+    """
+
+    def __init__(self, run, blob):
+        self.run = run
+        self._archive = np.load(io.BytesIO(blob), allow_pickle=False)
+
+    @property
+    def columns(self):
+        return list(self._archive.files)
+
+    def __contains__(self, name):
+        return name in self._archive.files
+
+    def __getitem__(self, name):
+        return self._archive[name]
+
+    def close(self):
+        self._archive.close()
+
+def _query_simulation_run(session, kind, parameters, seed, model_id):
+    return session.query(SimulationRun).filter_by(
+        kind=kind,
+        model_id=model_id,
+        param_hash=simulation_param_hash(parameters),
+        seed=seed
+    )
+
+def save_simulation_run(kind, parameters, seed, arrays, model_id=None, user_id=None, compress=False):
+    """
+    Store simulation result arrays as an .npz blob, replacing a run with the same key
+
+    arrays maps column names to NumPy arrays; 2-D arrays are (paths, steps).
+    Binary arrays are already a fraction of the size of their JSON, and deflate
+    gains little on random price paths while making reloads several times
+    slower, so compression is opt-in. Returns the run's metadata dict.
+    """
+    buffer = io.BytesIO()
+    if compress:
+        np.savez_compressed(buffer, **arrays)
+    else:
+        np.savez(buffer, **arrays)
+    blob = buffer.getvalue()
+
+    shapes = [np.shape(values) for values in arrays.values()]
+    n_paths = max((shape[0] for shape in shapes if len(shape) == 2), default=1)
+    n_steps = max((shape[-1] for shape in shapes if len(shape) >= 1), default=0)
+
+    session = _get_session()
+    run = _query_simulation_run(session, kind, parameters, seed, model_id).first()
+    if run is None:
+        run = SimulationRun(kind=kind, model_id=model_id, param_hash=simulation_param_hash(parameters), seed=seed)
+        session.add(run)
+    run.user_id = user_id
+    run.parameters = parameters
+    run.n_paths = n_paths
+    run.n_steps = n_steps
+    run.columns = list(arrays.keys())
+    run.size_bytes = len(blob)
+    run.created_at = datetime.utcnow()
+    run.results = blob
+    try:
+        session.commit()
+        saved = run.to_dict()
+        _release_session(session)
+        return saved
+    except:
+        session.rollback()
+        _release_session(session)
+        return None
+
+def get_simulation_run(kind, parameters, seed, model_id=None):
+    """
+    Load a stored run by its key, or None; columns are decompressed lazily
+    """
+    session = _get_session()
+    run = (_query_simulation_run(session, kind, parameters, seed, model_id)
+           .options(undefer(SimulationRun.results))
+           .first())
+    stored = StoredSimulation(run.to_dict(), run.results) if run else None
+    _release_session(session)
+    return stored
+
+def list_simulation_runs(user_id=None, model_id=None, kind=None):
+    """
+    Get metadata of stored runs, newest first, without loading their results
+    """
+    session = _get_session()
+    query = session.query(SimulationRun)
+    if user_id is not None:
+        query = query.filter(SimulationRun.user_id == user_id)
+    if model_id is not None:
+        query = query.filter(SimulationRun.model_id == model_id)
+    if kind is not None:
+        query = query.filter(SimulationRun.kind == kind)
+    runs = [run.to_dict() for run in query.order_by(SimulationRun.created_at.desc())]
+    _release_session(session)
+    return runs
+
+def delete_simulation_run(run_id):
+    session = _get_session()
+    run = session.query(SimulationRun).filter_by(id=run_id).first()
+    
+    if not run:
+        _release_session(session)
         return False
+    
+    try:
+        session.delete(run)
+        session.commit()
+        _release_session(session)
+        return True
+    except:
+        session.rollback()
+        _release_session(session)
+        return False
+
+# Bulk import and export of tokenomics models and projects
+IMPORT_BATCH_SIZE = 500
+
+# Rows rejected by validation are counted; only the first messages are kept on the job
+IMPORT_MAX_ERRORS = 100
+
+MODEL_TYPES = ('base', 'utility', 'governance')
+PROJECT_STATUSES = ('draft', 'in_progress', 'completed')
+
+# Largest value of an Integer column on PostgreSQL
+_MAX_INTEGER = 2**31 - 1
+
+# Columns of the CSV export; JSON-valued ones are written as JSON text
+TOKENOMICS_MODEL_CSV_COLUMNS = ('name', 'description', 'model_type', 'total_supply', 'distribution',
+                                'vesting_schedules', 'initial_users', 'user_growth_rate',
+                                'initial_staking_rate', 'staking_apy', 'data')
+PROJECT_CSV_COLUMNS = ('name', 'status', 'token_design_progress', 'team_members', 'token_name',
+                       'token_symbol', 'token_type', 'token_total_supply', 'token_initial_price',
+                       'token_initial_market_cap', 'token_circulating_supply', 'token_distribution')
+_JSON_FIELDS = ('distribution', 'vesting_schedules', 'data', 'team_members', 'token_distribution')
+
+def _iter_import_source(source):
+    """
+    Yield (label, item dict) from a directory of .json files, or a .json, .jsonl or .csv file
+
+    Directories are read in file name order and files line by line, so the
+    same source always yields the same sequence and an import can resume by
+    position. A .json file may hold one item or a list of them. A line or
+    file that is not valid JSON yields (label, ValueError) in its place, so
+    it is rejected like an invalid item instead of stopping the import.
+    """
+    if os.path.isdir(source):
+        for name in sorted(os.listdir(source)):
+            if name.endswith(('.json', '.jsonl', '.csv')):
+                yield from _iter_import_source(os.path.join(source, name))
+        return
+
+    name = os.path.basename(source)
+    if source.endswith('.csv'):
+        with open(source, newline='', encoding='utf-8') as f:
+            for line, row in enumerate(csv.DictReader(f), start=2):
+                yield f"{name}:{line}", row
+    elif source.endswith('.jsonl'):
+        with open(source, 'rb') as f:
+            for line, raw_line in enumerate(f, start=1):
+                if raw_line.strip():
+                    try:
+                        yield f"{name}:{line}", json.loads(raw_line.decode('utf-8'))
+                    except ValueError as e:
+                        yield f"{name}:{line}", ValueError(f"invalid JSON: {e}")
+    else:
+        try:
+            with open(source, 'rb') as f:
+                content = json.loads(f.read().decode('utf-8'))
+        except ValueError as e:
+            yield name, ValueError(f"invalid JSON: {e}")
+            return
+        if isinstance(content, list):
+            for i, item in enumerate(content):
+                yield f"{name}[{i}]", item
+        else:
+            yield name, content
+
+def _import_value(data, key, convert=None, default=None):
+    """
+    Get an optional field of an import item; empty CSV cells count as missing
+    """
+    value = data.get(key)
+    if value is None or value == '':
+        return default
+    if key in _JSON_FIELDS and isinstance(value, str):
+        try:
+            value = json.loads(value)
+        except ValueError:
+            raise ValueError(f"{key} is not valid JSON")
+    if convert is not None:
+        try:
+            value = convert(value)
+        except (TypeError, ValueError):
+            raise ValueError(f"{key} is not a valid {convert.__name__}: {value!r}")
+    return value
+
+def _import_name(data, max_length=100):
+    name = data.get('name')
+    if not isinstance(name, str) or not name.strip():
+        raise ValueError("name is required")
+    if len(name.strip()) > max_length:
+        raise ValueError(f"name is longer than {max_length} characters")
+    return name.strip()
+
+def _import_integer(value):
+    number = float(value)
+    if not number.is_integer() or abs(number) > _MAX_INTEGER:
+        raise ValueError(value)
+    return int(number)
+
+def _tokenomics_model_mapping(data, user_id):
+    """
+    Validate an import item and get its tokenomics_models row
+
+    Accepts the saved_models JSON files (TokenomicsModel.to_dict) as well as
+    rows exported by export_records.
+    """
+    model_type = _import_value(data, 'model_type', default='base')
+    if model_type not in MODEL_TYPES:
+        raise ValueError(f"model_type must be one of {', '.join(MODEL_TYPES)}")
+
+    total_supply = _import_value(data, 'total_supply', _import_integer)
+    if total_supply is None or total_supply <= 0:
+        raise ValueError("total_supply must be a positive integer")
+
+    distribution = _import_value(data, 'distribution', default={})
+    if not isinstance(distribution, dict):
+        raise ValueError("distribution must map categories to percentages")
+    try:
+        total = sum(float(value) for value in distribution.values())
+    except (TypeError, ValueError):
+        raise ValueError("distribution percentages must be numbers")
+    if distribution and abs(total - 100) > 0.01:
+        raise ValueError(f"distribution percentages must sum to 100, got {total:g}")
+
+    vesting_schedules = _import_value(data, 'vesting_schedules', default={})
+    if not isinstance(vesting_schedules, dict):
+        raise ValueError("vesting_schedules must map categories to schedules")
+
+    return {
+        'name': _import_name(data),
+        'description': _import_value(data, 'description'),
+        'user_id': user_id,
+        'model_type': model_type,
+        'total_supply': total_supply,
+        'distribution': distribution,
+        'vesting_schedules': vesting_schedules,
+        'initial_users': _import_value(data, 'initial_users', _import_integer),
+        'user_growth_rate': _import_value(data, 'user_growth_rate', float),
+        'initial_staking_rate': _import_value(data, 'initial_staking_rate', float),
+        'staking_apy': _import_value(data, 'staking_apy', float),
+        'data': _import_value(data, 'data')
+    }
+
+def _project_mapping(data, user_id):
+    """
+    Validate an import item and get its projects row and optional tokens row
+
+    The token is either a nested 'token' dict, as in the JSON export, or the
+    token_* columns of the CSV export.
+    """
+    status = _import_value(data, 'status', default='draft')
+    if status not in PROJECT_STATUSES:
+        raise ValueError(f"status must be one of {', '.join(PROJECT_STATUSES)}")
+    progress = _import_value(data, 'token_design_progress', _import_integer, default=0)
+    if not 0 <= progress <= 100:
+        raise ValueError("token_design_progress must be between 0 and 100")
+    team_members = _import_value(data, 'team_members', default=[])
+    if not isinstance(team_members, list):
+        raise ValueError("team_members must be a list")
+    project = {
+        'name': _import_name(data),
+        'status': status,
+        'user_id': user_id,
+        'token_design_progress': progress,
+        'team_members': team_members
+    }
+
+    token_data = data.get('token')
+    if token_data is None:
+        token_data = {key[len('token_'):]: value for key, value in data.items()
+                      if key.startswith('token_') and key != 'token_design_progress'}
+        if 'distribution' in token_data:
+            token_data['distribution'] = _import_value(data, 'token_distribution')
+    if not isinstance(token_data, dict):
+        raise ValueError("token must be an object")
+    if not any(value not in (None, '') for value in token_data.values()):
+        return project, None
+
+    token = {}
+    for key, max_length in (('name', 100), ('symbol', 10), ('type', 20)):
+        value = token_data.get(key)
+        if not isinstance(value, str) or not value.strip() or len(value.strip()) > max_length:
+            raise ValueError(f"token {key} is required, up to {max_length} characters")
+        token[key] = value.strip()
+    for key in TOKEN_AMOUNT_COLUMNS:
+        try:
+            token[key] = parse_token_amount(token_data.get(key))
+        except ValueError as e:
+            raise ValueError(f"token {key}: {e}")
+    if token['total_supply'] is None:
+        raise ValueError("token total_supply is required")
+    token['distribution'] = token_data.get('distribution') or {}
+    if not isinstance(token['distribution'], dict):
+        raise ValueError("token distribution must be an object")
+    return project, token
+
+def _insert_tokenomics_models(session, mappings):
+    session.execute(TokenomicsModel.__table__.insert(), mappings)
+
+def _insert_projects(session, mappings):
+    projects = [project for project, _ in mappings]
+    # One multi-row INSERT ... RETURNING gives the ids of the batch in order
+    ids = session.execute(insert(Project).returning(Project.id, sort_by_parameter_order=True),
+                          projects).scalars().all()
+    tokens = [dict(token, project_id=project_id) for project_id, (_, token) in zip(ids, mappings) if token]
+    if tokens:
+        session.execute(Token.__table__.insert(), tokens)
+
+# Validation and batch insert of each importable kind, and the listing it changes
+_IMPORTERS = {
+    'tokenomics_models': (_tokenomics_model_mapping, _insert_tokenomics_models, 'list_tokenomics_models'),
+    'projects': (_project_mapping, _insert_projects, 'list_projects')
+}
+
+def bulk_import(kind, source, user_id, batch_size=IMPORT_BATCH_SIZE, resume=True):
+    """
+    Import tokenomics models or projects from JSON, JSON Lines or CSV files
+
+    kind is 'tokenomics_models' or 'projects' and source a file or a directory
+    such as saved_models/. Items are streamed from the files, validated and
+    written batch_size at a time with multi-row INSERTs, one transaction per
+    batch. Invalid items are counted and skipped with their messages kept on
+    the job.
+
+    Progress is recorded on an ImportJob in the same transaction as each
+    batch, so after a failure calling bulk_import again with the same
+    arguments resumes after the last committed batch. Pass resume=False to
+    start over. Returns the job dict; status is 'failed' with the error in
+    its last message if a batch could not be written.
+    """
+    validate, write, listing = _IMPORTERS[kind]
+    source = os.path.abspath(source)
+
+    session = _get_session()
+    job = None
+    if resume:
+        job = (session.query(ImportJob)
+               .filter_by(user_id=user_id, kind=kind, source=source)
+               .filter(ImportJob.status != 'completed')
+               .order_by(ImportJob.id.desc())
+               .first())
+    if job is None:
+        job = ImportJob(user_id=user_id, kind=kind, source=source, position=0, imported=0, rejected=0, errors=[])
+        session.add(job)
+    job.status = 'running'
+    session.commit()
+
+    errors = list(job.errors or [])
+    items = itertools.islice(_iter_import_source(source), job.position, None)
+    try:
+        while True:
+            # Empty while reading, so a read error is not blamed on the last written batch
+            batch = []
+            batch = list(itertools.islice(items, batch_size))
+            if not batch:
+                break
+            mappings = []
+            for label, data in batch:
+                try:
+                    if isinstance(data, ValueError):
+                        raise data
+                    if not isinstance(data, dict):
+                        raise ValueError("item is not an object")
+                    mappings.append(validate(data, user_id))
+                except ValueError as e:
+                    job.rejected += 1
+                    if len(errors) < IMPORT_MAX_ERRORS:
+                        errors.append(f"{label}: {e}")
+            if mappings:
+                write(session, mappings)
+            job.position += len(batch)
+            job.imported += len(mappings)
+            job.errors = list(errors)
+            session.commit()
+            _invalidate_user_listings(user_id, listing)
+        job.status = 'completed'
+        session.commit()
+    except Exception as e:
+        session.rollback()
+        job.status = 'failed'
+        # A failed write rolls back its whole batch, so report the batch's range
+        items_range = f"items {job.position + 1}-{job.position + len(batch)}" if batch else f"item {job.position + 1}"
+        job.errors = list(job.errors or []) + [f"Stopped at {items_range}: {e}"]
+        session.commit()
+
+    result = job.to_dict()
+    _release_session(session)
+    return result
+
+def get_import_job(job_id):
+    session = _get_session()
+    job = session.query(ImportJob).filter_by(id=job_id).first()
+    result = job.to_dict() if job else None
+    _release_session(session)
+    return result
+
+def _export_tokenomics_model(model):
+    item = model.to_dict()
+    item.update({
+        'initial_users': model.initial_users,
+        'user_growth_rate': model.user_growth_rate,
+        'initial_staking_rate': model.initial_staking_rate,
+        'staking_apy': model.staking_apy
+    })
+    return item
+
+def _export_project(project):
+    item = project.to_dict()
+    item['token'] = project.token.to_dict() if project.token else None
+    return item
+
+def iter_export(kind, user_id=None, batch_size=IMPORT_BATCH_SIZE):
+    """
+    Yield the dicts of all tokenomics models or projects, of one user or of all users
+
+    Rows are read in id order one keyset page at a time, each in its own
+    short session, so memory stays bounded and no transaction is held open
+    between pages.
+    """
+    model_class, to_item = {
+        'tokenomics_models': (TokenomicsModel, _export_tokenomics_model),
+        'projects': (Project, _export_project)
+    }[kind]
+    last_id = 0
+    while True:
+        session = _get_session()
+        query = session.query(model_class).filter(model_class.id > last_id)
+        if user_id is not None:
+            query = query.filter(model_class.user_id == user_id)
+        if model_class is Project:
+            query = query.options(selectinload(Project.token))
+        page = [to_item(obj) for obj in query.order_by(model_class.id).limit(batch_size)]
+        _release_session(session)
+
+        yield from page
+        if len(page) < batch_size:
+            return
+        last_id = page[-1]['id']
+
+def _csv_row(kind, item):
+    if kind == 'projects':
+        token = item.get('token') or {}
+        item = dict(item, **{f'token_{key}': value for key, value in token.items()})
+        columns = PROJECT_CSV_COLUMNS
+    else:
+        columns = TOKENOMICS_MODEL_CSV_COLUMNS
+    row = {}
+    for column in columns:
+        value = item.get(column)
+        row[column] = json.dumps(value) if column in _JSON_FIELDS and value is not None else value
+    return row
+
+def export_records(kind, path, user_id=None, batch_size=IMPORT_BATCH_SIZE):
+    """
+    Stream tokenomics models or projects to a .jsonl, .json or .csv file
+
+    The files can be read back by bulk_import. Returns the number of items written.
+    """
+    count = 0
+    with open(path, 'w', newline='' if path.endswith('.csv') else None, encoding='utf-8') as f:
+        if path.endswith('.csv'):
+            columns = PROJECT_CSV_COLUMNS if kind == 'projects' else TOKENOMICS_MODEL_CSV_COLUMNS
+            writer = csv.DictWriter(f, fieldnames=columns)
+            writer.writeheader()
+            for item in iter_export(kind, user_id, batch_size):
+                writer.writerow(_csv_row(kind, item))
+                count += 1
+        elif path.endswith('.jsonl'):
+            for item in iter_export(kind, user_id, batch_size):
+                f.write(json.dumps(item) + '\n')
+                count += 1
+        else:
+            f.write('[')
+            for item in iter_export(kind, user_id, batch_size):
+                f.write((',\n' if count else '\n') + json.dumps(item))
+                count += 1
+            f.write('\n]\n')
+    return count
+
+# Read layer: immutable records loaded with a fixed number of queries
+@dataclass(frozen=True, slots=True)
+class UserRecord:
+    id: int
+    username: str
+    email: str
+    display_name: Optional[str]
+    avatar_initials: Optional[str]
+    plan: str
+    is_admin: bool
+    created_at: Optional[datetime]
+    updated_at: Optional[datetime]
+
+@dataclass(frozen=True, slots=True)
+class TokenRecord:
+    id: int
+    project_id: int
+    name: str
+    symbol: str
+    type: str
+    total_supply: Decimal
+    initial_price: Optional[Decimal]
+    initial_market_cap: Optional[Decimal]
+    circulating_supply: Optional[Decimal]
+    distribution: dict
+    created_at: Optional[datetime]
+
+@dataclass(frozen=True, slots=True)
+class ProjectRecord:
+    id: int
+    name: str
+    status: str
+    user_id: int
+    last_edited: Optional[datetime]
+    token_design_progress: int
+    team_members: list
+    created_at: Optional[datetime]
+    token: Optional[TokenRecord]
+
+@dataclass(frozen=True, slots=True)
+class ResourceRecord:
+    id: int
+    title: str
+    description: str
+    type: str
+    image_background: str
+    image_icon: str
+    link: str
+    link_text: str
+    created_at: Optional[datetime]
+
+@dataclass(frozen=True, slots=True)
+class TokenomicsModelRecord:
+    id: int
+    name: str
+    description: Optional[str]
+    user_id: int
+    model_type: str
+    total_supply: int
+    distribution: dict
+    vesting_schedules: dict
+    created_at: Optional[datetime]
+    updated_at: Optional[datetime]
+    initial_users: Optional[int]
+    user_growth_rate: Optional[float]
+    initial_staking_rate: Optional[float]
+    staking_apy: Optional[float]
+    data: Optional[dict]
+
+@dataclass(frozen=True, slots=True)
+class CryptoeconomicSystemRecord:
+    id: int
+    name: str
+    description: Optional[str]
+    user_id: int
+    data: dict
+    created_at: Optional[datetime]
+    updated_at: Optional[datetime]
+
+def _to_record(record_class, obj, **values):
+    """
+    Copy the columns of an ORM object into a record, with related records passed in values
+    """
+    for field in fields(record_class):
+        if field.name not in values:
+            values[field.name] = getattr(obj, field.name)
+    return record_class(**values)
+
+def _project_record(project):
+    token = _to_record(TokenRecord, project.token) if project.token else None
+    return _to_record(ProjectRecord, project, token=token)
+
+@_cached_listing()
+def list_users():
+    """
+    Get all users as records, in one query; cached until a user is created or updated
+    """
+    session = _get_session()
+    users = tuple(_to_record(UserRecord, user) for user in session.query(User).order_by(User.id))
+    _release_session(session)
+    return users
+
+@_cached_listing()
+def list_projects(user_id):
+    """
+    Get a user's projects with their tokens as records, in two queries
+    """
+    session = _get_session()
+    projects = (session.query(Project)
+                .options(selectinload(Project.token))
+                .filter_by(user_id=user_id)
+                .order_by(Project.id))
+    records = tuple(_project_record(project) for project in projects)
+    _release_session(session)
+    return records
+
+@_cached_listing()
+def list_tokenomics_models(user_id):
+    """
+    Get a user's tokenomics models as records, in one query
+    """
+    session = _get_session()
+    models = (session.query(TokenomicsModel)
+              .filter_by(user_id=user_id)
+              .order_by(TokenomicsModel.id))
+    records = tuple(_to_record(TokenomicsModelRecord, model) for model in models)
+    _release_session(session)
+    return records
+
+@_cached_listing()
+def list_cryptoeconomic_systems(user_id):
+    """
+    Get a user's cryptoeconomic systems as records, in one query
+    """
+    session = _get_session()
+    systems = (session.query(CryptoeconomicSystem)
+               .filter_by(user_id=user_id)
+               .order_by(CryptoeconomicSystem.id))
+    records = tuple(_to_record(CryptoeconomicSystemRecord, system) for system in systems)
+    _release_session(session)
+    return records
+
+@_cached_listing(ttl=0)
+def list_resources():
+    """
+    Get all learning resources as records, in one query; cached process-wide
+    """
+    session = _get_session()
+    records = tuple(_to_record(ResourceRecord, resource) for resource in session.query(Resource).order_by(Resource.id))
+    _release_session(session)
+    return records
+
+# Keyset pagination: pages are fetched after the (sort value, id) of the previous page's last row
+DEFAULT_PAGE_SIZE = 50
+
+@dataclass(frozen=True, slots=True)
+class Page:
+    items: tuple
+    next_cursor: Optional[tuple]
+
+# Sort key and direction of each listing's sort options
+USER_SORTS = {
+    'id': (User.id, False),
+    'username': (User.username, False),
+    'newest': (User.created_at, True)
+}
+PROJECT_SORTS = {
+    'recent': (func.coalesce(Project.last_edited, Project.created_at), True),
+    'name': (Project.name, False)
+}
+TOKENOMICS_MODEL_SORTS = {
+    'recent': (func.coalesce(TokenomicsModel.updated_at, TokenomicsModel.created_at), True),
+    'name': (TokenomicsModel.name, False)
+}
+
+def _keyset_page(query, id_column, sort, after, limit, to_record):
+    """
+    Fetch one page of a query ordered by (sort key, id), starting after a cursor
+
+    The cursor filter and ORDER BY ... LIMIT run in SQL, so the cost of a page
+    does not depend on how deep it is or how large the table is.
+    """
+    sort_key, descending = sort
+    query = query.add_columns(sort_key)
+
+    if after is not None:
+        value, last_id = after
+        if descending:
+            query = query.filter(or_(sort_key < value, and_(sort_key == value, id_column < last_id)))
+        else:
+            query = query.filter(or_(sort_key > value, and_(sort_key == value, id_column > last_id)))
+
+    order = (sort_key.desc(), id_column.desc()) if descending else (sort_key, id_column)
+    rows = query.order_by(*order).limit(limit + 1).all()
+
+    items = tuple(to_record(obj) for obj, _ in rows[:limit])
+    next_cursor = None
+    if len(rows) > limit:
+        last, last_value = rows[limit - 1]
+        next_cursor = (last_value, last.id)
+    return Page(items, next_cursor)
+
+def list_users_page(after=None, limit=DEFAULT_PAGE_SIZE, sort='id', search=None, plan=None):
+    """
+    Get one page of users as records, filtered and sorted in SQL
+
+    search matches the start of the username or email, plan filters by plan and
+    sort is one of USER_SORTS. Pass the returned next_cursor as after to get
+    the following page.
+    """
+    session = _get_session()
+    query = session.query(User)
+    if search:
+        query = query.filter(or_(User.username.ilike(f"{search}%"), User.email.ilike(f"{search}%")))
+    if plan:
+        query = query.filter(User.plan == plan)
+    page = _keyset_page(query, User.id, USER_SORTS[sort], after, limit,
+                        lambda user: _to_record(UserRecord, user))
+    _release_session(session)
+    return page
+
+def list_projects_page(user_id=None, after=None, limit=DEFAULT_PAGE_SIZE, sort='recent', status=None):
+    """
+    Get one page of projects with their tokens as records, of one user or of all users
+    """
+    session = _get_session()
+    query = session.query(Project).options(selectinload(Project.token))
+    if user_id is not None:
+        query = query.filter(Project.user_id == user_id)
+    if status:
+        query = query.filter(Project.status == status)
+    page = _keyset_page(query, Project.id, PROJECT_SORTS[sort], after, limit, _project_record)
+    _release_session(session)
+    return page
+
+def list_tokenomics_models_page(user_id=None, after=None, limit=DEFAULT_PAGE_SIZE, sort='recent', model_type=None):
+    """
+    Get one page of tokenomics models as records, of one user or of all users
+    """
+    session = _get_session()
+    query = session.query(TokenomicsModel)
+    if user_id is not None:
+        query = query.filter(TokenomicsModel.user_id == user_id)
+    if model_type:
+        query = query.filter(TokenomicsModel.model_type == model_type)
+    page = _keyset_page(query, TokenomicsModel.id, TOKENOMICS_MODEL_SORTS[sort], after, limit,
+                        lambda model: _to_record(TokenomicsModelRecord, model))
+    _release_session(session)
+    return page
+
+# Number of recent projects on the dashboard
+DASHBOARD_RECENT_PROJECTS = 5
+
+@_cached_listing()
+def get_dashboard_summary(user_id):
+    """
+    Get a user's dashboard data in two queries
+
+    Returns a dict with the 'projects', 'tokenomics_models' and 'cryptoeconomic_systems'
+    counts (SQL aggregates) and 'recent_projects', the most recently edited projects
+    as records with their tokens.
+    """
+    session = _get_session()
+    counts = session.execute(select(
+        select(func.count()).select_from(Project).where(Project.user_id == user_id).scalar_subquery(),
+        select(func.count()).select_from(TokenomicsModel).where(TokenomicsModel.user_id == user_id).scalar_subquery(),
+        select(func.count()).select_from(CryptoeconomicSystem).where(CryptoeconomicSystem.user_id == user_id).scalar_subquery()
+    )).one()
+    recent_projects = (session.query(Project)
+                       .options(joinedload(Project.token))
+                       .filter_by(user_id=user_id)
+                       .order_by(func.coalesce(Project.last_edited, Project.created_at).desc())
+                       .limit(DASHBOARD_RECENT_PROJECTS))
+    summary = {
+        'projects': counts[0],
+        'tokenomics_models': counts[1],
+        'cryptoeconomic_systems': counts[2],
+        'recent_projects': tuple(_project_record(project) for project in recent_projects)
+    }
+    _release_session(session)
+    return summary
+
+@contextmanager
+def count_queries():
+    """
+    Count the SQL statements executed inside the block
+
+    Yields a list that collects each statement, so len() of it is the query count.
+    """
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, 'before_cursor_execute', record)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, 'before_cursor_execute', record)
 
 # Initialize the database
 if __name__ == '__main__':
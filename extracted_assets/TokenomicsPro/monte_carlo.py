@@ -0,0 +1,789 @@
+import time
+import numpy as np
+import pandas as pd
+from dataclasses import dataclass, field
+from functools import lru_cache
+from scipy.special import ndtri
+from scipy.stats import qmc, t as student_t
+
+# How daily returns are drawn: 'arithmetic' draws simple returns r ~ N(drift, volatility)
+# and compounds them, 'log' draws log-returns of a geometric Brownian motion whose
+# expected growth is drift per period
+RETURN_CONVENTIONS = ('arithmetic', 'log')
+
+# Paths are drawn in blocks, each from its own random stream spawned from the seed,
+# so a path's prices depend only on the seed and its index, not on the chunk size
+PATHS_PER_STREAM = 1024
+
+# How the normal shocks of a block of paths are drawn. Antithetic blocks pair
+# each draw with its negation; Latin hypercube and scrambled Sobol blocks spread
+# the points evenly and build each path with a Brownian bridge, so the first
+# coordinates set the final price and the coarse shape of the path. Every block
+# is an independent replicate, which the standard errors are estimated from.
+SAMPLING_METHODS = ('pseudo_random', 'antithetic', 'latin_hypercube', 'sobol')
+
+# Working memory for the paths of one chunk
+MEMORY_BUDGET_BYTES = 128 * 2**20
+
+# Quantiles of the fan chart, as (column, quantile)
+FAN_QUANTILES = (('P5', 0.05), ('P25', 0.25), ('P75', 0.75), ('P95', 0.95))
+
+# Per-step statistics computed across all paths
+STATISTICS = ('Mean', 'Std', 'Min', 'Max', 'Median') + tuple(name for name, _ in FAN_QUANTILES)
+
+# Centroids per step of a quantile sketch; more give more accurate quantiles
+SKETCH_CENTROIDS = 100
+
+# Final-price estimates an adaptive run can stop on; 'Below' is the share of
+# paths ending below a price threshold
+ADAPTIVE_STATISTICS = ('Mean', 'P5', 'Median', 'P95', 'Below')
+
+# Paths of the first block of an adaptive run; later blocks grow towards the
+# number of paths the target precision is projected to need
+ADAPTIVE_BLOCK_PATHS = 4 * PATHS_PER_STREAM
+
+class QuantileSketch:
+    """
+    Mergeable t-digest style quantile sketches of many series, one per time step
+
+    Each step keeps at most `centroids` weighted centroids. Their sizes follow
+    the t-digest arcsine scale, so centroids are small near the tails and
+    extreme quantiles stay accurate. Every operation works on all steps at
+    once, and memory is O(steps x centroids) however many values are added.
+    Exact minima and maxima are kept alongside.
+    """
+
+    def __init__(self, steps, centroids=SKETCH_CENTROIDS):
+        self.centroids = centroids
+        self.means = np.full((steps, 0), np.inf)
+        self.weights = np.zeros((steps, 0))
+        self.min = np.full(steps, np.inf)
+        self.max = np.full(steps, -np.inf)
+
+    @property
+    def count(self):
+        return float(self.weights[0].sum()) if self.weights.size else 0.0
+
+    @property
+    def nbytes(self):
+        return self.means.nbytes + self.weights.nbytes + self.min.nbytes + self.max.nbytes
+
+    def _scale(self, q):
+        # Centroid index of quantile q on the arcsine scale
+        k = np.floor(self.centroids * (np.arcsin(2 * q - 1) / np.pi + 0.5))
+        return np.clip(k, 0, self.centroids - 1).astype(np.intp)
+
+    def add(self, values):
+        """
+        Add a block of series, an array of shape (series, steps)
+        """
+        n = len(values)
+        if n == 0:
+            return
+        np.minimum(self.min, values.min(axis=0), out=self.min)
+        np.maximum(self.max, values.max(axis=0), out=self.max)
+
+        # Sorted, every step's values share the same ranks, so one set of
+        # centroid boundaries applies to all steps
+        ordered = np.sort(values.T, axis=1)
+        buckets = self._scale((np.arange(n) + 0.5) / n)
+        starts = np.flatnonzero(np.diff(buckets, prepend=-1))
+        weights = np.diff(np.append(starts, n)).astype(float)
+        means = np.add.reduceat(ordered, starts, axis=1) / weights
+        self._merge(means, np.broadcast_to(weights, means.shape))
+
+    def merge(self, other):
+        """
+        Fold another sketch of the same steps into this one
+        """
+        np.minimum(self.min, other.min, out=self.min)
+        np.maximum(self.max, other.max, out=self.max)
+        self._merge(other.means, other.weights)
+
+    def _merge(self, means, weights):
+        steps = len(self.min)
+        means = np.concatenate([self.means, means], axis=1)
+        weights = np.concatenate([self.weights, weights], axis=1)
+
+        # Sort each step's centroids (empty slots hold inf and go last), then
+        # regroup them by the scale of their cumulative weight midpoints
+        order = np.argsort(means, axis=1)
+        means = np.take_along_axis(means, order, axis=1)
+        weights = np.take_along_axis(weights, order, axis=1)
+        total = weights.sum(axis=1, keepdims=True)
+        midpoints = (np.cumsum(weights, axis=1) - weights / 2) / total
+        slots = (self._scale(midpoints) + np.arange(steps)[:, None] * self.centroids).ravel()
+
+        size = steps * self.centroids
+        merged_weights = np.bincount(slots, weights.ravel(), size).reshape(steps, self.centroids)
+        sums = np.bincount(slots, (np.where(weights > 0, means, 0) * weights).ravel(), size)
+        sums = sums.reshape(steps, self.centroids)
+        self.means = np.divide(sums, merged_weights, out=np.full_like(sums, np.inf), where=merged_weights > 0)
+        self.weights = merged_weights
+
+    def distribution(self, step):
+        """
+        Get the (means, weights) of the non-empty centroids of one step
+        """
+        occupied = self.weights[step] > 0
+        return self.means[step][occupied], self.weights[step][occupied]
+
+    def quantiles(self, qs):
+        """
+        Estimate quantiles of every step
+
+        Interpolates between centroid means placed at their cumulative weight
+        midpoints, with the exact minimum and maximum at 0 and 1.
+
+        Returns:
+        - Array of shape (len(qs), steps)
+        """
+        qs = np.asarray(qs, dtype=float)
+        result = np.empty((len(qs), len(self.min)))
+        for step in range(len(self.min)):
+            means, weights = self.distribution(step)
+            midpoints = (np.cumsum(weights) - weights / 2) / weights.sum()
+            result[:, step] = np.interp(qs, np.concatenate([[0], midpoints, [1]]),
+                                        np.concatenate([[self.min[step]], means, [self.max[step]]]))
+        return result
+
+    def to_arrays(self, prefix='sketch_'):
+        return {f'{prefix}means': self.means, f'{prefix}weights': self.weights,
+                f'{prefix}min': self.min, f'{prefix}max': self.max}
+
+    @classmethod
+    def from_arrays(cls, arrays, prefix='sketch_'):
+        means = np.asarray(arrays[f'{prefix}means'])
+        sketch = cls(len(means), means.shape[1])
+        sketch.means = means
+        sketch.weights = np.asarray(arrays[f'{prefix}weights'])
+        sketch.min = np.array(arrays[f'{prefix}min'])
+        sketch.max = np.array(arrays[f'{prefix}max'])
+        return sketch
+
+# Quantiles of the final price whose standard errors are reported
+FINAL_QUANTILES = (('P5', 0.05), ('Median', 0.5), ('P95', 0.95))
+
+class PathAggregator:
+    """
+    Streaming summary of price paths: running mean and variance, quantile
+    sketches, replicate statistics for standard errors and the first few
+    paths, per time step
+
+    Paths arrive in blocks of PATHS_PER_STREAM rows, each an independent
+    replicate. Each path may come with a control path whose expectation
+    control_mean is known (see gbm_control_paths); the mean is then the
+    control variate estimate. With a threshold, the share of paths whose
+    final price is below it is tracked too. Aggregators of disjoint sets of
+    paths merge exactly, except for the sketched quantiles.
+    """
+
+    def __init__(self, steps, keep_paths=20, centroids=SKETCH_CENTROIDS, control_mean=None, threshold=None):
+        self.count = 0
+        self.mean = np.zeros(steps)
+        self.m2 = np.zeros(steps)
+        self.sketch = QuantileSketch(steps, centroids)
+        self.keep_paths = keep_paths
+        self.paths = np.empty((0, steps))
+
+        # Running mean and variance of the control paths and their co-moment with the paths
+        self.control_mean = control_mean
+        self.control = np.zeros(steps)
+        self.control_m2 = np.zeros(steps)
+        self.comoment = np.zeros(steps)
+
+        # Sums over replicate blocks of n_b^2 times products of the block means of
+        # the paths (S) and controls (G), and per block [n_b, final quantiles...]
+        self.blocks = 0
+        self.block_sums = {name: np.zeros(steps) for name in ('1', 'S', 'SS', 'G', 'GG', 'SG')}
+        self.block_quantiles = np.empty((0, 1 + len(FINAL_QUANTILES)))
+
+        # Per block, the share of final prices below the threshold
+        self.threshold = threshold
+        self.block_below = np.empty(0)
+
+    def add(self, paths, control=None):
+        """
+        Add a block of paths of shape (paths, steps), with their control paths if used
+        """
+        self.sketch.add(paths)
+        mean = paths.mean(axis=0)
+        centered = paths - mean
+        m2 = np.einsum('ij,ij->j', centered, centered)
+
+        starts = np.arange(0, len(paths), PATHS_PER_STREAM)
+        sizes = np.diff(np.append(starts, len(paths)))
+        weights = sizes.astype(float) ** 2
+        block_means = np.add.reduceat(paths, starts, axis=0) / sizes[:, None]
+        block_sums = {'1': np.full(len(mean), weights.sum()), 'S': weights @ block_means,
+                      'SS': weights @ block_means ** 2}
+        quantiles = [np.quantile(paths[start:start + size, -1], [q for _, q in FINAL_QUANTILES])
+                     for start, size in zip(starts, sizes)]
+        block_quantiles = np.column_stack([sizes, quantiles])
+        block_below = np.empty(0)
+        if self.threshold is not None:
+            block_below = np.array([np.count_nonzero(paths[start:start + size, -1] < self.threshold) / size
+                                    for start, size in zip(starts, sizes)])
+
+        moments = None
+        if control is not None:
+            control_mean = control.mean(axis=0)
+            control_centered = control - control_mean
+            moments = (control_mean, np.einsum('ij,ij->j', control_centered, control_centered),
+                       np.einsum('ij,ij->j', centered, control_centered))
+            del control_centered
+            control_blocks = np.add.reduceat(control, starts, axis=0) / sizes[:, None]
+            block_sums.update({'G': weights @ control_blocks, 'GG': weights @ control_blocks ** 2,
+                               'SG': weights @ (block_means * control_blocks)})
+        del centered
+        self._combine(len(paths), mean, m2, paths, moments, len(sizes), block_sums, block_quantiles, block_below)
+
+    def merge(self, other):
+        """
+        Fold in the aggregator of a disjoint set of paths
+        """
+        self.sketch.merge(other.sketch)
+        moments = (other.control, other.control_m2, other.comoment) if other.control_mean is not None else None
+        self._combine(other.count, other.mean, other.m2, other.paths, moments,
+                      other.blocks, other.block_sums, other.block_quantiles, other.block_below)
+
+    def _combine(self, count, mean, m2, paths, moments, blocks, block_sums, block_quantiles, block_below):
+        # Chan et al. parallel update of the means, sums of squared deviations and co-moment
+        total = self.count + count
+        delta = mean - self.mean
+        if moments is not None:
+            control, control_m2, comoment = moments
+            control_delta = control - self.control
+            self.control = self.control + control_delta * (count / total)
+            self.control_m2 = self.control_m2 + control_m2 + control_delta ** 2 * (self.count * count / total)
+            self.comoment = self.comoment + comoment + delta * control_delta * (self.count * count / total)
+        self.mean = self.mean + delta * (count / total)
+        self.m2 = self.m2 + m2 + delta ** 2 * (self.count * count / total)
+        self.count = total
+
+        self.blocks += blocks
+        for name, values in block_sums.items():
+            self.block_sums[name] = self.block_sums[name] + values
+        self.block_quantiles = np.concatenate([self.block_quantiles, block_quantiles])
+        if self.threshold is not None:
+            self.block_below = np.concatenate([self.block_below, block_below])
+        if len(self.paths) < self.keep_paths:
+            self.paths = np.concatenate([self.paths, paths[:self.keep_paths - len(self.paths)]])
+
+    @property
+    def nbytes(self):
+        return (self.sketch.nbytes + self.paths.nbytes + self.block_quantiles.nbytes + self.block_below.nbytes
+                + sum(values.nbytes for values in (self.mean, self.m2, self.control, self.control_m2,
+                                                   self.comoment, *self.block_sums.values())))
+
+    def _control_coefficient(self):
+        # Regression coefficient of the paths on their controls, per step
+        if self.control_mean is None:
+            return None
+        return np.divide(self.comoment, self.control_m2, out=np.zeros_like(self.comoment),
+                         where=self.control_m2 > 0)
+
+    def estimated_mean(self):
+        """
+        Get the mean price per step, adjusted by the control variate if one is used
+        """
+        beta = self._control_coefficient()
+        if beta is None:
+            return self.mean
+        return self.mean - beta * (self.control - self.control_mean)
+
+    def standard_errors(self):
+        """
+        Get the standard errors of the mean per step, of the FINAL_QUANTILES of
+        the final price and, with a threshold, of the share below it ('Below')
+
+        Estimated from the spread of the independent replicate blocks, so they
+        hold for every sampling method; NaN with fewer than two blocks.
+        """
+        if self.blocks < 2:
+            errors = {'Mean': np.full(len(self.mean), np.nan)}
+            errors.update({name: np.nan for name, _ in FINAL_QUANTILES})
+            if self.threshold is not None:
+                errors['Below'] = np.nan
+            return errors
+
+        sums = self.block_sums
+        correction = self.blocks / (self.blocks - 1)
+
+        # Sum over blocks of n_b^2 (x_b - x)(y_b - y), from the accumulated sums
+        def spread(x, y, xy, sum_x, sum_y):
+            return xy - x * sum_y - y * sum_x + x * y * sums['1']
+
+        variance = spread(self.mean, self.mean, sums['SS'], sums['S'], sums['S'])
+        beta = self._control_coefficient()
+        if beta is not None:
+            variance = (variance
+                        - 2 * beta * spread(self.mean, self.control, sums['SG'], sums['S'], sums['G'])
+                        + beta ** 2 * spread(self.control, self.control, sums['GG'], sums['G'], sums['G']))
+        errors = {'Mean': np.sqrt(np.maximum(variance, 0) * correction) / self.count}
+
+        # Final-step estimates of each block, weighted by block size
+        sizes, estimates = self.block_quantiles[:, 0], self.block_quantiles[:, 1:]
+        names = [name for name, _ in FINAL_QUANTILES]
+        if self.threshold is not None:
+            estimates = np.column_stack([estimates, self.block_below])
+            names.append('Below')
+        pooled = sizes @ estimates / sizes.sum()
+        deviations = (sizes ** 2) @ (estimates - pooled) ** 2
+        for name, deviation in zip(names, deviations):
+            errors[name] = float(np.sqrt(deviation * correction) / sizes.sum())
+        return errors
+
+    def probability_below(self):
+        """
+        Get the share of paths whose final price is below the threshold, None without one
+        """
+        if self.threshold is None or not self.blocks:
+            return None
+        sizes = self.block_quantiles[:, 0]
+        return float(sizes @ self.block_below / sizes.sum())
+
+    def statistics(self):
+        """
+        Get the STATISTICS columns, one value per step
+        """
+        quantiles = self.sketch.quantiles([0.5] + [q for _, q in FAN_QUANTILES])
+        statistics = {
+            'Mean': self.estimated_mean(),
+            'Std': np.sqrt(self.m2 / self.count),
+            'Min': self.sketch.min,
+            'Max': self.sketch.max,
+            'Median': quantiles[0]
+        }
+        for (name, _), values in zip(FAN_QUANTILES, quantiles[1:]):
+            statistics[name] = values
+        return statistics
+
+    def to_arrays(self):
+        """
+        Get the arrays to persist; regenerate full paths from the seed instead of storing them
+        """
+        arrays = {'count': np.array(self.count), 'mean': self.mean, 'm2': self.m2, 'paths': self.paths,
+                  'blocks': np.array(self.blocks), 'block_quantiles': self.block_quantiles,
+                  **{f'block_sums_{name}': values for name, values in self.block_sums.items()},
+                  **self.sketch.to_arrays()}
+        if self.control_mean is not None:
+            arrays.update({'control_mean': self.control_mean, 'control': self.control,
+                           'control_m2': self.control_m2, 'comoment': self.comoment})
+        if self.threshold is not None:
+            arrays.update({'threshold': np.array(self.threshold), 'block_below': self.block_below})
+        return arrays
+
+    @classmethod
+    def from_arrays(cls, arrays):
+        mean = np.array(arrays['mean'])
+        paths = np.array(arrays['paths'])
+        control_mean = np.array(arrays['control_mean']) if 'control_mean' in arrays else None
+        threshold = float(arrays['threshold']) if 'threshold' in arrays else None
+        aggregator = cls(len(mean), len(paths), control_mean=control_mean, threshold=threshold)
+        aggregator.count = int(arrays['count'])
+        aggregator.mean = mean
+        aggregator.m2 = np.array(arrays['m2'])
+        aggregator.sketch = QuantileSketch.from_arrays(arrays)
+        aggregator.paths = paths
+        if 'blocks' in arrays:
+            aggregator.blocks = int(arrays['blocks'])
+            aggregator.block_quantiles = np.array(arrays['block_quantiles'])
+            aggregator.block_sums = {name: np.array(arrays[f'block_sums_{name}']) for name in aggregator.block_sums}
+        if control_mean is not None:
+            aggregator.control = np.array(arrays['control'])
+            aggregator.control_m2 = np.array(arrays['control_m2'])
+            aggregator.comoment = np.array(arrays['comoment'])
+        if threshold is not None:
+            aggregator.block_below = np.array(arrays['block_below'])
+        return aggregator
+
+def gbm_control_mean(initial_price, drift, periods, convention='arithmetic'):
+    """
+    Get the closed-form expected price per step of the paths' GBM control
+    """
+    t = np.arange(periods + 1)
+    if convention == 'log':
+        return initial_price * np.exp(drift * t)
+    return initial_price * (1 + drift) ** t
+
+def gbm_control_paths(paths, initial_price, drift, volatility, convention='arithmetic'):
+    """
+    Build the geometric Brownian motion driven by the same shocks as the paths
+
+    Its expectation is gbm_control_mean. Log paths are that GBM already;
+    arithmetic paths compound simple returns, and their control is the GBM
+    with the same per-period mean growth and matching volatility.
+    """
+    if convention == 'log':
+        return paths
+    shocks = (paths[:, 1:] / paths[:, :-1] - 1 - drift) / volatility
+    log_volatility = volatility / (1 + drift)
+    shocks *= log_volatility
+    shocks += np.log1p(drift) - log_volatility ** 2 / 2
+    control = np.empty_like(paths)
+    control[:, 0] = 0
+    np.cumsum(shocks, axis=1, out=control[:, 1:])
+    del shocks
+    np.exp(control, out=control)
+    control *= initial_price
+    return control
+
+@dataclass
+class MonteCarloResult:
+    aggregator: PathAggregator
+    chunks: int
+
+    def __post_init__(self):
+        self.statistics = self.aggregator.statistics()
+        self.standard_errors = self.aggregator.standard_errors()
+
+    @property
+    def paths(self):
+        return self.aggregator.paths
+
+    def final_distribution(self):
+        """
+        Get the (prices, weights) centroids of the final price distribution
+        """
+        return self.aggregator.sketch.distribution(-1)
+
+    def to_frame(self, dates):
+        """
+        Build the results DataFrame of the Econometrics page: Date, one 'Sim i'
+        column per kept path, then the per-step statistics
+        """
+        columns = {'Date': dates}
+        for i, path in enumerate(self.paths):
+            columns[f'Sim {i+1}'] = path
+        for name in STATISTICS:
+            columns[name] = self.statistics[name]
+        return pd.DataFrame(columns)
+
+def chunk_size_for(periods, budget_bytes=MEMORY_BUDGET_BYTES, dtype=np.float64):
+    """
+    Get the number of paths per chunk that fits the memory budget, in whole random streams
+
+    A chunk needs its path array plus the array of draws it is built from.
+    """
+    per_path = 2 * (periods + 1) * np.dtype(dtype).itemsize
+    streams = max(1, budget_bytes // (per_path * PATHS_PER_STREAM))
+    return int(streams * PATHS_PER_STREAM)
+
+@lru_cache(maxsize=8)
+def _brownian_bridge_plan(steps):
+    """
+    Get the construction order of a Brownian bridge over times 1..steps
+
+    Each entry (point, left, right, left weight, right weight, scale) sets
+    W[point] from the already built W[left] and W[right] plus scale times the
+    next normal: the last time first, then the midpoints of ever finer intervals.
+    """
+    plan = [(steps, 0, 0, 0.0, 0.0, np.sqrt(steps))]
+    intervals = [(0, steps)]
+    while intervals:
+        refined = []
+        for left, right in intervals:
+            if right - left < 2:
+                continue
+            middle = (left + right) // 2
+            plan.append((middle, left, right, (right - middle) / (right - left), (middle - left) / (right - left),
+                         np.sqrt((middle - left) * (right - middle) / (right - left))))
+            refined += [(left, middle), (middle, right)]
+        intervals = refined
+    return tuple(plan)
+
+def brownian_bridge(normals):
+    """
+    Turn (paths, steps) standard normals into Brownian increments by bridge construction
+
+    The increments are again independent standard normals, but column 0
+    alone sets each path's total, and each following column refines a
+    finer time scale. Low-discrepancy points put their most even
+    coordinates first, so this is where they help most.
+    """
+    walk = np.zeros((len(normals), normals.shape[1] + 1))
+    for column, (point, left, right, left_weight, right_weight, scale) in enumerate(
+            _brownian_bridge_plan(normals.shape[1])):
+        walk[:, point] = left_weight * walk[:, left] + right_weight * walk[:, right] + scale * normals[:, column]
+    return np.diff(walk, axis=1)
+
+def _block_normals(stream, n_paths, periods, sampling, dtype):
+    """
+    Draw the (n_paths, periods) normal shocks of one block from its stream
+    """
+    if sampling == 'antithetic':
+        half = stream.standard_normal((-(-n_paths // 2), periods), dtype=dtype)
+        return np.concatenate([half, -half])[:n_paths]
+    if sampling == 'sobol':
+        sampler = qmc.Sobol(periods, scramble=True, seed=stream)
+        points = sampler.random_base2(int(np.ceil(np.log2(n_paths))))[:n_paths]
+    else:
+        points = qmc.LatinHypercube(periods, seed=stream).random(n_paths)
+    return brownian_bridge(ndtri(points)).astype(dtype, copy=False)
+
+def _draw_chunk(streams, first_path, n_paths, periods, drift, volatility, convention, sampling, dtype):
+    """
+    Draw n_paths x periods returns from the streams of paths first_path onward,
+    as per-period growth factors (arithmetic) or log-returns (log)
+    """
+    draws = np.empty((n_paths, periods), dtype=dtype)
+    for start in range(0, n_paths, PATHS_PER_STREAM):
+        stream = streams[(first_path + start) // PATHS_PER_STREAM]
+        block = draws[start:start + PATHS_PER_STREAM]
+        if sampling == 'pseudo_random':
+            stream.standard_normal(out=block, dtype=dtype)
+        else:
+            block[:] = _block_normals(stream, len(block), periods, sampling, dtype)
+    draws *= volatility
+    if convention == 'log':
+        # Ito correction so that E[price_t] = initial_price * exp(drift * t)
+        draws += drift - volatility ** 2 / 2
+    else:
+        draws += 1 + drift
+    return draws
+
+def iter_price_path_chunks(initial_price, drift, volatility, periods, simulations, seed=None,
+                           convention='arithmetic', chunk_size=None, dtype=np.float64, start_path=0,
+                           sampling='pseudo_random'):
+    """
+    Generate Monte Carlo price paths one chunk at a time
+
+    Parameters:
+    - initial_price: Price at step 0
+    - drift, volatility: Per-period mean and standard deviation of returns
+    - periods: Number of simulated periods; each path has periods + 1 prices
+    - simulations: Total number of paths
+    - seed: Seed of the random streams; the same seed gives the same paths
+    - convention: One of RETURN_CONVENTIONS
+    - chunk_size: Paths per chunk, a multiple of PATHS_PER_STREAM; by default
+      as many as fit MEMORY_BUDGET_BYTES
+    - start_path: First path to generate, a multiple of PATHS_PER_STREAM
+    - sampling: One of SAMPLING_METHODS
+
+    Returns:
+    - Iterator of (first path index, array of shape (paths in chunk, periods + 1))
+    """
+    if convention not in RETURN_CONVENTIONS:
+        raise ValueError(f"convention must be one of {', '.join(RETURN_CONVENTIONS)}")
+    if sampling not in SAMPLING_METHODS:
+        raise ValueError(f"sampling must be one of {', '.join(SAMPLING_METHODS)}")
+    if chunk_size is None:
+        chunk_size = chunk_size_for(periods, dtype=dtype)
+    elif chunk_size % PATHS_PER_STREAM:
+        raise ValueError(f"chunk_size must be a multiple of {PATHS_PER_STREAM}")
+    if start_path % PATHS_PER_STREAM:
+        raise ValueError(f"start_path must be a multiple of {PATHS_PER_STREAM}")
+
+    n_streams = -(-simulations // PATHS_PER_STREAM)
+    streams = [np.random.default_rng(child) for child in np.random.SeedSequence(seed).spawn(n_streams)]
+
+    for first_path in range(start_path, simulations, chunk_size):
+        n_paths = min(chunk_size, simulations - first_path)
+        draws = _draw_chunk(streams, first_path, n_paths, periods, drift, volatility, convention, sampling, dtype)
+
+        # All paths at once: cumulative product of growth factors, or exp of summed log-returns
+        paths = np.empty((n_paths, periods + 1), dtype=dtype)
+        paths[:, 0] = 1
+        if convention == 'log':
+            np.cumsum(draws, axis=1, out=paths[:, 1:])
+            np.exp(paths[:, 1:], out=paths[:, 1:])
+        else:
+            np.cumprod(draws, axis=1, out=paths[:, 1:])
+        del draws
+        paths *= initial_price
+        yield first_path, paths
+
+def simulate_price_paths(initial_price, drift, volatility, periods, simulations, seed=None,
+                         convention='arithmetic', dtype=np.float64, start_path=0, sampling='pseudo_random'):
+    """
+    Get Monte Carlo price paths start_path..simulations - 1 as one array
+    """
+    paths = np.empty((simulations - start_path, periods + 1), dtype=dtype)
+    for first_path, chunk in iter_price_path_chunks(initial_price, drift, volatility, periods, simulations,
+                                                    seed, convention, dtype=dtype, start_path=start_path,
+                                                    sampling=sampling):
+        paths[first_path - start_path:first_path - start_path + len(chunk)] = chunk
+    return paths
+
+def regenerate_paths(initial_price, drift, volatility, periods, seed, convention, start, stop,
+                     sampling='pseudo_random'):
+    """
+    Regenerate paths start..stop - 1 of a run exactly, without generating the paths before them
+    """
+    first = start - start % PATHS_PER_STREAM
+    paths = simulate_price_paths(initial_price, drift, volatility, periods, stop, seed, convention,
+                                 start_path=first, sampling=sampling)
+    return paths[start - first:]
+
+def run_monte_carlo(initial_price, drift, volatility, periods, simulations, seed=None,
+                    convention='arithmetic', keep_paths=20, chunk_size=None, dtype=np.float64,
+                    centroids=SKETCH_CENTROIDS, sampling='pseudo_random', control_variate=False,
+                    threshold=None):
+    """
+    Run a Monte Carlo price simulation and reduce it to per-step statistics
+
+    Paths are generated chunk by chunk and folded into a PathAggregator, so
+    memory is bounded by the chunk size plus the aggregator, a few MB for
+    a year of daily steps however many paths are simulated. Quantiles come
+    from the sketches; mean, standard deviation, min and max are exact.
+
+    Parameters:
+    - keep_paths: Number of leading paths to keep in full, e.g. for plotting
+    - centroids: Sketch centroids per step
+    - sampling: One of SAMPLING_METHODS
+    - control_variate: Adjust the mean with the GBM control of each path
+    - threshold: Price to track the share of paths ending below, if any
+    - other parameters as in iter_price_path_chunks
+
+    Returns:
+    - MonteCarloResult with the aggregator, its statistics and their standard errors
+    """
+    control_mean = gbm_control_mean(initial_price, drift, periods, convention) if control_variate else None
+    aggregator = PathAggregator(periods + 1, keep_paths, centroids, control_mean, threshold)
+    chunks = 0
+    for _, paths in iter_price_path_chunks(initial_price, drift, volatility, periods, simulations,
+                                           seed, convention, chunk_size, dtype, sampling=sampling):
+        control = None
+        if control_variate:
+            control = gbm_control_paths(paths, initial_price, drift, volatility, convention)
+        aggregator.add(paths, control)
+        chunks += 1
+    return MonteCarloResult(aggregator, chunks)
+
+@dataclass
+class AdaptiveProgress:
+    """
+    State of an adaptive Monte Carlo run after a block of paths
+
+    estimates, half_widths and tolerances map each tracked statistic to its
+    final-step value, the half-width of its confidence interval and the
+    largest half-width the target precision allows. stop_reason is None
+    while the run goes on, then 'precision', 'time_budget' or 'max_simulations'.
+    """
+    result: MonteCarloResult
+    simulations: int
+    elapsed: float
+    estimates: dict = field(default_factory=dict)
+    half_widths: dict = field(default_factory=dict)
+    tolerances: dict = field(default_factory=dict)
+    stop_reason: str = None
+
+    @property
+    def precision_ratio(self):
+        """
+        Get the widest confidence interval relative to its tolerance; the target is met at 1 or less
+        """
+        ratios = []
+        for name, half_width in self.half_widths.items():
+            if np.isnan(half_width):
+                return np.inf
+            ratios.append(half_width / self.tolerances[name] if self.tolerances[name] > 0
+                          else (0.0 if half_width == 0 else np.inf))
+        return max(ratios)
+
+def _adaptive_progress(result, simulations, elapsed, tracked, confidence, relative_precision,
+                       probability_precision):
+    # Student t intervals over the replicate blocks; few blocks give wide intervals
+    aggregator = result.aggregator
+    errors = result.standard_errors
+    critical = student_t.ppf((1 + confidence) / 2, aggregator.blocks - 1) if aggregator.blocks > 1 else np.inf
+    progress = AdaptiveProgress(result, simulations, elapsed)
+    for name in tracked:
+        if name == 'Below':
+            estimate = aggregator.probability_below()
+            tolerance = probability_precision
+        else:
+            estimate = float(result.statistics[name][-1])
+            tolerance = relative_precision * abs(estimate)
+        error = errors[name][-1] if name == 'Mean' else errors[name]
+        progress.estimates[name] = estimate
+        progress.half_widths[name] = float(critical * error)
+        progress.tolerances[name] = tolerance
+    return progress
+
+def iter_adaptive_monte_carlo(initial_price, drift, volatility, periods, seed=None, convention='arithmetic',
+                              sampling='pseudo_random', control_variate=False, threshold=None,
+                              tracked=('P5', 'Median', 'P95'), relative_precision=0.01,
+                              probability_precision=0.005, confidence=0.95, time_budget=10.0,
+                              max_simulations=1_000_000, keep_paths=20, centroids=SKETCH_CENTROIDS,
+                              dtype=np.float64):
+    """
+    Run a Monte Carlo price simulation block by block until it is precise enough
+
+    After each block, confidence intervals of the tracked final-step
+    statistics are computed from the spread of the replicate blocks. The
+    run stops once every interval is within its tolerance, the time budget
+    is spent or max_simulations paths are done. Block sizes grow towards
+    the number of paths the target is projected to need, as errors shrink
+    like 1/sqrt(paths). Path i is the same as in run_monte_carlo with the
+    same seed, so a finished run equals a fixed run of as many paths.
+
+    Parameters:
+    - tracked: Statistics to stop on, from ADAPTIVE_STATISTICS; 'Below' is
+      added when a threshold is given
+    - relative_precision: Allowed half-width of the intervals of prices, as
+      a fraction of the estimate
+    - probability_precision: Allowed half-width of the interval of 'Below'
+    - confidence: Confidence level of the intervals
+    - time_budget: Seconds after which no new block is started
+    - max_simulations: Most paths to simulate
+    - other parameters as in run_monte_carlo
+
+    Returns:
+    - Iterator of AdaptiveProgress, one per block; the last has a stop_reason
+    """
+    tracked = list(tracked)
+    if threshold is not None and 'Below' not in tracked:
+        tracked.append('Below')
+    unknown = [name for name in tracked if name not in ADAPTIVE_STATISTICS]
+    if unknown:
+        raise ValueError(f"tracked statistics must be among {', '.join(ADAPTIVE_STATISTICS)}")
+    if 'Below' in tracked and threshold is None:
+        raise ValueError("tracking 'Below' needs a threshold")
+
+    control_mean = gbm_control_mean(initial_price, drift, periods, convention) if control_variate else None
+    aggregator = PathAggregator(periods + 1, keep_paths, centroids, control_mean, threshold)
+    start = time.perf_counter()
+    simulations = 0
+    chunks = 0
+    block = ADAPTIVE_BLOCK_PATHS
+    while True:
+        stop = min(simulations + block, max_simulations)
+        for _, paths in iter_price_path_chunks(initial_price, drift, volatility, periods, stop, seed,
+                                               convention, dtype=dtype, start_path=simulations,
+                                               sampling=sampling):
+            control = None
+            if control_variate:
+                control = gbm_control_paths(paths, initial_price, drift, volatility, convention)
+            aggregator.add(paths, control)
+            chunks += 1
+        simulations = stop
+        elapsed = time.perf_counter() - start
+
+        progress = _adaptive_progress(MonteCarloResult(aggregator, chunks), simulations, elapsed, tracked,
+                                      confidence, relative_precision, probability_precision)
+        ratio = progress.precision_ratio
+        if ratio <= 1:
+            progress.stop_reason = 'precision'
+        elif elapsed >= time_budget:
+            progress.stop_reason = 'time_budget'
+        elif simulations >= max_simulations:
+            progress.stop_reason = 'max_simulations'
+        yield progress
+        if progress.stop_reason is not None:
+            return
+
+        # Project the paths the target needs with a 10% margin, at most doubling, and no more than the time left allows
+        needed = simulations * (1.1 * ratio) ** 2 if np.isfinite(ratio) else 2 * simulations
+        block = min(max(needed - simulations, ADAPTIVE_BLOCK_PATHS), simulations)
+        block = min(block, simulations / elapsed * (time_budget - elapsed)) if elapsed > 0 else block
+        block = max(PATHS_PER_STREAM, -(-int(block) // PATHS_PER_STREAM) * PATHS_PER_STREAM)
+
+def run_adaptive_monte_carlo(*args, **kwargs):
+    """
+    Run iter_adaptive_monte_carlo to the end and return its last AdaptiveProgress
+    """
+    for progress in iter_adaptive_monte_carlo(*args, **kwargs):
+        pass
+    return progress
@@ -5,6 +5,7 @@ import plotly.express as px
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 from datetime import datetime, timedelta
+from utils import make_rng
 
 # Set page configuration
 st.set_page_config(
@@ -392,7 +393,8 @@ with col2:
         st.session_state.crypto_trading['time_period'] = selected_period
 
 # Generate historical price data based on selection
-def generate_price_data(token, period):
+def generate_price_data(token, period, rng=None):
+    rng = make_rng(rng)
     today = datetime.now()
     
     if period == '1w':
@@ -434,7 +436,7 @@ def generate_price_data(token, period):
         trend = np.sin(i / 50) * 0.01
         
         # Add some random daily movement
-        daily_change = np.random.normal(0, 0.02)
+        daily_change = rng.normal(0, 0.02)
         
         # Add some momentum (previous changes affect future changes)
         momentum = 0
@@ -447,7 +449,7 @@ def generate_price_data(token, period):
         
         # Generate volume data (correlated with price changes but with some randomness)
         volume_base = abs(daily_change) * base_value * 1000000  # Higher volume on bigger price moves
-        volume = volume_base * (1 + np.random.normal(0, 0.5))  # Add noise
+        volume = volume_base * (1 + rng.normal(0, 0.5))  # Add noise
         volumes.append(max(0, volume))  # Ensure non-negative
     
     return pd.DataFrame({
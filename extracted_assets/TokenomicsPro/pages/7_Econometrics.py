@@ -4,9 +4,15 @@ import numpy as np
 import plotly.express as px
 import plotly.graph_objects as go
 from utils import get_color_scale
+from monte_carlo import (run_monte_carlo, iter_adaptive_monte_carlo, PathAggregator, PATHS_PER_STREAM,
+                         RETURN_CONVENTIONS, SAMPLING_METHODS, STATISTICS as MONTE_CARLO_STATISTICS)
+import database as db
 import statsmodels.api as sm
 from datetime import datetime, timedelta
 
+# The page can be opened directly, before app.py initialized the database in this process
+db.ensure_initialized()
+
 # Set page configuration
 st.set_page_config(
     page_title="Econometrics - TokenomicsLab",
@@ -117,6 +123,15 @@ if 'econometrics' not in st.session_state.tokenomics_data:
             'periods': 365,
             'volatility': 0.05,
             'drift': 0.002,
+            'convention': 'arithmetic',
+            'sampling': 'pseudo_random',
+            'control_variate': False,
+            'stopping_rule': 'fixed',
+            'target_precision': 0.01,
+            'confidence': 95,
+            'time_budget': 10,
+            'threshold': 0.0,
+            'seed': 42,
             'results': None
         },
         'correlation': {
@@ -134,6 +149,98 @@ if 'econometrics' not in st.session_state.tokenomics_data:
 
 econometrics = st.session_state.tokenomics_data['econometrics']
 
+# Paths kept in full for the chart; the statistics and the final price distribution
+# come from sketches over every path, and any path can be regenerated from the seed
+MONTE_CARLO_KEPT_PATHS = 20
+
+def load_monte_carlo_frame(stored_run):
+    """
+    Rebuild the Monte Carlo results DataFrame from a stored simulation run
+    """
+    columns = {'Date': pd.to_datetime(stored_run['Date'])}
+    for i, path in enumerate(stored_run['paths']):
+        columns[f'Sim {i+1}'] = path
+    for name in MONTE_CARLO_STATISTICS:
+        columns[name] = stored_run[name]
+    return pd.DataFrame(columns)
+
+def monte_carlo_figure(mc_results, simulations):
+    """
+    Plot the kept paths, fan chart bands, mean, min and max of a Monte Carlo results DataFrame
+    """
+    fig = go.Figure()
+    
+    # Add individual paths (limit to 20 for performance)
+    for i in range(1, min(simulations, MONTE_CARLO_KEPT_PATHS) + 1):
+        fig.add_trace(go.Scatter(
+            x=mc_results['Date'],
+            y=mc_results[f'Sim {i}'],
+            mode='lines',
+            opacity=0.2,
+            line=dict(width=1),
+            showlegend=False
+        ))
+    
+    # Fan chart: 5-95% and 25-75% bands across all paths
+    for lower, upper, fill in [('P5', 'P95', 'rgba(0, 0, 255, 0.1)'), ('P25', 'P75', 'rgba(0, 0, 255, 0.2)')]:
+        fig.add_trace(go.Scatter(
+            x=mc_results['Date'],
+            y=mc_results[upper],
+            mode='lines',
+            line=dict(width=0),
+            showlegend=False,
+            hoverinfo='skip'
+        ))
+        fig.add_trace(go.Scatter(
+            x=mc_results['Date'],
+            y=mc_results[lower],
+            mode='lines',
+            line=dict(width=0),
+            fill='tonexty',
+            fillcolor=fill,
+            name=f"{lower[1:]}-{upper[1:]}% range"
+        ))
+    
+    # Add mean, min, max
+    fig.add_trace(go.Scatter(
+        x=mc_results['Date'],
+        y=mc_results['Mean'],
+        mode='lines',
+        name='Mean Price',
+        line=dict(color='blue', width=2)
+    ))
+    
+    fig.add_trace(go.Scatter(
+        x=mc_results['Date'],
+        y=mc_results['Max'],
+        mode='lines',
+        name='Maximum',
+        line=dict(color='green', width=2, dash='dash')
+    ))
+    
+    fig.add_trace(go.Scatter(
+        x=mc_results['Date'],
+        y=mc_results['Min'],
+        mode='lines',
+        name='Minimum',
+        line=dict(color='red', width=2, dash='dash')
+    ))
+    
+    fig.update_layout(
+        title=f"{token_symbol} Price Simulation ({simulations:,} paths)",
+        xaxis_title="Date",
+        yaxis_title="Price (USD)",
+        hovermode="x unified"
+    )
+    return fig
+
+# Why an adaptive run stopped, as shown to the user
+STOP_REASONS = {
+    'precision': "target precision reached",
+    'time_budget': "time budget spent",
+    'max_simulations': "simulation limit reached"
+}
+
 # Tab layout for different econometric models
 tab1, tab2, tab3 = st.tabs([simulation_title, correlation_title, forecast_title])
 
@@ -148,14 +255,51 @@ with tab1:
         
         monte_carlo = econometrics['monte_carlo']
         
+        stopping_rule = st.radio(
+            "Stopping Rule",
+            ['fixed', 'adaptive'],
+            index=['fixed', 'adaptive'].index(monte_carlo.get('stopping_rule', 'fixed')),
+            format_func=lambda name: {'fixed': "Fixed number of paths",
+                                      'adaptive': "Adaptive (stop at target precision)"}[name],
+            horizontal=True,
+            help="Adaptive runs simulate blocks of paths until the final price quantiles are as precise as requested"
+        )
+        
         num_simulations = st.slider(
-            "Number of Simulations",
+            "Number of Simulations" if stopping_rule == 'fixed' else "Maximum Simulations",
             min_value=10,
-            max_value=100,
+            max_value=100000,
             value=monte_carlo['simulations'],
-            step=5
+            step=10
         )
         
+        if stopping_rule == 'adaptive':
+            target_precision = st.slider(
+                "Target Precision (± % of estimate)",
+                min_value=0.1,
+                max_value=10.0,
+                value=float(monte_carlo.get('target_precision', 0.01) * 100),
+                step=0.1,
+                help="Confidence interval half-width of the final 5th, 50th and 95th percentiles"
+            ) / 100
+            
+            confidence = st.select_slider(
+                "Confidence Level (%)",
+                options=[80, 90, 95, 99],
+                value=monte_carlo.get('confidence', 95)
+            )
+            
+            time_budget = st.slider(
+                "Time Budget (seconds)",
+                min_value=1,
+                max_value=60,
+                value=int(monte_carlo.get('time_budget', 10))
+            )
+        else:
+            target_precision = monte_carlo.get('target_precision', 0.01)
+            confidence = monte_carlo.get('confidence', 95)
+            time_budget = monte_carlo.get('time_budget', 10)
+        
         num_periods = st.slider(
             "Simulation Period (Days)",
             min_value=30,
@@ -179,123 +323,221 @@ with tab1:
             value=float(monte_carlo['drift'] * 100),
             step=0.01
         ) / 100
+        
+        convention = st.selectbox(
+            "Return Convention",
+            RETURN_CONVENTIONS,
+            index=RETURN_CONVENTIONS.index(monte_carlo.get('convention', 'arithmetic')),
+            format_func=lambda name: {'arithmetic': "Arithmetic (compounded simple returns)",
+                                      'log': "Log (geometric Brownian motion)"}[name],
+            help="Arithmetic compounds normally distributed daily returns; log draws normally distributed log-returns, so prices stay positive"
+        )
+        
+        sampling = st.selectbox(
+            "Variance Reduction",
+            SAMPLING_METHODS,
+            index=SAMPLING_METHODS.index(monte_carlo.get('sampling', 'pseudo_random')),
+            format_func=lambda name: {'pseudo_random': "None (pseudo-random)",
+                                      'antithetic': "Antithetic variates",
+                                      'latin_hypercube': "Latin hypercube",
+                                      'sobol': "Sobol quasi-random"}[name],
+            help="Antithetic pairs each path with its mirror image; Latin hypercube and Sobol spread the shocks evenly over each block of paths, laid out along a Brownian bridge"
+        )
+        
+        control_variate = st.checkbox(
+            "Control Variate",
+            value=monte_carlo.get('control_variate', False),
+            help="Correct the mean price with a geometric Brownian motion driven by the same shocks, whose expectation is known exactly"
+        )
+        
+        threshold = st.number_input(
+            "Price Threshold (USD)",
+            min_value=0.0,
+            value=float(monte_carlo.get('threshold', 0.0)),
+            format="%.6f",
+            help="Estimate the probability that the final price ends below this price; 0 to skip. Adaptive runs also stop on its precision (±0.5 percentage points)"
+        )
+        
+        seed = st.number_input(
+            "Random Seed",
+            min_value=0,
+            value=int(monte_carlo.get('seed', 42)),
+            step=1,
+            help="The same seed reproduces the same price paths"
+        )
     
-    with col2:
-        st.write("Initial Parameters")
-        st.metric("Initial Price", f"${initial_price:.6f}")
-        st.metric("Expected Annual Return", f"{drift * 365 * 100:.2f}%")
-        st.metric("Annual Volatility", f"{volatility * np.sqrt(365) * 100:.2f}%")
+    # Key of the stored run for the current settings
+    monte_carlo_parameters = {
+        'simulations': num_simulations,
+        'periods': num_periods,
+        'volatility': volatility,
+        'drift': drift,
+        'convention': convention,
+        'sampling': sampling,
+        'control_variate': control_variate,
+        'initial_price': initial_price
+    }
+    if threshold > 0:
+        monte_carlo_parameters['threshold'] = threshold
     
-    if st.button(run_sim_button):
-        with st.spinner("Running Monte Carlo simulation..."):
-            # Generate price paths using Monte Carlo simulation
-            price_paths = []
-            
-            for i in range(num_simulations):
-                # Generate random returns
-                random_returns = np.random.normal(drift, volatility, num_periods)
-                
-                # Calculate price path
-                price_path = [initial_price]
-                for r in random_returns:
-                    price_path.append(price_path[-1] * (1 + r))
-                
-                price_paths.append(price_path)
-            
-            # Convert to DataFrame
-            dates = [datetime.now() + timedelta(days=i) for i in range(num_periods + 1)]
-            
-            sim_results = pd.DataFrame({
-                'Date': dates
-            })
-            
-            for i, path in enumerate(price_paths):
-                sim_results[f'Sim {i+1}'] = path
-            
-            # Calculate statistics
-            sim_results['Mean'] = sim_results.iloc[:, 1:num_simulations+1].mean(axis=1)
-            sim_results['Max'] = sim_results.iloc[:, 1:num_simulations+1].max(axis=1)
-            sim_results['Min'] = sim_results.iloc[:, 1:num_simulations+1].min(axis=1)
-            sim_results['Median'] = sim_results.iloc[:, 1:num_simulations+1].median(axis=1)
-            
-            # Store results
+    # Reopen a stored run instead of showing nothing until the simulation is re-run
+    if monte_carlo.get('results') is None:
+        stored_run = db.get_simulation_run('monte_carlo', monte_carlo_parameters, int(seed))
+        if stored_run is not None and 'sketch_means' in stored_run:
+            stored_aggregator = PathAggregator.from_arrays(stored_run)
             econometrics['monte_carlo'] = {
                 'simulations': num_simulations,
                 'periods': num_periods,
                 'volatility': volatility,
                 'drift': drift,
-                'results': sim_results.to_dict()
+                'convention': convention,
+                'sampling': sampling,
+                'control_variate': control_variate,
+                'seed': int(seed),
+                'threshold': threshold,
+                'results': load_monte_carlo_frame(stored_run),
+                'final_distribution': stored_aggregator.sketch.distribution(-1),
+                'standard_errors': stored_aggregator.standard_errors(),
+                'probability_below': stored_aggregator.probability_below()
             }
-            
-            st.session_state.tokenomics_data['econometrics'] = econometrics
-            
-            st.success("Monte Carlo simulation completed!")
+            st.caption(f"Loaded the simulation saved on {stored_run.run['created_at'][:10]}")
     
-    # Display simulation results if available
-    if econometrics['monte_carlo'].get('results'):
-        # Reconstruct DataFrame from stored dict
-        mc_results = pd.DataFrame(econometrics['monte_carlo']['results'])
+    with col2:
+        st.write("Initial Parameters")
+        st.metric("Initial Price", f"${initial_price:.6f}")
+        st.metric("Expected Annual Return", f"{drift * 365 * 100:.2f}%")
+        st.metric("Annual Volatility", f"{volatility * np.sqrt(365) * 100:.2f}%")
+    
+    if st.button(run_sim_button):
+        dates = pd.date_range(datetime.now(), periods=num_periods + 1, freq='D')
+        simulation_options = dict(
+            seed=int(seed),
+            convention=convention,
+            keep_paths=MONTE_CARLO_KEPT_PATHS,
+            sampling=sampling,
+            control_variate=control_variate,
+            threshold=threshold if threshold > 0 else None
+        )
         
-        # Plot the simulation results
-        fig = go.Figure()
+        if stopping_rule == 'adaptive':
+            # Simulate block by block, redrawing the chart after each block, until the
+            # final quantiles are precise enough or the budget is spent
+            progress_bar = st.progress(0.0)
+            status = st.empty()
+            live_chart = st.empty()
+            for progress in iter_adaptive_monte_carlo(
+                initial_price,
+                drift,
+                volatility,
+                num_periods,
+                relative_precision=target_precision,
+                confidence=confidence / 100,
+                time_budget=time_budget,
+                max_simulations=num_simulations,
+                **simulation_options
+            ):
+                ratio = progress.precision_ratio
+                progress_bar.progress(min(1.0, max(progress.elapsed / time_budget,
+                                                   progress.simulations / num_simulations,
+                                                   1 / ratio ** 2 if ratio > 0 else 1.0)))
+                status.caption(f"{progress.simulations:,} paths in {progress.elapsed:.1f} s, "
+                               f"widest {confidence}% interval at {ratio:.2f}x the target")
+                live_chart.plotly_chart(monte_carlo_figure(progress.result.to_frame(dates), progress.simulations),
+                                        use_container_width=True, key=f"monte_carlo_progress_{progress.simulations}")
+            progress_bar.empty()
+            status.empty()
+            live_chart.empty()
+            
+            result = progress.result
+            simulations = progress.simulations
+            convergence = {
+                'stop_reason': progress.stop_reason,
+                'simulations': progress.simulations,
+                'elapsed': progress.elapsed,
+                'precision_ratio': progress.precision_ratio
+            }
+        else:
+            with st.spinner("Running Monte Carlo simulation..."):
+                # Paths are generated in chunks and folded into running statistics and quantile sketches
+                result = run_monte_carlo(
+                    initial_price,
+                    drift,
+                    volatility,
+                    num_periods,
+                    num_simulations,
+                    **simulation_options
+                )
+            simulations = num_simulations
+            convergence = None
+        
+        sim_results = result.to_frame(dates)
+        
+        # Persist the run so reopening the page with these parameters does not re-run it;
+        # adaptive runs are stored under the number of paths they actually simulated
+        db.save_simulation_run(
+            'monte_carlo',
+            {**monte_carlo_parameters, 'simulations': simulations},
+            int(seed),
+            {
+                'Date': dates.to_numpy(dtype='datetime64[s]'),
+                **result.aggregator.to_arrays(),
+                **{name: result.statistics[name] for name in MONTE_CARLO_STATISTICS}
+            },
+            user_id=(st.session_state.get('user') or {}).get('id')
+        )
         
-        # Add individual paths (limit to 20 for performance)
-        for i in range(1, min(econometrics['monte_carlo']['simulations'], 20) + 1):
-            fig.add_trace(go.Scatter(
-                x=mc_results['Date'],
-                y=mc_results[f'Sim {i}'],
-                mode='lines',
-                opacity=0.2,
-                line=dict(width=1),
-                showlegend=False
-            ))
-        
-        # Add mean, min, max
-        fig.add_trace(go.Scatter(
-            x=mc_results['Date'],
-            y=mc_results['Mean'],
-            mode='lines',
-            name='Mean Price',
-            line=dict(color='blue', width=2)
-        ))
+        # Store results
+        econometrics['monte_carlo'] = {
+            'simulations': num_simulations,
+            'periods': num_periods,
+            'volatility': volatility,
+            'drift': drift,
+            'convention': convention,
+            'sampling': sampling,
+            'control_variate': control_variate,
+            'stopping_rule': stopping_rule,
+            'target_precision': target_precision,
+            'confidence': confidence,
+            'time_budget': time_budget,
+            'threshold': threshold,
+            'seed': int(seed),
+            'results': sim_results,
+            'simulated_paths': simulations,
+            'final_distribution': result.final_distribution(),
+            'standard_errors': result.standard_errors,
+            'probability_below': result.aggregator.probability_below(),
+            'convergence': convergence
+        }
         
-        fig.add_trace(go.Scatter(
-            x=mc_results['Date'],
-            y=mc_results['Max'],
-            mode='lines',
-            name='Maximum',
-            line=dict(color='green', width=2, dash='dash')
-        ))
+        st.session_state.tokenomics_data['econometrics'] = econometrics
         
-        fig.add_trace(go.Scatter(
-            x=mc_results['Date'],
-            y=mc_results['Min'],
-            mode='lines',
-            name='Minimum',
-            line=dict(color='red', width=2, dash='dash')
-        ))
+        st.success("Monte Carlo simulation completed!")
+    
+    # Display simulation results if available
+    if econometrics['monte_carlo'].get('results') is not None:
+        mc_results = econometrics['monte_carlo']['results']
         
-        fig.update_layout(
-            title=f"{token_symbol} Price Simulation ({econometrics['monte_carlo']['simulations']} paths)",
-            xaxis_title="Date",
-            yaxis_title="Price (USD)",
-            hovermode="x unified"
-        )
+        # Plot the simulation results
+        simulated_paths = econometrics['monte_carlo'].get('simulated_paths', econometrics['monte_carlo']['simulations'])
+        fig = monte_carlo_figure(mc_results, simulated_paths)
         
         st.plotly_chart(fig, use_container_width=True)
         
-        # Price distribution at the end of simulation
-        final_prices = mc_results.iloc[-1, 1:econometrics['monte_carlo']['simulations']+1]
+        # Price distribution at the end of simulation, from the weighted centroids of the final step's sketch
+        final_stats = mc_results.iloc[-1]
+        prices, weights = econometrics['monte_carlo']['final_distribution']
         
         fig = px.histogram(
-            final_prices,
+            x=prices,
+            y=weights,
+            histfunc='sum',
             nbins=20,
             title=f"Distribution of Simulated Prices at End of Period",
-            labels={'value': 'Price (USD)', 'count': 'Frequency'}
+            labels={'x': 'Price (USD)', 'y': 'Frequency'}
         )
         
-        fig.add_vline(x=final_prices.mean(), line_dash="dash", line_color="red",
-                     annotation_text=f"Mean: ${final_prices.mean():.6f}")
+        fig.add_vline(x=final_stats['Mean'], line_dash="dash", line_color="red",
+                     annotation_text=f"Mean: ${final_stats['Mean']:.6f}")
         
         st.plotly_chart(fig, use_container_width=True)
         
@@ -303,13 +545,41 @@ with tab1:
         col1, col2, col3 = st.columns(3)
         
         with col1:
-            st.metric("Final Mean Price", f"${final_prices.mean():.6f}", f"{(final_prices.mean()/initial_price - 1) * 100:.2f}%")
+            st.metric("Final Mean Price", f"${final_stats['Mean']:.6f}", f"{(final_stats['Mean']/initial_price - 1) * 100:.2f}%")
         
         with col2:
-            st.metric("Final Median Price", f"${final_prices.median():.6f}", f"{(final_prices.median()/initial_price - 1) * 100:.2f}%")
+            st.metric("Final Median Price", f"${final_stats['Median']:.6f}", f"{(final_stats['Median']/initial_price - 1) * 100:.2f}%")
         
         with col3:
-            st.metric("95th Percentile", f"${np.percentile(final_prices, 95):.6f}")
+            st.metric("95th Percentile", f"${final_stats['P95']:.6f}")
+        
+        # Monte Carlo error of the estimates, from the spread of independent blocks of paths
+        standard_errors = econometrics['monte_carlo'].get('standard_errors')
+        if standard_errors is not None and not np.isnan(standard_errors['Mean'][-1]):
+            st.caption(
+                f"Standard errors: mean ±${standard_errors['Mean'][-1]:.6f}, "
+                f"median ±${standard_errors['Median']:.6f}, "
+                f"5th percentile ±${standard_errors['P5']:.6f}, "
+                f"95th percentile ±${standard_errors['P95']:.6f}"
+            )
+        elif standard_errors is not None:
+            st.caption(f"Standard errors need at least two blocks of {PATHS_PER_STREAM:,} paths")
+        
+        probability_below = econometrics['monte_carlo'].get('probability_below')
+        if probability_below is not None:
+            below_error = standard_errors.get('Below', np.nan) if standard_errors is not None else np.nan
+            st.metric(
+                f"Probability of Ending Below ${econometrics['monte_carlo']['threshold']:.6f}",
+                f"{probability_below * 100:.2f}%" + (f" ± {below_error * 100:.2f} pp" if not np.isnan(below_error) else "")
+            )
+        
+        convergence = econometrics['monte_carlo'].get('convergence')
+        if convergence is not None:
+            st.caption(
+                f"Adaptive run stopped after {convergence['simulations']:,} paths in {convergence['elapsed']:.1f} s: "
+                f"{STOP_REASONS[convergence['stop_reason']]} "
+                f"(widest interval at {convergence['precision_ratio']:.2f}x the target)"
+            )
 
 with tab2:
     st.subheader(correlation_title)
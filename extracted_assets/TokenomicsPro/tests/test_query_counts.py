@@ -0,0 +1,61 @@
+"""
+Query-count regression tests for the record listings
+
+Each listing must run a fixed number of SQL statements however many rows it
+returns, so a lazy load slipping back in (one query per row) fails here.
+
+Run from the TokenomicsPro directory:
+    python -m pytest tests
+"""
+import os
+import sys
+
+import pytest
+
+# An in-memory database, set before database.py creates its engine
+os.environ['DATABASE_URL'] = 'sqlite://'
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import database as db
+
+ROW_COUNTS = (1, 5)
+
+
+@pytest.fixture(scope='module', autouse=True)
+def initialized_db():
+    db.init_db()
+
+
+@pytest.fixture(scope='module', params=ROW_COUNTS)
+def user_id(request):
+    """A new user with the given number of projects (each with a token), models and systems"""
+    rows = request.param
+    user = db.create_user(f"queries_{rows}", f"queries_{rows}@example.com", "password")
+    for i in range(rows):
+        project = db.create_project(f"Project {i}", user.id)
+        db.create_token(project.id, f"Token {i}", f"TK{i}", "utility", 1_000_000, initial_price="0.05")
+        db.create_tokenomics_model(f"Model {i}", "", user.id, "standard", 1_000_000)
+        db.create_cryptoeconomic_system(f"System {i}", "", user.id, {})
+    db.read_cache.clear()
+    return user.id
+
+
+def count(listing, *args):
+    """Number of statements a listing runs, bypassing the read cache"""
+    db.read_cache.clear()
+    with db.count_queries() as statements:
+        records = listing(*args)
+    assert records
+    return len(statements)
+
+
+def test_list_projects_runs_two_queries(user_id):
+    assert count(db.list_projects, user_id) == 2
+
+
+@pytest.mark.parametrize('listing', ['list_tokenomics_models', 'list_cryptoeconomic_systems'])
+def test_user_listings_run_one_query(user_id, listing):
+    assert count(getattr(db, listing), user_id) == 1
+
+
+def test_list_users_runs_one_query(user_id):
+    assert count(db.list_users) == 1
@@ -0,0 +1,78 @@
+"""
+Benchmark for the fitted forecast model cache
+
+Times, for ARIMA and SARIMAX on a simulated price series, a fit from
+scratch, a repeat forecast with another horizon and confidence level
+(served from the cache), and a refit after new months were simulated,
+warm-started from the previous parameters.
+
+Run from the TokenomicsLab directory:
+    python benchmarks/forecast_cache.py
+"""
+import os
+import sys
+import time
+import warnings
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from models.forecast import FORECAST_MODELS, FittedModelCache, forecast
+from models.tokenomics import TokenomicsModel
+
+MONTHS = 120
+NEW_MONTHS = 6
+REPEATS = 5
+
+
+def build_series():
+    """Price series of a 12-category model, and the same simulation NEW_MONTHS months longer"""
+    model = TokenomicsModel("Base", 1_000_000_000)
+    categories = [f"Category_{i}" for i in range(12)]
+    model.set_distribution({category: 100 / len(categories) for category in categories})
+    for i, category in enumerate(categories):
+        model.set_vesting_schedule(category, [(3 * i + m, 100 / 24) for m in range(24)])
+    short = model.simulate_token_price(MONTHS, 1.0, volatility=0.1, rng=7)['Price']
+    long = model.simulate_token_price(MONTHS + NEW_MONTHS, 1.0, volatility=0.1, rng=7)['Price']
+    return short, long
+
+
+def timed(function):
+    """Best wall time of REPEATS calls, in milliseconds"""
+    best = float('inf')
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main():
+    warnings.simplefilter('ignore')
+    short, long = build_series()
+
+    for model_type in FORECAST_MODELS:
+        def cold():
+            return forecast(short, model_type, 12, 95, cache=FittedModelCache())
+
+        cache = FittedModelCache()
+        forecast(short, model_type, 12, 95, cache=cache)
+
+        def repeat():
+            return forecast(short, model_type, 24, 80, cache=cache)
+
+        def cold_new_data():
+            return forecast(long, model_type, 12, 95, cache=FittedModelCache())
+
+        def warm_new_data():
+            warm = FittedModelCache()
+            warm.fit(short, model_type)
+            start = time.perf_counter()
+            forecast(long, model_type, 12, 95, cache=warm)
+            return time.perf_counter() - start
+
+        warm_ms = min(warm_new_data() for _ in range(REPEATS)) * 1000
+        print(f"{model_type:<8} cold fit {timed(cold):7.1f} ms   cached forecast {timed(repeat):6.1f} ms   "
+              f"+{NEW_MONTHS} months: cold {timed(cold_new_data):7.1f} ms, warm start {warm_ms:7.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""
+Benchmark for the array-backed agent-based holder simulation
+
+Reports memory per holder and the time of one simulated month at 1M holders,
+and how much each cohort sells in the month its cliff ends.
+
+Run from the TokenomicsLab directory:
+    python benchmarks/holder_simulation.py
+"""
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from models.agents import HolderSimulation
+from models.tokenomics import TokenomicsModel
+
+N_HOLDERS = 1_000_000
+MONTHS = 36
+
+
+def build_model():
+    """Build a model with an immediate public sale and cliff-vested team and investor tranches"""
+    model = TokenomicsModel("Holders", 1_000_000_000)
+    model.set_distribution({"Public": 40, "Team": 20, "Investors": 25, "Treasury": 15})
+    model.set_vesting_schedule("Public", [(0, 100)])
+    model.set_vesting_schedule("Team", [(12 + m, 100 / 24) for m in range(24)])
+    model.set_vesting_schedule("Investors", [(6, 25)] + [(6 + m, 75 / 18) for m in range(1, 19)])
+    model.set_vesting_schedule("Treasury", [(m, 100 / 36) for m in range(36)])
+    return model
+
+
+def main():
+    model = build_model()
+    for dtype in (np.float64, np.float32):
+        simulation = HolderSimulation(model, N_HOLDERS, 1.0, rng=0, dtype=dtype)
+        start = time.perf_counter()
+        result = simulation.run(MONTHS)
+        elapsed = time.perf_counter() - start
+        print(f"{np.dtype(dtype).name}: {simulation.nbytes / len(simulation):.0f} bytes per holder "
+              f"({simulation.nbytes / 2**20:.1f} MiB), "
+              f"{elapsed / (MONTHS + 1) * 1000:.1f} ms per month at {N_HOLDERS:,} holders, "
+              f"final price {result['Price'][-1]:.4f}, Gini {simulation.gini():.3f}")
+
+    print("Tokens sold around each cliff (float64):")
+    simulation = HolderSimulation(model, N_HOLDERS, 1.0, rng=0)
+    result = simulation.run(MONTHS)
+    for category, cliff in [("Investors", 6), ("Team", 12)]:
+        sold = result[f"{category}_Sold"]
+        print(f"  {category:<10} month {cliff - 1}: {sold[cliff - 1]:14,.0f}  "
+              f"month {cliff}: {sold[cliff]:14,.0f}  month {cliff + 1}: {sold[cliff + 1]:14,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""
+Benchmark for the process-pool parameter sweep
+
+Run from the TokenomicsLab directory:
+    python benchmarks/parameter_sweep.py
+"""
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from models.tokenomics import UtilityTokenModel
+from models.sweep import ParameterSweep, latin_hypercube_design
+
+N_CONFIGS = 10_000
+MONTHS = 60
+
+
+def build_model():
+    """Build a utility token model with a few vested categories"""
+    model = UtilityTokenModel("Sweep", 1_000_000_000, 100_000, 0.05)
+    model.set_distribution({"Team": 20, "Investors": 25, "Ecosystem": 35, "Public": 20})
+    model.set_vesting_schedule("Team", [(12 + m, 100 / 24) for m in range(24)])
+    model.set_vesting_schedule("Investors", [(6 + m, 100 / 18) for m in range(18)])
+    model.set_vesting_schedule("Ecosystem", [(m, 100 / 48) for m in range(48)])
+    return model
+
+
+def main():
+    design = latin_hypercube_design({
+        "volatility": (0.05, 0.5),
+        "user_growth_rate": (0.0, 0.15),
+        "tokens_per_user": (100.0, 10_000.0),
+        "vesting_scale": (0.5, 2.0),
+    }, N_CONFIGS, seed=1)
+
+    reference = None
+    cpu_count = os.cpu_count() or 1
+    for workers in sorted({1, 2, 4, cpu_count}):
+        if workers > cpu_count:
+            continue
+        sweep = ParameterSweep(build_model(), design, MONTHS, 1.0, seed=7)
+        start = time.perf_counter()
+        result = sweep.run(max_workers=workers)
+        elapsed = time.perf_counter() - start
+
+        if reference is None:
+            reference = result.metrics
+        identical = np.array_equal(reference, result.metrics)
+        print(f"{workers:>2} workers: {N_CONFIGS} configs in {elapsed:6.2f} s "
+              f"({N_CONFIGS / elapsed:8.0f} configs/s, identical to 1 worker: {identical})")
+
+
+if __name__ == "__main__":
+    main()
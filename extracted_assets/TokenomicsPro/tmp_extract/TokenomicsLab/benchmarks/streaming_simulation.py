@@ -0,0 +1,76 @@
+"""
+Benchmark for step-wise simulation history: DataFrame appends vs SimulationBuffer
+
+Both variants run the same random walk with a 5-step momentum term, one row
+per simulated day, the way the live market simulation page does.
+
+Run from the TokenomicsLab directory:
+    python benchmarks/streaming_simulation.py
+"""
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from models.stream import SimulationBuffer, next_batch, simulate_steps
+
+COLUMNS = ['Day', 'Price', 'Volume']
+HORIZONS = (365, 1095, 3650)
+BATCH = 30
+
+
+def next_row(last_price, recent_prices, day, rng):
+    """Compute one day of a momentum random walk"""
+    momentum = 0.0
+    if len(recent_prices) == 5:
+        momentum = (recent_prices[-1] / recent_prices[0] - 1) * 0.02
+    price = max(0.01, last_price * (1 + rng.normal(momentum, 0.02)))
+    return {'Day': day, 'Price': price, 'Volume': price * rng.uniform(1e5, 2e5)}
+
+
+def run_dataframe(days, seed):
+    """Grow a DataFrame with pd.concat every day, as the pages used to"""
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame({'Day': [0], 'Price': [1.0], 'Volume': [1e5]})
+    for day in range(1, days + 1):
+        recent = df.tail(5)['Price'].values if len(df) >= 5 else []
+        row = next_row(df.iloc[-1]['Price'], recent, day, rng)
+        df = pd.concat([df, pd.DataFrame([row])], ignore_index=True)
+    return df['Price'].to_numpy()
+
+
+def run_buffer(days, seed):
+    """Append to a preallocated buffer, pulling BATCH steps at a time"""
+    rng = np.random.default_rng(seed)
+    buffer = SimulationBuffer(COLUMNS, capacity=days + 1)
+    buffer.append({'Day': 0, 'Price': 1.0, 'Volume': 1e5})
+
+    def step(history, day):
+        recent = history.tail('Price', 5) if len(history) >= 5 else []
+        return next_row(history.last_row()['Price'], recent, day, rng)
+
+    steps = simulate_steps(step, buffer, start=1, stop=days + 1)
+    while next_batch(steps, BATCH):
+        pass
+    return buffer['Price']
+
+
+def main():
+    for days in HORIZONS:
+        timings = {}
+        prices = {}
+        for name, run in [('DataFrame', run_dataframe), ('Buffer', run_buffer)]:
+            start = time.perf_counter()
+            prices[name] = run(days, seed=0)
+            timings[name] = time.perf_counter() - start
+        identical = np.array_equal(prices['DataFrame'], prices['Buffer'])
+        print(f"{days:5d} days: DataFrame {timings['DataFrame']:7.3f} s, "
+              f"buffer {timings['Buffer']:7.3f} s "
+              f"({timings['DataFrame'] / timings['Buffer']:6.1f}x, identical: {identical})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,266 @@
+from typing import Dict, Optional, Sequence, Union
+
+import numpy as np
+
+from models.results import SimulationResult
+from models.rng import SeedLike, make_rng
+from models.stream import SimulationBuffer
+from models.tokenomics import TokenomicsModel
+
+# Holder behaviour types; the per-behaviour arrays below follow this order
+BEHAVIOURS = ('holder', 'trader', 'staker', 'profit_taker')
+
+DEFAULT_BEHAVIOUR_MIX = (0.4, 0.3, 0.2, 0.1)
+
+# Monthly chance of placing a sell order, and the share of the liquid balance offered
+SELL_PROBABILITY = np.array([0.01, 0.15, 0.02, 0.05])
+SELL_FRACTION = np.array([0.2, 0.5, 0.1, 0.5])
+
+# Extra chance of selling in a month the holder receives unlocked tokens
+UNLOCK_SELL_PROBABILITY = np.array([0.05, 0.3, 0.05, 0.6])
+
+# Extra chance of selling per unit of unrealized gain (capped at +100%)
+PROFIT_SELL_PROBABILITY = np.array([0.0, 0.1, 0.0, 0.5])
+
+# Monthly chance of placing a buy order, and its size relative to current holdings
+BUY_PROBABILITY = np.array([0.03, 0.15, 0.05, 0.05])
+BUY_FRACTION = np.array([0.1, 0.3, 0.1, 0.2])
+
+# Extra chance of following the last month's price move (buy on rises, sell on falls)
+MOMENTUM_PROBABILITY = np.array([0.0, 1.0, 0.0, 0.2])
+
+# Monthly chance of staking half the liquid balance or unstaking half the stake
+STAKE_PROBABILITY = np.array([0.01, 0.0, 0.3, 0.0])
+UNSTAKE_PROBABILITY = np.array([0.01, 0.1, 0.01, 0.1])
+
+
+class HolderSimulation:
+    """Agent-based simulation of individual token holders, stored as NumPy columns"""
+
+    def __init__(self, model: TokenomicsModel, n_holders: int, initial_price: float,
+                 volatility: float = 0.1, market_impact: float = 0.5,
+                 behaviour_mix: Sequence[float] = DEFAULT_BEHAVIOUR_MIX,
+                 cohort_sizes: Optional[Dict[str, int]] = None,
+                 rng: SeedLike = None,
+                 dtype: Union[str, np.dtype] = np.float64):
+        """
+        Initialize a holder population
+
+        Every holder belongs to one cohort (a distribution category) and receives
+        a fixed share of that category's tokens as the model's vesting schedule
+        releases them. Shares within a cohort follow a Pareto distribution, so a
+        few holders own most of each allocation. Each holder has one behaviour
+        type that sets its trading and staking probabilities.
+
+        Args:
+            model (TokenomicsModel): Model whose distribution and vesting feed the holders
+            n_holders (int): Number of holders
+            initial_price (float): Initial token price, also the cost basis of vested tokens
+            volatility (float, optional): Random monthly price shock factor
+            market_impact (float, optional): Price change per unit of net order flow
+                relative to the liquid supply
+            behaviour_mix (Sequence[float], optional): Share of holders of each behaviour,
+                in BEHAVIOURS order
+            cohort_sizes (Dict[str, int], optional): Holders per category; by default
+                n_holders is split in proportion to the distribution
+            rng (int, Generator, optional): Seed or random generator
+            dtype (str, np.dtype, optional): Storage dtype of the per-holder amounts;
+                np.float32 halves their memory
+        """
+        self.model = model
+        self.categories = list(model.distribution.keys())
+        self.initial_price = initial_price
+        self.volatility = volatility
+        self.market_impact = market_impact
+        self.rng = make_rng(rng)
+        self.dtype = np.dtype(dtype)
+
+        if cohort_sizes is None:
+            cohort_sizes = self._split_holders(n_holders)
+        sizes = np.array([cohort_sizes.get(category, 0) for category in self.categories])
+        if sizes.sum() != n_holders:
+            raise ValueError(f"Cohort sizes must sum to {n_holders}, got {sizes.sum()}")
+
+        n_behaviours = len(BEHAVIOURS)
+        if len(behaviour_mix) != n_behaviours or not np.isclose(sum(behaviour_mix), 1.0):
+            raise ValueError(f"Behaviour mix must have {n_behaviours} shares summing to 1")
+
+        # Per-holder columns
+        self.cohort = np.repeat(np.arange(len(self.categories), dtype=np.int16), sizes)
+        self.behaviour = self.rng.choice(n_behaviours, size=n_holders, p=behaviour_mix).astype(np.int8)
+        weight = self.rng.pareto(1.5, n_holders) + 1.0
+        weight /= np.bincount(self.cohort, weights=weight, minlength=len(self.categories))[self.cohort]
+        self.weight = weight.astype(self.dtype)
+        self.balance = np.zeros(n_holders, dtype=self.dtype)
+        self.staked = np.zeros(n_holders, dtype=self.dtype)
+        self.cost_basis = np.full(n_holders, initial_price, dtype=self.dtype)
+
+        self.price = initial_price
+        self.last_price = initial_price
+        self.released = np.zeros(len(self.categories))
+
+    def _split_holders(self, n_holders: int) -> Dict[str, int]:
+        """Split holders across categories in proportion to their allocation"""
+        shares = np.array(list(self.model.distribution.values())) / 100
+        sizes = np.floor(shares * n_holders).astype(int)
+        sizes[np.argmax(shares)] += n_holders - sizes.sum()
+        return dict(zip(self.categories, sizes))
+
+    def __len__(self) -> int:
+        return len(self.balance)
+
+    @property
+    def nbytes(self) -> int:
+        """Memory held by the per-holder columns"""
+        return sum(column.nbytes for column in (self.cohort, self.behaviour, self.weight,
+                                                self.balance, self.staked, self.cost_basis))
+
+    @property
+    def columns(self):
+        """Names of the rows returned by step, in order"""
+        return (['Month', 'Price', 'Circulating_Supply', 'Staked_Tokens', 'Buy_Volume',
+                 'Sell_Volume', 'Holders', 'Top_1pct_Share', 'HHI']
+                + [f'{category}_Sold' for category in self.categories])
+
+    def step(self, month: int) -> Dict[str, float]:
+        """
+        Advance the population by one month
+
+        Vested tokens are unlocked first, then every holder decides at once
+        whether to sell, buy, stake or unstake. Buy and sell orders are matched
+        pro rata and the unmatched imbalance moves the price.
+
+        Args:
+            month (int): Month to simulate (0-indexed); month 0 only unlocks tokens
+
+        Returns:
+            Dict[str, float]: Aggregate metrics of the month, with the tokens sold
+                by each cohort as '{category}_Sold'
+        """
+        rng = self.rng
+        behaviour = self.behaviour
+
+        # Unlock this month's vested tokens, at the initial price as cost basis
+        released = np.fromiter(self.model.calculate_released_tokens(month).values(),
+                               dtype=float, count=len(self.categories))
+        unlocked = (released - self.released)[self.cohort] * self.weight
+        self.released = released
+        self._add_tokens(unlocked, self.initial_price)
+
+        sold_by_cohort = np.zeros(len(self.categories))
+        buy_volume = sell_volume = 0.0
+        if month > 0:
+            holdings = self.balance + self.staked
+            gain = np.clip(self.price / self.cost_basis - 1, 0, 1)
+            momentum = self.price / self.last_price - 1
+
+            # One draw per holder splits it into seller, buyer or neither
+            p_sell = (SELL_PROBABILITY[behaviour]
+                      + UNLOCK_SELL_PROBABILITY[behaviour] * (unlocked > 0)
+                      + PROFIT_SELL_PROBABILITY[behaviour] * gain
+                      + MOMENTUM_PROBABILITY[behaviour] * max(-momentum, 0))
+            p_buy = BUY_PROBABILITY[behaviour] + MOMENTUM_PROBABILITY[behaviour] * max(momentum, 0)
+            draw = rng.random(len(self))
+            sells = draw < p_sell
+            buys = ~sells & (draw < p_sell + p_buy)
+
+            sell_orders = np.where(sells, SELL_FRACTION[behaviour] * self.balance, 0)
+            order_base = np.maximum(holdings, holdings.mean())
+            buy_orders = np.where(buys, BUY_FRACTION[behaviour] * order_base, 0)
+
+            # Match orders pro rata; the unmatched side moves the price
+            sell_volume = float(sell_orders.sum())
+            buy_volume = float(buy_orders.sum())
+            executed = min(sell_volume, buy_volume)
+            sold = sell_orders * (executed / sell_volume if sell_volume else 0.0)
+            bought = buy_orders * (executed / buy_volume if buy_volume else 0.0)
+            self.balance -= sold.astype(self.dtype)
+            self._add_tokens(bought, self.price)
+            sold_by_cohort = np.bincount(self.cohort, weights=sold, minlength=len(self.categories))
+
+            # Stake or unstake half of the liquid balance or stake
+            draw = rng.random(len(self))
+            staking = np.where(draw < STAKE_PROBABILITY[behaviour], 0.5 * self.balance, 0)
+            unstaking = np.where(draw > 1 - UNSTAKE_PROBABILITY[behaviour], 0.5 * self.staked, 0)
+            self.balance += (unstaking - staking).astype(self.dtype)
+            self.staked += (staking - unstaking).astype(self.dtype)
+
+            liquid = max(float(self.balance.sum()), 1.0)
+            shock = rng.uniform(-self.volatility, self.volatility)
+            self.last_price = self.price
+            self.price = max(1e-6, self.price * (1 + self.market_impact * (buy_volume - sell_volume) / liquid)
+                             * (1 + shock))
+
+        row = self._summarize()
+        row.update({'Month': month, 'Buy_Volume': buy_volume, 'Sell_Volume': sell_volume})
+        row.update({f'{category}_Sold': value for category, value in zip(self.categories, sold_by_cohort)})
+        return row
+
+    def _add_tokens(self, amount: np.ndarray, price: float) -> None:
+        """Credit tokens to liquid balances, averaging their price into the cost basis"""
+        holdings = self.balance + self.staked
+        total = holdings + amount
+        np.divide(self.cost_basis * holdings + price * amount, total,
+                  out=self.cost_basis, where=total > 0, casting='unsafe')
+        self.balance += amount.astype(self.dtype)
+
+    def _summarize(self) -> Dict[str, float]:
+        """Aggregate price, supply and concentration metrics, all O(holders)"""
+        holdings = self.balance + self.staked
+        total = float(holdings.sum())
+        top = max(len(self) // 100, 1)
+        top_holdings = np.partition(holdings, len(self) - top)[len(self) - top:]
+        shares = holdings / total if total > 0 else holdings
+        return {
+            'Price': self.price,
+            'Circulating_Supply': total,
+            'Staked_Tokens': float(self.staked.sum()),
+            'Holders': float(np.count_nonzero(holdings)),
+            'Top_1pct_Share': float(top_holdings.sum()) / total if total > 0 else 0.0,
+            'HHI': float(np.dot(shares, shares))
+        }
+
+    def gini(self) -> float:
+        """
+        Get the Gini coefficient of current holdings
+
+        Sorts all holdings, so it costs O(n log n) and is not computed per step.
+
+        Returns:
+            float: 0 for perfectly equal holdings, close to 1 when one holder owns everything
+        """
+        holdings = np.sort(self.balance + self.staked).astype(float)
+        total = holdings.sum()
+        if total <= 0:
+            return 0.0
+        n = len(holdings)
+        return float((2 * np.arange(1, n + 1) - n - 1) @ holdings / (n * total))
+
+    def cohort_holdings(self) -> Dict[str, float]:
+        """
+        Get the tokens currently held by each cohort
+
+        Returns:
+            Dict[str, float]: Liquid plus staked tokens per category
+        """
+        holdings = np.bincount(self.cohort, weights=self.balance + self.staked,
+                               minlength=len(self.categories))
+        return dict(zip(self.categories, holdings))
+
+    def run(self, months: int) -> SimulationResult:
+        """
+        Simulate months 0..months
+
+        Args:
+            months (int): Last month to simulate
+
+        Returns:
+            SimulationResult: One row per month with the aggregate metrics and
+                the category release matrix
+        """
+        buffer = SimulationBuffer(self.columns, capacity=months + 1)
+        for month in range(months + 1):
+            buffer.append(self.step(month))
+
+        metrics = {name: buffer[name] for name in self.columns if name != 'Month'}
+        return SimulationResult(metrics, self.categories, self.model.get_release_matrix(months))
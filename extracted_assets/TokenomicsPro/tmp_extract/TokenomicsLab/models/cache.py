@@ -0,0 +1,259 @@
+import hashlib
+import inspect
+import json
+import os
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional
+
+import numpy as np
+
+from models.results import SimulationResult
+from models.rng import SeedLike
+from models.tokenomics import ENGINE_VERSION, TokenomicsModel
+
+# Memory held by cached results before the least recently used are spilled to disk
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+# Directory of spilled results, relative to the working directory like saved_models
+DEFAULT_CACHE_DIRECTORY = "simulation_cache"
+
+
+def _model_payload(model: TokenomicsModel) -> Dict:
+    """
+    Get the model dictionary with its per-category mappings as ordered pairs
+
+    Category order sets the order of the '{category}_Released' columns, so it
+    has to survive the sort_keys of the key serialization.
+    """
+    payload = model.to_dict()
+    for field in ('distribution', 'vesting_schedules'):
+        payload[field] = [[category, value] for category, value in payload[field].items()]
+    return payload
+
+
+def simulation_key(model: TokenomicsModel, months: int, initial_price: float,
+                   seed: int, **params) -> str:
+    """
+    Get a stable content hash identifying a simulation
+
+    Arguments are bound to the model's simulate signature with defaults filled
+    in, so passing a parameter at its default value gives the same key as
+    leaving it out.
+
+    Args:
+        model (TokenomicsModel): Model to simulate
+        months (int): Number of months to simulate
+        initial_price (float): Initial token price
+        seed (int): Integer seed of the simulation
+        **params: Other simulate keyword arguments
+
+    Returns:
+        str: Hex digest of the model, the arguments, the seed and ENGINE_VERSION
+    """
+    arguments = inspect.signature(model.simulate).bind(months, initial_price, **params)
+    arguments.apply_defaults()
+    arguments = dict(arguments.arguments)
+    arguments.pop('rng', None)
+
+    content = json.dumps({
+        'engine_version': ENGINE_VERSION,
+        'model_class': type(model).__name__,
+        'model': _model_payload(model),
+        'arguments': arguments,
+        'seed': seed
+    }, sort_keys=True, default=str)
+    return hashlib.sha256(content.encode('utf-8')).hexdigest()
+
+
+class SimulationCache:
+    """LRU cache of simulation results with a memory budget and an on-disk spill store"""
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES,
+                 directory: Optional[str] = DEFAULT_CACHE_DIRECTORY):
+        """
+        Initialize an empty cache
+
+        Args:
+            max_bytes (int, optional): Memory budget of the in-memory entries
+            directory (str, optional): Where evicted entries are written as .npz
+                files, None to drop them instead
+        """
+        self.max_bytes = max_bytes
+        self.directory = directory
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._stats = {'hits': 0, 'disk_hits': 0, 'misses': 0, 'evictions': 0}
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.npz")
+
+    def get(self, key: str) -> Optional[SimulationResult]:
+        """
+        Look up a result, loading it back into memory if it was spilled
+
+        Args:
+            key (str): Key from simulation_key
+
+        Returns:
+            Optional[SimulationResult]: A new result sharing the cached read-only
+                arrays, or None on a miss
+        """
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self._stats['hits'] += 1
+                return _share(self._entries[key])
+
+        result = self._load(key)
+        with self._lock:
+            if result is None:
+                self._stats['misses'] += 1
+                return None
+            self._stats['disk_hits'] += 1
+            self._insert(key, result)
+        return _share(result)
+
+    def put(self, key: str, result: SimulationResult) -> None:
+        """
+        Store a result, spilling least recently used entries over the memory budget
+
+        Args:
+            key (str): Key from simulation_key
+            result (SimulationResult): Result to cache; its arrays are made read-only
+        """
+        for values in [result.months, result.released, *result.metrics.values()]:
+            values.setflags(write=False)
+
+        with self._lock:
+            self._insert(key, result)
+
+    def _insert(self, key: str, result: SimulationResult) -> None:
+        """Add an entry and evict down to the budget (lock held)"""
+        if key in self._entries:
+            self._bytes -= self._entries.pop(key).nbytes
+        self._entries[key] = result
+        self._bytes += result.nbytes
+
+        while self._bytes > self.max_bytes and self._entries:
+            evicted_key, evicted = self._entries.popitem(last=False)
+            self._bytes -= evicted.nbytes
+            self._stats['evictions'] += 1
+            self._spill(evicted_key, evicted)
+
+    def _spill(self, key: str, result: SimulationResult) -> None:
+        """Write an evicted entry to the disk store"""
+        if self.directory is None or os.path.exists(self._path(key)):
+            return
+
+        os.makedirs(self.directory, exist_ok=True)
+        arrays = {f"metric_{name}": values for name, values in result.metrics.items()}
+        arrays['months'] = result.months
+        arrays['released'] = result.released
+        arrays['categories'] = np.array(result.categories, dtype=str)
+        arrays['metric_names'] = np.array(list(result.metrics.keys()), dtype=str)
+
+        # Write under a temporary name so readers never see a partial file
+        temporary_path = f"{self._path(key)}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(temporary_path, 'wb') as f:
+            np.savez(f, **arrays)
+        os.replace(temporary_path, self._path(key))
+
+    def _load(self, key: str) -> Optional[SimulationResult]:
+        """Read a spilled entry back, None if it is not on disk"""
+        if self.directory is None or not os.path.exists(self._path(key)):
+            return None
+
+        with np.load(self._path(key)) as data:
+            metrics = {str(name): data[f"metric_{name}"] for name in data['metric_names']}
+            categories = [str(category) for category in data['categories']]
+            result = SimulationResult(metrics, categories, data['released'],
+                                      months=data['months'])
+        for values in [result.months, result.released, *result.metrics.values()]:
+            values.setflags(write=False)
+        return result
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Get hit and miss counters
+
+        Returns:
+            Dict[str, float]: hits, disk_hits, misses, evictions, hit_rate,
+                entries and bytes held in memory
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            lookups = stats['hits'] + stats['disk_hits'] + stats['misses']
+            stats['hit_rate'] = (stats['hits'] + stats['disk_hits']) / lookups if lookups else 0.0
+            stats['entries'] = len(self._entries)
+            stats['bytes'] = self._bytes
+        return stats
+
+    def clear(self, disk: bool = False) -> None:
+        """
+        Drop the in-memory entries and reset the counters
+
+        Args:
+            disk (bool, optional): Also delete the spilled .npz files
+        """
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self._stats = dict.fromkeys(self._stats, 0)
+
+            if disk and self.directory is not None and os.path.isdir(self.directory):
+                for name in os.listdir(self.directory):
+                    if name.endswith('.npz'):
+                        os.remove(os.path.join(self.directory, name))
+
+
+def _share(result: SimulationResult) -> SimulationResult:
+    """Wrap cached arrays in a new result, so DataFrames built from it are not shared"""
+    return SimulationResult(result.metrics, result.categories, result.released, months=result.months)
+
+
+# Process-wide cache shared by every session
+_simulation_cache = SimulationCache()
+
+
+def get_simulation_cache() -> SimulationCache:
+    """Get the process-wide simulation cache"""
+    return _simulation_cache
+
+
+def cached_simulate(model: TokenomicsModel, months: int, initial_price: float,
+                    rng: SeedLike = None, cache: Optional[SimulationCache] = None,
+                    **params) -> SimulationResult:
+    """
+    Run model.simulate through the result cache
+
+    Only runs with an integer seed are reproducible, so any other rng (None,
+    a Generator) simulates without touching the cache.
+
+    Args:
+        model (TokenomicsModel): Model to simulate
+        months (int): Number of months to simulate
+        initial_price (float): Initial token price
+        rng (int, optional): Integer seed of the simulation
+        cache (SimulationCache, optional): Cache to use, the process-wide one by default
+        **params: Other simulate keyword arguments (single-path only)
+
+    Returns:
+        SimulationResult: Columnar simulation results
+    """
+    if params.get('n_paths') is not None:
+        raise ValueError("cached_simulate only caches single-path simulations")
+
+    if not isinstance(rng, (int, np.integer)) or isinstance(rng, bool):
+        return model.simulate(months, initial_price, rng=rng, **params)
+
+    if cache is None:
+        cache = _simulation_cache
+    key = simulation_key(model, months, initial_price, int(rng), **params)
+    result = cache.get(key)
+    if result is None:
+        result = model.simulate(months, initial_price, rng=int(rng), **params)
+        cache.put(key, result)
+        result = _share(result)
+    return result
@@ -0,0 +1,221 @@
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+from statsmodels.tsa.arima.model import ARIMA
+from statsmodels.tsa.statespace.sarimax import SARIMAX
+
+# Model specification of each forecast model of the Econometrics page
+FORECAST_MODELS = {
+    'ARIMA': {'order': (2, 1, 2)},
+    'SARIMAX': {'order': (1, 1, 1), 'seasonal_order': (0, 0, 0, 0)}
+}
+
+# Fitted models kept in memory before the least recently used are dropped
+DEFAULT_MAX_ENTRIES = 32
+
+# Optimizer iterations allowed per fit; enough for cold fits to converge, so a
+# warm start changes how fast a fit is but not its result
+FIT_MAXITER = 500
+
+
+def series_hash(y: Union[pd.Series, np.ndarray]) -> str:
+    """
+    Get a content hash of a time series
+
+    Args:
+        y (Union[pd.Series, np.ndarray]): Series to fit, e.g. a result's 'Price' column
+
+    Returns:
+        str: Hex digest of the values and, for a Series, its index
+    """
+    digest = hashlib.sha256()
+    if isinstance(y, pd.Series):
+        digest.update(np.ascontiguousarray(y.index.to_numpy()).tobytes())
+    digest.update(np.ascontiguousarray(np.asarray(y, dtype=float)).tobytes())
+    return digest.hexdigest()
+
+
+def _specification_key(model_type: str, specification: Dict) -> str:
+    """Identify a model type and order independently of the data"""
+    return json.dumps({'model_type': model_type, **specification}, sort_keys=True)
+
+
+def _fit(y: Union[pd.Series, np.ndarray], model_type: str, specification: Dict,
+         start_params: Optional[np.ndarray] = None):
+    """
+    Fit a statsmodels model, optionally starting the optimizer from given parameters
+
+    Args:
+        y (Union[pd.Series, np.ndarray]): Series to fit
+        model_type (str): 'ARIMA' or 'SARIMAX'
+        specification (Dict): Orders passed to the model
+        start_params (np.ndarray, optional): Parameters of an earlier fit to start from
+
+    Returns:
+        Fitted statsmodels results
+    """
+    if model_type == 'ARIMA':
+        return ARIMA(y, **specification).fit(start_params=start_params, method_kwargs={'maxiter': FIT_MAXITER})
+    return SARIMAX(y, **specification).fit(start_params=start_params, maxiter=FIT_MAXITER, disp=False)
+
+
+class FittedModelCache:
+    """
+    LRU cache of fitted forecast models, keyed by model type, order and series hash
+
+    Refits only warm-start from fits of the same series lineage: a cached
+    series the new one extends, or the last fit under the same caller-given
+    lineage key. Unrelated series never influence each other's fits.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES):
+        """
+        Initialize an empty cache
+
+        Args:
+            max_entries (int, optional): Fitted models kept before the least recently used are dropped
+        """
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lineage_params = {}
+        self._lock = threading.Lock()
+        self._stats = {'hits': 0, 'warm_starts': 0, 'cold_fits': 0, 'evictions': 0}
+
+    def _find_start_params(self, specification_key: str, values: np.ndarray,
+                           lineage: Optional[str]) -> Optional[np.ndarray]:
+        """Parameters of the lineage's last fit, or of the longest cached prefix of values (lock held)"""
+        if lineage is not None and (specification_key, lineage) in self._lineage_params:
+            return self._lineage_params[(specification_key, lineage)]
+        best = None
+        for (entry_specification, _), (results, entry_values) in self._entries.items():
+            if (entry_specification == specification_key and len(entry_values) < len(values)
+                    and (best is None or len(entry_values) > len(best[1]))
+                    and np.array_equal(entry_values, values[:len(entry_values)])):
+                best = (results, entry_values)
+        return None if best is None else np.asarray(best[0].params)
+
+    def fit(self, y: Union[pd.Series, np.ndarray], model_type: str,
+            specification: Optional[Dict] = None, lineage: Optional[str] = None) -> Tuple[object, str]:
+        """
+        Get a fitted model of a series, fitting it only if this series was not fitted before
+
+        A series that extends a cached one (e.g. the same simulation with more
+        months), or that shares a lineage key with an earlier fit, starts the
+        optimizer from that fit's parameters and usually converges in a few
+        iterations. Fits run to convergence, so the result does not depend on
+        where the optimizer started.
+
+        Args:
+            y (Union[pd.Series, np.ndarray]): Series to fit
+            model_type (str): 'ARIMA' or 'SARIMAX'
+            specification (Dict, optional): Orders passed to the model, FORECAST_MODELS[model_type]
+                by default
+            lineage (str, optional): Key of a sequence of refits of the same data, e.g. a
+                session and model, to warm-start from its last fit
+
+        Returns:
+            Tuple[object, str]: Fitted statsmodels results, and 'hit', 'warm_start' or 'cold_fit'
+        """
+        if specification is None:
+            specification = FORECAST_MODELS[model_type]
+        specification_key = _specification_key(model_type, specification)
+        key = (specification_key, series_hash(y))
+        values = np.asarray(y, dtype=float)
+
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self._stats['hits'] += 1
+                if lineage is not None:
+                    self._lineage_params[(specification_key, lineage)] = np.asarray(self._entries[key][0].params)
+                return self._entries[key][0], 'hit'
+            start_params = self._find_start_params(specification_key, values, lineage)
+
+        # Fit outside the lock, so other sessions' lookups do not wait on the optimizer
+        outcome = 'cold_fit' if start_params is None else 'warm_start'
+        try:
+            results = _fit(y, model_type, specification, start_params)
+        except (ValueError, np.linalg.LinAlgError):
+            if start_params is None:
+                raise
+            outcome = 'cold_fit'
+            results = _fit(y, model_type, specification)
+
+        with self._lock:
+            self._stats[outcome + 's'] += 1
+            self._entries[key] = (results, values)
+            self._entries.move_to_end(key)
+            if lineage is not None:
+                self._lineage_params[(specification_key, lineage)] = np.asarray(results.params)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._stats['evictions'] += 1
+        return results, outcome
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Get hit and fit counters
+
+        Returns:
+            Dict[str, float]: hits, warm_starts, cold_fits, evictions, hit_rate and entries
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            lookups = stats['hits'] + stats['warm_starts'] + stats['cold_fits']
+            stats['hit_rate'] = stats['hits'] / lookups if lookups else 0.0
+            stats['entries'] = len(self._entries)
+        return stats
+
+    def clear(self) -> None:
+        """Drop the fitted models and warm-start parameters and reset the counters"""
+        with self._lock:
+            self._entries.clear()
+            self._lineage_params.clear()
+            self._stats = dict.fromkeys(self._stats, 0)
+
+
+# Process-wide cache shared by every session
+_forecast_cache = FittedModelCache()
+
+
+def get_forecast_cache() -> FittedModelCache:
+    """Get the process-wide fitted model cache"""
+    return _forecast_cache
+
+
+def forecast(y: Union[pd.Series, np.ndarray], model_type: str, periods: int, confidence_level: float,
+             cache: Optional[FittedModelCache] = None, lineage: Optional[str] = None) -> Tuple[pd.DataFrame, str]:
+    """
+    Forecast a series with a cached fit
+
+    Changing only the horizon or the confidence level reuses the fitted
+    model and just re-runs get_forecast.
+
+    Args:
+        y (Union[pd.Series, np.ndarray]): Series to forecast
+        model_type (str): 'ARIMA' or 'SARIMAX'
+        periods (int): Number of periods to forecast
+        confidence_level (float): Confidence level of the interval, in percent
+        cache (FittedModelCache, optional): Cache to use, the process-wide one by default
+        lineage (str, optional): Lineage key of the series, see FittedModelCache.fit
+
+    Returns:
+        Tuple[pd.DataFrame, str]: Columns Price, Lower_CI and Upper_CI, one row per
+            forecast period, and how the fit was obtained ('hit', 'warm_start' or 'cold_fit')
+    """
+    if cache is None:
+        cache = _forecast_cache
+    results, outcome = cache.fit(y, model_type, lineage=lineage)
+
+    forecast_result = results.get_forecast(periods)
+    forecast_ci = np.asarray(forecast_result.conf_int(alpha=(100 - confidence_level) / 100))
+    return pd.DataFrame({
+        'Price': np.asarray(forecast_result.predicted_mean),
+        'Lower_CI': forecast_ci[:, 0],
+        'Upper_CI': forecast_ci[:, 1]
+    }), outcome
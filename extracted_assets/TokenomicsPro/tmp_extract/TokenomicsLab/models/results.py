@@ -0,0 +1,253 @@
+import numpy as np
+import pandas as pd
+from typing import Dict, List, Optional, Union
+
+RELEASED_SUFFIX = '_Released'
+
+
+class SimulationResult:
+    """Columnar result of a single-path simulation, backed by NumPy arrays"""
+
+    def __init__(self, metrics: Dict[str, np.ndarray], categories: List[str],
+                 released: np.ndarray, months: Optional[np.ndarray] = None,
+                 dtype: Optional[Union[str, np.dtype]] = None):
+        """
+        Initialize a simulation result
+
+        Arrays are stored as given (no copy) unless a different dtype is requested.
+
+        Args:
+            metrics (Dict[str, np.ndarray]): Metric name to 1-D vector, one value per row
+            categories (List[str]): Distribution categories, in released matrix row order
+            released (np.ndarray): Released tokens per category, shape (categories, rows)
+            months (np.ndarray, optional): Time axis, defaults to 0..rows - 1
+            dtype (str, np.dtype, optional): Storage dtype of metrics and releases,
+                e.g. np.float32 to halve the memory of large batches
+        """
+        self.metrics = {name: np.asarray(values, dtype=dtype) for name, values in metrics.items()}
+        self.categories = list(categories)
+        self.released = np.asarray(released, dtype=dtype).reshape(len(self.categories), -1)
+
+        rows = self.released.shape[1] if not self.metrics else len(next(iter(self.metrics.values())))
+        self.months = np.arange(rows) if months is None else np.asarray(months)
+        self._frame = None
+
+    def __len__(self) -> int:
+        return len(self.months)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.columns
+
+    def __getitem__(self, key: str) -> np.ndarray:
+        """
+        Get a column by its DataFrame name
+
+        Args:
+            key (str): 'Month', a metric name or '{category}_Released'
+
+        Returns:
+            np.ndarray: Column values (a view, not a copy)
+        """
+        if key == 'Month':
+            return self.months
+        if key in self.metrics:
+            return self.metrics[key]
+        if key.endswith(RELEASED_SUFFIX):
+            category = key[:-len(RELEASED_SUFFIX)]
+            if category in self.categories:
+                return self.category_released(category)
+        raise KeyError(key)
+
+    @property
+    def columns(self) -> List[str]:
+        """Column names of the equivalent DataFrame, in order"""
+        return (['Month'] + list(self.metrics.keys())
+                + [f'{category}{RELEASED_SUFFIX}' for category in self.categories])
+
+    @property
+    def nbytes(self) -> int:
+        """Memory held by the result arrays"""
+        return (self.months.nbytes + self.released.nbytes
+                + sum(values.nbytes for values in self.metrics.values()))
+
+    def category_released(self, category: str) -> np.ndarray:
+        """
+        Get cumulative released tokens of one category
+
+        Args:
+            category (str): Distribution category
+
+        Returns:
+            np.ndarray: Released tokens per row
+        """
+        return self.released[self.categories.index(category)]
+
+    def slice(self, start_month: Optional[int] = None,
+              stop_month: Optional[int] = None) -> 'SimulationResult':
+        """
+        Restrict the result to a month range without copying
+
+        Args:
+            start_month (int, optional): First month to keep
+            stop_month (int, optional): First month to drop (exclusive)
+
+        Returns:
+            SimulationResult: Result whose arrays are views into this one
+        """
+        start = 0 if start_month is None else int(np.searchsorted(self.months, start_month, 'left'))
+        stop = len(self) if stop_month is None else int(np.searchsorted(self.months, stop_month, 'left'))
+        return SimulationResult(
+            {name: values[start:stop] for name, values in self.metrics.items()},
+            self.categories,
+            self.released[:, start:stop],
+            months=self.months[start:stop]
+        )
+
+    def astype(self, dtype: Union[str, np.dtype]) -> 'SimulationResult':
+        """
+        Copy the result with metrics and releases stored as another dtype
+
+        Args:
+            dtype (str, np.dtype): Target dtype, e.g. np.float32
+
+        Returns:
+            SimulationResult: Converted result
+        """
+        return SimulationResult(self.metrics, self.categories, self.released,
+                                months=self.months, dtype=dtype)
+
+    def with_metrics(self, **metrics: np.ndarray) -> 'SimulationResult':
+        """
+        Get a result with metrics added or replaced, sharing all other arrays
+
+        Args:
+            **metrics (np.ndarray): Metric name to vector, one value per row
+
+        Returns:
+            SimulationResult: New result
+        """
+        return SimulationResult({**self.metrics, **metrics}, self.categories,
+                                self.released, months=self.months)
+
+    def release_dataframe(self) -> pd.DataFrame:
+        """
+        Get released tokens as a DataFrame with one column per category
+
+        Returns:
+            pd.DataFrame: 'Month' plus one column named after each category
+        """
+        data = {'Month': self.months}
+        data.update(zip(self.categories, self.released))
+        return pd.DataFrame(data)
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """
+        Convert the result to the wide DataFrame returned by simulate_token_price
+
+        The frame is built on first use and cached, so treat it as read-only or
+        copy it before modifying.
+
+        Returns:
+            pd.DataFrame: 'Month', one column per metric and '{category}_Released' columns
+        """
+        if self._frame is None:
+            data = {'Month': self.months}
+            data.update(self.metrics)
+            for category, released_tokens in zip(self.categories, self.released):
+                data[f'{category}{RELEASED_SUFFIX}'] = released_tokens
+            self._frame = pd.DataFrame(data)
+        return self._frame
+
+
+class PathSimulationResult:
+    """Per-month quantile summary of a batched multi-path simulation"""
+
+    QUANTILES = (5, 50, 95)
+
+    def __init__(self, columns: Dict[str, np.ndarray], categories: List[str],
+                 release_matrix: np.ndarray, keep_paths: bool = False,
+                 dtype: Optional[Union[str, np.dtype]] = None,
+                 replicates: Optional[int] = None):
+        """
+        Initialize a path simulation result
+
+        With replicates, the paths are split into that many contiguous groups,
+        each an independent sample, and the spread of the group quantiles gives
+        the standard errors of the quantiles.
+
+        Args:
+            columns (Dict[str, np.ndarray]): Simulated metrics, 2-D (paths, rows) for random
+                metrics and 1-D (rows,) for deterministic ones
+            categories (List[str]): Distribution categories, in release matrix row order
+            release_matrix (np.ndarray): Released tokens per category, shape (categories, rows)
+            keep_paths (bool, optional): Keep the full (paths, rows) arrays
+            dtype (str, np.dtype, optional): Storage dtype of kept paths, e.g. np.float32
+            replicates (int, optional): Number of independent groups of paths to estimate
+                standard errors from, None to skip them
+        """
+        self.months = np.arange(columns['Price'].shape[1])
+        self.n_paths = columns['Price'].shape[0]
+        self.categories = categories
+        self.release_matrix = release_matrix
+        self.quantiles = {}
+        self.standard_errors = {}
+        self.series = {}
+        self.paths = {} if keep_paths else None
+
+        for name, values in columns.items():
+            if values.ndim == 2:
+                self.quantiles[name] = np.percentile(values, self.QUANTILES, axis=0)
+                if replicates is not None and min(replicates, self.n_paths) >= 2:
+                    groups = np.array_split(values, min(replicates, self.n_paths))
+                    group_quantiles = np.stack([np.percentile(group, self.QUANTILES, axis=0) for group in groups])
+                    self.standard_errors[name] = group_quantiles.std(axis=0, ddof=1) / np.sqrt(len(groups))
+                if keep_paths:
+                    self.paths[name] = np.asarray(values, dtype=dtype)
+            else:
+                self.series[name] = values
+
+    def quantile(self, metric: str, level: int) -> np.ndarray:
+        """
+        Get one quantile band of a simulated metric
+
+        Args:
+            metric (str): Metric name, e.g. 'Price' or 'Market_Cap'
+            level (int): Quantile level, one of QUANTILES
+
+        Returns:
+            np.ndarray: Quantile value per month
+        """
+        return self.quantiles[metric][self.QUANTILES.index(level)]
+
+    def standard_error(self, metric: str, level: int) -> np.ndarray:
+        """
+        Get the Monte Carlo standard error of one quantile band
+
+        Args:
+            metric (str): Metric name, e.g. 'Price' or 'Market_Cap'
+            level (int): Quantile level, one of QUANTILES
+
+        Returns:
+            np.ndarray: Standard error per month, NaN when the result has no replicates
+        """
+        if metric not in self.standard_errors:
+            return np.full(len(self.months), np.nan)
+        return self.standard_errors[metric][self.QUANTILES.index(level)]
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """
+        Convert the summary to a DataFrame with one column per metric quantile
+
+        Returns:
+            pd.DataFrame: Columns like 'Price_P5', 'Price_P50', 'Price_P95' per month
+        """
+        data = {'Month': self.months}
+        for name, values in self.quantiles.items():
+            for level, band in zip(self.QUANTILES, values):
+                data[f'{name}_P{level}'] = band
+        data.update(self.series)
+
+        for category, released_tokens in zip(self.categories, self.release_matrix):
+            data[f'{category}{RELEASED_SUFFIX}'] = released_tokens
+
+        return pd.DataFrame(data)
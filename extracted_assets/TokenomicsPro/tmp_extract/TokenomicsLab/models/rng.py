@@ -0,0 +1,64 @@
+import numpy as np
+from typing import List, Optional, Union
+
+# Anything the simulators accept as a source of randomness
+SeedLike = Optional[Union[int, np.random.SeedSequence, np.random.Generator]]
+
+# Seed of simulations the user did not pick one for, e.g. the default dashboard model
+DEFAULT_SEED = 42
+
+
+def make_rng(seed: SeedLike = None) -> np.random.Generator:
+    """
+    Get a random generator from a seed or an existing generator
+
+    Args:
+        seed (SeedLike, optional): Integer seed, SeedSequence or Generator. A Generator
+            is returned as-is so callers can keep drawing from the same stream; None
+            gives a generator seeded from fresh OS entropy
+
+    Returns:
+        np.random.Generator: Random generator
+    """
+    if isinstance(seed, np.random.Generator):
+        return seed
+    return np.random.default_rng(seed)
+
+
+def spawn_seeds(seed: SeedLike, n: int) -> List[np.random.SeedSequence]:
+    """
+    Derive independent child seed sequences for parallel work
+
+    Child i only depends on the parent seed and on i, so a task that always uses
+    child i produces the same numbers no matter how tasks are split across
+    workers. Seed sequences are small and picklable, which makes them the thing
+    to send to worker processes.
+
+    Args:
+        seed (SeedLike): Parent seed, SeedSequence or Generator
+        n (int): Number of children
+
+    Returns:
+        List[np.random.SeedSequence]: Child seed sequences
+    """
+    if isinstance(seed, np.random.Generator):
+        seed_sequence = seed.bit_generator.seed_seq
+    elif isinstance(seed, np.random.SeedSequence):
+        seed_sequence = seed
+    else:
+        seed_sequence = np.random.SeedSequence(seed)
+    return seed_sequence.spawn(n)
+
+
+def spawn_rngs(seed: SeedLike, n: int) -> List[np.random.Generator]:
+    """
+    Derive independent child generators, one per task
+
+    Args:
+        seed (SeedLike): Parent seed, SeedSequence or Generator
+        n (int): Number of children
+
+    Returns:
+        List[np.random.Generator]: Child generators
+    """
+    return [np.random.default_rng(child) for child in spawn_seeds(seed, n)]
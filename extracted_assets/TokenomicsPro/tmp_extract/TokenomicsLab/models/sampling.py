@@ -0,0 +1,130 @@
+import numpy as np
+from functools import lru_cache
+from typing import Tuple
+from scipy.special import ndtr, ndtri
+from scipy.stats import qmc
+
+from models.rng import SeedLike, make_rng, spawn_seeds
+
+# How the random shocks of a batch of paths are drawn. Antithetic batches pair
+# each path with its mirror image; Latin hypercube and scrambled Sobol batches
+# spread the paths evenly over the space of shocks and lay them out along a
+# Brownian bridge, so the leading dimensions set the overall drift of a path
+SAMPLING_METHODS = ('pseudo_random', 'antithetic', 'latin_hypercube', 'sobol')
+
+# Independently randomized replicates a batch of paths is split into; the spread
+# of estimates across replicates gives their standard errors
+REPLICATES = 16
+
+
+@lru_cache(maxsize=16)
+def _brownian_bridge_plan(steps: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Get the order in which a Brownian bridge fills in the points of a path
+
+    Args:
+        steps (int): Number of increments per path
+
+    Returns:
+        Tuple[np.ndarray, ...]: Per construction stage the point to fill, its left and
+            right neighbours (-1 for the origin), and the weights of the neighbours
+            and of the normal draw
+    """
+    points, lefts, rights = [steps - 1], [-1], [-1]
+    left_weights, right_weights, scales = [0.0], [0.0], [np.sqrt(steps)]
+    intervals = [(-1, steps - 1)]
+    while intervals:
+        next_intervals = []
+        for left, right in intervals:
+            if right - left < 2:
+                continue
+            middle = (left + right) // 2
+            span = right - left
+            points.append(middle)
+            lefts.append(left)
+            rights.append(right)
+            left_weights.append((right - middle) / span)
+            right_weights.append((middle - left) / span)
+            scales.append(np.sqrt((middle - left) * (right - middle) / span))
+            next_intervals += [(left, middle), (middle, right)]
+        intervals = next_intervals
+    return tuple(np.array(values) for values in (points, lefts, rights, left_weights, right_weights, scales))
+
+
+def brownian_bridge(normals: np.ndarray) -> np.ndarray:
+    """
+    Turn standard normals into Brownian increments with a Brownian bridge
+
+    The first column sets the end point of each path, the next ones the
+    midpoints, and so on, so low-discrepancy points whose leading dimensions
+    are the most uniform also pin down the coarse shape of the paths.
+
+    Args:
+        normals (np.ndarray): Standard normals, shape (paths, steps)
+
+    Returns:
+        np.ndarray: Independent standard normal increments, shape (paths, steps)
+    """
+    steps = normals.shape[1]
+    points, lefts, rights, left_weights, right_weights, scales = _brownian_bridge_plan(steps)
+    walk = np.zeros((len(normals), steps + 1))
+    # Column 0 of walk is the origin, so neighbour -1 maps to it
+    for stage, point in enumerate(points):
+        walk[:, point + 1] = (left_weights[stage] * walk[:, lefts[stage] + 1]
+                              + right_weights[stage] * walk[:, rights[stage] + 1]
+                              + scales[stage] * normals[:, stage])
+    return np.diff(walk, axis=1)
+
+
+def _draw_replicate(seed: np.random.SeedSequence, n_paths: int, steps: int, sampling: str) -> np.ndarray:
+    """
+    Draw the uniform numbers of one independently randomized replicate
+
+    Args:
+        seed (np.random.SeedSequence): Seed of the replicate
+        n_paths (int): Number of paths
+        steps (int): Number of numbers per path
+        sampling (str): One of SAMPLING_METHODS other than 'pseudo_random'
+
+    Returns:
+        np.ndarray: Uniform numbers in (0, 1), shape (n_paths, steps)
+    """
+    rng = np.random.default_rng(seed)
+    if sampling == 'antithetic':
+        half = rng.random((-(-n_paths // 2), steps))
+        return np.concatenate([half, 1.0 - half])[:n_paths]
+    if sampling == 'sobol':
+        points = qmc.Sobol(steps, scramble=True, seed=rng).random_base2(max(int(np.ceil(np.log2(n_paths))), 0))
+        points = points[:n_paths]
+    else:
+        points = qmc.LatinHypercube(steps, seed=rng).random(n_paths)
+    # Keep the numbers strictly inside (0, 1) so the normal quantiles stay finite
+    points = np.clip(points, np.finfo(float).tiny, 1.0 - np.finfo(float).eps)
+    return ndtr(brownian_bridge(ndtri(points)))
+
+
+def draw_uniform(rng: SeedLike, n_paths: int, steps: int, sampling: str = 'pseudo_random') -> np.ndarray:
+    """
+    Draw uniform random numbers for a batch of paths
+
+    Pseudo-random numbers come straight from the generator, as before. The
+    other methods split the paths into REPLICATES contiguous, independently
+    randomized replicates so standard errors can still be estimated.
+
+    Args:
+        rng (int, Generator, optional): Seed or random generator
+        n_paths (int): Number of paths
+        steps (int): Number of numbers per path
+        sampling (str, optional): One of SAMPLING_METHODS
+
+    Returns:
+        np.ndarray: Uniform numbers in [0, 1), shape (n_paths, steps)
+    """
+    if sampling not in SAMPLING_METHODS:
+        raise ValueError(f"Unknown sampling method {sampling!r}, expected one of {SAMPLING_METHODS}")
+    if sampling == 'pseudo_random':
+        return make_rng(rng).random((n_paths, steps))
+
+    sizes = [len(rows) for rows in np.array_split(np.arange(n_paths), min(REPLICATES, n_paths))]
+    seeds = spawn_seeds(rng, len(sizes))
+    return np.concatenate([_draw_replicate(seed, size, steps, sampling) for seed, size in zip(seeds, sizes)])
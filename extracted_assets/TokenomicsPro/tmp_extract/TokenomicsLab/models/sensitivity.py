@@ -0,0 +1,239 @@
+import json
+from collections import OrderedDict
+from typing import Dict, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from models.sweep import SWEEP_METRICS, ParameterSweep, latin_hypercube_design
+from models.tokenomics import TokenomicsModel
+
+# Batches smaller than this run in-process; a process pool costs more to start
+PARALLEL_MIN_EVALUATIONS = 2000
+
+# Number of evaluation contexts (model + simulation settings) kept in the cache
+MAX_CACHED_CONTEXTS = 16
+
+# context key -> {parameter values: metric vector}, least recently used first
+_evaluation_cache = OrderedDict()
+
+
+class SensitivityAnalysis:
+    """Global sensitivity analysis (Morris screening and Sobol indices) of a tokenomics model"""
+
+    def __init__(self, model: TokenomicsModel, bounds: Dict[str, Tuple[float, float]],
+                 months: int, initial_price: float,
+                 simulation_params: Optional[Dict] = None,
+                 outputs: Sequence[str] = ('final_price', 'final_circulating_supply'),
+                 seed: int = 0, max_workers: Optional[int] = None):
+        """
+        Initialize a sensitivity analysis
+
+        The model is treated as a black box and evaluated through ParameterSweep.
+        Every evaluation uses the same random stream, so output differences come
+        only from the parameters and repeated points can be served from the cache.
+
+        Args:
+            model (TokenomicsModel): Model to analyse
+            bounds (Dict[str, Tuple[float, float]]): (low, high) for each parameter,
+                using the parameter names accepted by ParameterSweep
+            months (int): Number of months to simulate
+            initial_price (float): Initial token price, unless analysed
+            simulation_params (Dict, optional): Fixed simulate keyword arguments
+            outputs (Sequence[str], optional): Metrics to analyse, from SWEEP_METRICS
+            seed (int, optional): Seed of the common random stream
+            max_workers (int, optional): Worker processes for large batches
+        """
+        unknown = [name for name in outputs if name not in SWEEP_METRICS]
+        if unknown:
+            raise ValueError(f"Unknown outputs: {', '.join(unknown)}")
+
+        self.model = model
+        self.bounds = dict(bounds)
+        self.names = list(self.bounds.keys())
+        self.months = months
+        self.initial_price = initial_price
+        self.simulation_params = dict(simulation_params or {})
+        self.outputs = list(outputs)
+        self.seed = seed
+        self.max_workers = max_workers
+        self.n_evaluations = 0
+
+        self._context_key = json.dumps({
+            'model': model.to_dict(),
+            'months': months,
+            'initial_price': initial_price,
+            'simulation_params': self.simulation_params,
+            'seed': seed
+        }, sort_keys=True, default=str)
+
+    def _to_design(self, unit_points: np.ndarray) -> pd.DataFrame:
+        """Map points from the unit hypercube onto the parameter bounds"""
+        low = np.array([self.bounds[name][0] for name in self.names])
+        high = np.array([self.bounds[name][1] for name in self.names])
+        return pd.DataFrame(low + unit_points * (high - low), columns=self.names)
+
+    def _evaluate(self, unit_points: np.ndarray) -> np.ndarray:
+        """
+        Evaluate the model at points of the unit hypercube
+
+        Only points missing from the cache are simulated, in one batch.
+
+        Args:
+            unit_points (np.ndarray): Points, shape (n, parameters)
+
+        Returns:
+            np.ndarray: Output metrics, shape (n, outputs)
+        """
+        cache = _evaluation_cache.setdefault(self._context_key, {})
+        _evaluation_cache.move_to_end(self._context_key)
+        while len(_evaluation_cache) > MAX_CACHED_CONTEXTS:
+            _evaluation_cache.popitem(last=False)
+
+        design = self._to_design(unit_points)
+        keys = [tuple(np.round(row, 12)) for row in design.to_numpy()]
+        missing = list(dict.fromkeys(key for key in keys if key not in cache))
+
+        if missing:
+            sweep = ParameterSweep(self.model, pd.DataFrame(missing, columns=self.names),
+                                   self.months, self.initial_price, self.simulation_params,
+                                   seed=self.seed, common_random_numbers=True)
+            workers = self.max_workers
+            if workers is None and len(missing) < PARALLEL_MIN_EVALUATIONS:
+                workers = 1
+            result = sweep.run(max_workers=workers)
+            for key, metrics in zip(missing, result.metrics):
+                cache[key] = metrics
+            self.n_evaluations += len(missing)
+
+        columns = [SWEEP_METRICS.index(name) for name in self.outputs]
+        return np.array([cache[key][columns] for key in keys])
+
+    def morris(self, trajectories: int = 10, levels: int = 4,
+               n_bootstrap: int = 200, confidence: float = 0.95) -> pd.DataFrame:
+        """
+        Screen parameters with Morris elementary effects
+
+        Costs trajectories * (parameters + 1) model evaluations.
+
+        Args:
+            trajectories (int, optional): Number of one-at-a-time trajectories
+            levels (int, optional): Grid levels per parameter (even number)
+            n_bootstrap (int, optional): Bootstrap resamples of the trajectories
+            confidence (float, optional): Confidence level of the mu_star interval
+
+        Returns:
+            pd.DataFrame: mu, mu_star (with confidence bounds) and sigma per output
+                and parameter, effects measured per unit of the normalized range
+        """
+        rng = np.random.default_rng(self.seed)
+        k = len(self.names)
+        delta = levels / (2 * (levels - 1))
+        grid = np.arange(levels) / (levels - 1)
+
+        points = np.empty((trajectories, k + 1, k))
+        steps = np.empty((trajectories, k))
+        order = np.empty((trajectories, k), dtype=int)
+        for t in range(trajectories):
+            x = rng.choice(grid, size=k)
+            direction = np.where(x + delta <= 1, delta, -delta)
+            order[t] = rng.permutation(k)
+            points[t, 0] = x
+            for j, i in enumerate(order[t]):
+                x = x.copy()
+                x[i] += direction[i]
+                points[t, j + 1] = x
+            steps[t] = direction
+
+        y = self._evaluate(points.reshape(-1, k)).reshape(trajectories, k + 1, len(self.outputs))
+
+        # effects[t, i, o]: elementary effect of parameter i on output o in trajectory t
+        effects = np.empty((trajectories, k, len(self.outputs)))
+        for t in range(trajectories):
+            diffs = np.diff(y[t], axis=0)
+            effects[t, order[t]] = diffs / steps[t, order[t], None]
+
+        boot_index = rng.integers(0, trajectories, size=(n_bootstrap, trajectories))
+        boot_mu_star = np.abs(effects)[boot_index].mean(axis=1)
+        alpha = (1 - confidence) / 2 * 100
+
+        rows = []
+        for o, output in enumerate(self.outputs):
+            for i, name in enumerate(self.names):
+                rows.append({
+                    'output': output,
+                    'parameter': name,
+                    'mu': effects[:, i, o].mean(),
+                    'mu_star': np.abs(effects[:, i, o]).mean(),
+                    'mu_star_low': np.percentile(boot_mu_star[:, i, o], alpha),
+                    'mu_star_high': np.percentile(boot_mu_star[:, i, o], 100 - alpha),
+                    'sigma': effects[:, i, o].std(ddof=1) if trajectories > 1 else 0.0
+                })
+        return pd.DataFrame(rows)
+
+    def sobol(self, n_base: int = 256, n_bootstrap: int = 200,
+              confidence: float = 0.95) -> pd.DataFrame:
+        """
+        Estimate first-order and total Sobol indices with a Saltelli design
+
+        Costs n_base * (parameters + 2) model evaluations, shared by both
+        indices. Uses the Saltelli (2010) first-order and Jansen total-effect
+        estimators on Latin hypercube base samples.
+
+        Args:
+            n_base (int, optional): Rows of each base sample matrix
+            n_bootstrap (int, optional): Bootstrap resamples of the base rows
+            confidence (float, optional): Confidence level of the intervals
+
+        Returns:
+            pd.DataFrame: S1 and ST with confidence bounds per output and parameter
+        """
+        k = len(self.names)
+        unit_bounds = {name: (0.0, 1.0) for name in self.names}
+        base = latin_hypercube_design(unit_bounds, 2 * n_base, seed=self.seed).to_numpy()
+        a, b = base[:n_base], base[n_base:]
+
+        ab = np.repeat(a[None, :, :], k, axis=0)
+        for i in range(k):
+            ab[i, :, i] = b[:, i]
+
+        y = self._evaluate(np.vstack([a, b, ab.reshape(-1, k)]))
+        f_a = y[:n_base]
+        f_b = y[n_base:2 * n_base]
+        f_ab = y[2 * n_base:].reshape(k, n_base, len(self.outputs))
+
+        def indices(rows: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+            fa, fb, fab = f_a[rows], f_b[rows], f_ab[:, rows]
+            variance = np.var(np.concatenate([fa, fb]), axis=0)
+            variance = np.where(variance > 0, variance, np.nan)
+            first = np.mean(fb * (fab - fa), axis=1) / variance
+            total = 0.5 * np.mean((fa - fab) ** 2, axis=1) / variance
+            return first, total
+
+        first, total = indices(np.arange(n_base))
+
+        rng = np.random.default_rng(self.seed)
+        boot = [indices(rng.integers(0, n_base, n_base)) for _ in range(n_bootstrap)]
+        boot_first = np.array([f for f, _ in boot])
+        boot_total = np.array([t for _, t in boot])
+        alpha = (1 - confidence) / 2 * 100
+
+        rows = []
+        for o, output in enumerate(self.outputs):
+            for i, name in enumerate(self.names):
+                rows.append({
+                    'output': output,
+                    'parameter': name,
+                    'S1': first[i, o],
+                    'S1_low': np.nanpercentile(boot_first[:, i, o], alpha),
+                    'S1_high': np.nanpercentile(boot_first[:, i, o], 100 - alpha),
+                    'ST': total[i, o],
+                    'ST_low': np.nanpercentile(boot_total[:, i, o], alpha),
+                    'ST_high': np.nanpercentile(boot_total[:, i, o], 100 - alpha)
+                })
+        return pd.DataFrame(rows)
+
+
+def clear_sensitivity_cache() -> None:
+    """Drop all cached model evaluations"""
+    _evaluation_cache.clear()
@@ -0,0 +1,148 @@
+from itertools import islice
+from typing import Callable, Dict, Iterator, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+# Computes the row for one step from the rows already in the buffer
+StepFunction = Callable[['SimulationBuffer', int], Dict[str, float]]
+
+
+class SimulationBuffer:
+    """Preallocated columnar history of a step-wise simulation"""
+
+    def __init__(self, columns: Sequence[str], capacity: int, ring: bool = False):
+        """
+        Initialize an empty buffer
+
+        Appending is O(1) and never reallocates. A full buffer either rejects
+        new rows or, in ring mode, overwrites its oldest row, which bounds the
+        memory of simulations that run indefinitely.
+
+        Args:
+            columns (Sequence[str]): Column names, in row order
+            capacity (int): Maximum number of rows held
+            ring (bool, optional): Overwrite the oldest row when full
+        """
+        if capacity < 1:
+            raise ValueError(f"Capacity must be positive, got {capacity}")
+
+        self.columns = list(columns)
+        self.capacity = capacity
+        self.ring = ring
+        self._data = {name: np.zeros(capacity) for name in self.columns}
+        self._start = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def append(self, row: Dict[str, float]) -> None:
+        """
+        Add a row after the last one
+
+        Args:
+            row (Dict[str, float]): Value of every column
+        """
+        if self._size == self.capacity:
+            if not self.ring:
+                raise IndexError(f"Buffer is full ({self.capacity} rows)")
+            position = self._start
+            self._start = (self._start + 1) % self.capacity
+        else:
+            position = (self._start + self._size) % self.capacity
+            self._size += 1
+
+        for name in self.columns:
+            self._data[name][position] = row[name]
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        """
+        Get a column, oldest row first
+
+        Args:
+            name (str): Column name
+
+        Returns:
+            np.ndarray: Column values; a view unless a ring buffer has wrapped around
+        """
+        return self.tail(name, self._size)
+
+    def tail(self, name: str, n: int) -> np.ndarray:
+        """
+        Get the last n values of a column, oldest first
+
+        Args:
+            name (str): Column name
+            n (int): Number of rows, capped at the buffer length
+
+        Returns:
+            np.ndarray: Column values; a view unless the rows wrap around a ring buffer
+        """
+        n = min(n, self._size)
+        values = self._data[name]
+        first = (self._start + self._size - n) % self.capacity
+        if first + n <= self.capacity:
+            return values[first:first + n]
+        return np.concatenate((values[first:], values[:first + n - self.capacity]))
+
+    def last_row(self) -> Dict[str, float]:
+        """
+        Get the most recent row
+
+        Returns:
+            Dict[str, float]: Value of every column
+        """
+        if not self._size:
+            raise IndexError("Buffer is empty")
+        position = (self._start + self._size - 1) % self.capacity
+        return {name: float(self._data[name][position]) for name in self.columns}
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """
+        Copy the buffered rows into a DataFrame
+
+        Returns:
+            pd.DataFrame: One column per buffer column, oldest row first
+        """
+        return pd.DataFrame({name: self[name] for name in self.columns})
+
+
+def simulate_steps(step: StepFunction, buffer: SimulationBuffer,
+                   start: int, stop: Optional[int] = None) -> Iterator[Dict[str, float]]:
+    """
+    Run a simulation step by step, storing every row in a buffer
+
+    The generator holds no state of its own, so it can be dropped and recreated
+    between steps (for example on every Streamlit rerun, with new parameters)
+    and the simulation carries on from what is in the buffer.
+
+    Args:
+        step (StepFunction): Called as step(buffer, t) and returns the row of step t
+        buffer (SimulationBuffer): History the step reads and the rows are appended to
+        start (int): First step index
+        stop (int, optional): Step index to stop before, None to run forever
+
+    Yields:
+        Dict[str, float]: Row of each step, after it is appended to the buffer
+    """
+    t = start
+    while stop is None or t < stop:
+        row = step(buffer, t)
+        buffer.append(row)
+        yield row
+        t += 1
+
+
+def next_batch(steps: Iterator[Dict[str, float]], n: int) -> List[Dict[str, float]]:
+    """
+    Pull up to n rows from a step generator
+
+    Args:
+        steps (Iterator[Dict[str, float]]): Generator from simulate_steps
+        n (int): Number of steps to run
+
+    Returns:
+        List[Dict[str, float]]: Rows produced, fewer than n if the simulation ended
+    """
+    return list(islice(steps, n))
@@ -0,0 +1,390 @@
+import inspect
+import itertools
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import shared_memory
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from models.rng import SeedLike, spawn_seeds
+from models.tokenomics import TokenomicsModel, create_model_from_dict
+
+# Summary metrics computed for every configuration, in result column order
+SWEEP_METRICS = (
+    'final_price',
+    'min_price',
+    'max_price',
+    'max_drawdown',
+    'final_market_cap',
+    'final_circulating_supply'
+)
+
+# Parameters that are attributes of the model rather than simulation arguments
+MODEL_PARAMETERS = (
+    'total_supply',
+    'initial_users',
+    'user_growth_rate',
+    'initial_staking_rate',
+    'staking_apy'
+)
+
+# Parameters that rewrite the vesting schedules of the model
+SCHEDULE_PARAMETERS = (
+    'vesting_scale',
+    'tge_percent'
+)
+
+
+def grid_design(space: Dict[str, Sequence[float]]) -> pd.DataFrame:
+    """
+    Build a full-factorial design from explicit parameter levels
+
+    Args:
+        space (Dict[str, Sequence[float]]): Levels to try for each parameter
+
+    Returns:
+        pd.DataFrame: One row per combination of levels
+    """
+    names = list(space.keys())
+    rows = list(itertools.product(*(space[name] for name in names)))
+    return pd.DataFrame(rows, columns=names)
+
+
+def latin_hypercube_design(bounds: Dict[str, Tuple[float, float]], n: int,
+                           seed: SeedLike = None) -> pd.DataFrame:
+    """
+    Build a Latin hypercube design inside parameter bounds
+
+    Each parameter range is cut into n equal strata and every stratum is
+    sampled exactly once, so n points cover each axis evenly.
+
+    Args:
+        bounds (Dict[str, Tuple[float, float]]): (low, high) for each parameter
+        n (int): Number of configurations
+        seed (SeedLike, optional): Seed or random generator
+
+    Returns:
+        pd.DataFrame: One row per configuration
+    """
+    rng = np.random.default_rng(seed)
+    design = {}
+    for name, (low, high) in bounds.items():
+        unit = (rng.permutation(n) + rng.random(n)) / n
+        design[name] = low + unit * (high - low)
+    return pd.DataFrame(design)
+
+
+def random_design(bounds: Dict[str, Tuple[float, float]], n: int,
+                  seed: SeedLike = None) -> pd.DataFrame:
+    """
+    Build a uniform random design inside parameter bounds
+
+    Args:
+        bounds (Dict[str, Tuple[float, float]]): (low, high) for each parameter
+        n (int): Number of configurations
+        seed (SeedLike, optional): Seed or random generator
+
+    Returns:
+        pd.DataFrame: One row per configuration
+    """
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        name: rng.uniform(low, high, n) for name, (low, high) in bounds.items()
+    })
+
+
+def build_sweep_model(model_data: Dict, params: Dict[str, float]) -> Tuple[TokenomicsModel, Dict]:
+    """
+    Build a model for one configuration and split out its simulation arguments
+
+    Model attributes listed in MODEL_PARAMETERS are set on the model,
+    'vesting_scale' stretches every vesting month by that factor,
+    'tge_percent' unlocks that share of every vested category at month 0 and
+    scales the remaining tranches down to match, and all other parameters are
+    returned as simulate keyword arguments.
+
+    Args:
+        model_data (Dict): Base model, as returned by model.to_dict()
+        params (Dict[str, float]): Parameter values for this configuration
+
+    Returns:
+        Tuple[TokenomicsModel, Dict]: Model and simulation keyword arguments
+    """
+    data = dict(model_data)
+    simulation_params = {}
+    vesting_schedules = model_data['vesting_schedules']
+
+    for name, value in params.items():
+        if name in MODEL_PARAMETERS:
+            data[name] = value
+        elif name not in SCHEDULE_PARAMETERS:
+            simulation_params[name] = value
+
+    if 'vesting_scale' in params:
+        vesting_schedules = {
+            category: [(month * params['vesting_scale'], pct) for month, pct in schedule]
+            for category, schedule in vesting_schedules.items()
+        }
+    if 'tge_percent' in params:
+        remaining = 1 - params['tge_percent'] / 100
+        vesting_schedules = {
+            category: [(0, params['tge_percent'])] + [(month, pct * remaining) for month, pct in schedule]
+            for category, schedule in vesting_schedules.items()
+        }
+    data['vesting_schedules'] = vesting_schedules
+
+    return create_model_from_dict(data), simulation_params
+
+
+def summarize_price_path(price: np.ndarray, market_cap: np.ndarray,
+                         circulating_supply: np.ndarray) -> np.ndarray:
+    """
+    Reduce one simulated path to the SWEEP_METRICS vector
+
+    Args:
+        price (np.ndarray): Price per month
+        market_cap (np.ndarray): Market cap per month
+        circulating_supply (np.ndarray): Circulating supply per month
+
+    Returns:
+        np.ndarray: Metric values in SWEEP_METRICS order
+    """
+    running_max = np.maximum.accumulate(price)
+    drawdown = 1.0 - price / np.where(running_max > 0, running_max, 1.0)
+    return np.array([
+        price[-1],
+        price.min(),
+        price.max(),
+        drawdown.max(),
+        market_cap[-1],
+        circulating_supply[-1]
+    ])
+
+
+def _config_seed(root_seed: np.random.SeedSequence, index: int) -> np.random.SeedSequence:
+    """Rebuild the index-th child of root_seed, identical to root_seed.spawn()[index]"""
+    return np.random.SeedSequence(root_seed.entropy,
+                                  spawn_key=root_seed.spawn_key + (index,),
+                                  pool_size=root_seed.pool_size)
+
+
+def _run_chunk(model_data: Dict, design_columns: Dict[str, List[float]],
+               start: int, stop: int, months: int, simulation_params: Dict,
+               root_seed: np.random.SeedSequence, common_random_numbers: bool,
+               shm_name: str, n_configs: int, path_width: int) -> Tuple[int, int]:
+    """
+    Simulate configurations start..stop and write them into the shared buffers
+
+    Runs in a worker process. Only the small design slice travels through
+    pickling; metrics and price paths are written straight into shared memory.
+
+    Returns:
+        Tuple[int, int]: The (start, stop) range that was filled
+    """
+    shm = shared_memory.SharedMemory(name=shm_name)
+    metrics = np.ndarray((n_configs, len(SWEEP_METRICS)), dtype=np.float64, buffer=shm.buf)
+    paths = None
+    if path_width:
+        paths = np.ndarray((n_configs, path_width), dtype=np.float64,
+                           buffer=shm.buf, offset=metrics.nbytes)
+
+    try:
+        models = {}
+        for row in range(start, stop):
+            params = {name: values[row - start] for name, values in design_columns.items()}
+
+            # Reuse the model (and its compiled release curve) when only
+            # simulation arguments change between configurations
+            model_key = tuple(sorted(
+                (name, value) for name, value in params.items()
+                if name in MODEL_PARAMETERS or name in SCHEDULE_PARAMETERS
+            ))
+            if model_key not in models:
+                models[model_key] = build_sweep_model(model_data, params)[0]
+            model = models[model_key]
+
+            kwargs = dict(simulation_params)
+            kwargs.update({
+                name: value for name, value in params.items()
+                if name not in MODEL_PARAMETERS and name not in SCHEDULE_PARAMETERS
+            })
+            initial_price = kwargs.pop('initial_price')
+
+            # The columnar result skips building a DataFrame per configuration
+            result = model.simulate(months, initial_price,
+                                    rng=_config_seed(root_seed, 0 if common_random_numbers else row),
+                                    **kwargs)
+            price = result['Price']
+            metrics[row] = summarize_price_path(price, result['Market_Cap'], result['Circulating_Supply'])
+            if paths is not None:
+                paths[row] = price
+    finally:
+        # Views must be released before the segment can be closed
+        del metrics, paths
+        shm.close()
+
+    return start, stop
+
+
+class SweepResult:
+    """Metrics (and optionally price paths) for every configuration of a sweep"""
+
+    def __init__(self, design: pd.DataFrame, metrics: np.ndarray,
+                 paths: Optional[np.ndarray] = None):
+        """
+        Initialize a sweep result
+
+        Args:
+            design (pd.DataFrame): Swept parameter values, one row per configuration
+            metrics (np.ndarray): Summary metrics, shape (configs, len(SWEEP_METRICS))
+            paths (np.ndarray, optional): Price paths, shape (configs, months)
+        """
+        self.design = design
+        self.metrics = metrics
+        self.paths = paths
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """
+        Join the design with its metrics
+
+        Returns:
+            pd.DataFrame: Parameter columns followed by SWEEP_METRICS columns
+        """
+        metrics = pd.DataFrame(self.metrics, columns=list(SWEEP_METRICS), index=self.design.index)
+        return pd.concat([self.design, metrics], axis=1)
+
+
+class ParameterSweep:
+    """Run a model over a design of parameter sets in a process pool"""
+
+    def __init__(self, model: TokenomicsModel, design: pd.DataFrame, months: int,
+                 initial_price: float, simulation_params: Optional[Dict] = None,
+                 seed: SeedLike = None, store_paths: bool = False,
+                 common_random_numbers: bool = False):
+        """
+        Initialize a parameter sweep
+
+        Args:
+            model (TokenomicsModel): Base model; swept parameters override its values
+            design (pd.DataFrame): One column per swept parameter, one row per configuration
+            months (int): Number of months to simulate
+            initial_price (float): Initial token price, unless swept
+            simulation_params (Dict, optional): Fixed simulate keyword arguments
+            seed (SeedLike, optional): Root seed; configuration i always gets child stream i
+            store_paths (bool, optional): Keep every price path, not just the summary metrics
+            common_random_numbers (bool, optional): Give every configuration the same random
+                stream, so metric differences come only from the parameters
+        """
+        self.model_data = model.to_dict()
+        self.design = design.reset_index(drop=True)
+        self.months = months
+        self.simulation_params = dict(simulation_params or {})
+        self.simulation_params.setdefault('initial_price', initial_price)
+        self.root_seed = spawn_seeds(seed, 1)[0]
+        self.store_paths = store_paths
+        self.common_random_numbers = common_random_numbers
+        self.result = None
+
+        self._validate(model)
+
+    def _validate(self, model: TokenomicsModel) -> None:
+        """Reject parameters the model's simulate method does not accept"""
+        accepted = set(inspect.signature(model.simulate).parameters)
+        accepted.add('initial_price')
+        accepted.update(SCHEDULE_PARAMETERS)
+        accepted.update(name for name in MODEL_PARAMETERS if hasattr(model, name))
+
+        names = set(self.design.columns) | set(self.simulation_params)
+        unknown = sorted(names - accepted)
+        if unknown:
+            raise ValueError(f"Parameters not supported by {type(model).__name__}: {', '.join(unknown)}")
+
+    def _path_width(self) -> int:
+        """Number of rows a simulation of this model returns"""
+        if not self.store_paths:
+            return 0
+        model, _ = build_sweep_model(self.model_data, {})
+        return len(model.simulate(self.months, 1.0, rng=0))
+
+    def iter_chunks(self, max_workers: Optional[int] = None,
+                    chunk_size: Optional[int] = None) -> Iterator[Tuple[int, int, np.ndarray]]:
+        """
+        Run the sweep and yield each chunk as soon as it finishes
+
+        Chunks may complete out of order. After the generator is exhausted the
+        full result is available as self.result.
+
+        Args:
+            max_workers (int, optional): Worker processes, defaults to the CPU count;
+                1 runs everything in the calling process
+            chunk_size (int, optional): Configurations per task, defaults to about
+                four tasks per worker
+
+        Yields:
+            Tuple[int, int, np.ndarray]: (start, stop, metrics for rows start..stop)
+        """
+        n_configs = len(self.design)
+        max_workers = max_workers or os.cpu_count() or 1
+        if chunk_size is None:
+            chunk_size = max(1, -(-n_configs // (max_workers * 4)))
+
+        path_width = self._path_width()
+        n_bytes = max(1, n_configs * (len(SWEEP_METRICS) + path_width) * 8)
+        shm = shared_memory.SharedMemory(create=True, size=n_bytes)
+        metrics = np.ndarray((n_configs, len(SWEEP_METRICS)), dtype=np.float64, buffer=shm.buf)
+        paths = None
+        if path_width:
+            paths = np.ndarray((n_configs, path_width), dtype=np.float64,
+                               buffer=shm.buf, offset=metrics.nbytes)
+
+        tasks = []
+        for start in range(0, n_configs, chunk_size):
+            stop = min(start + chunk_size, n_configs)
+            design_columns = {
+                name: self.design[name].iloc[start:stop].tolist() for name in self.design.columns
+            }
+            tasks.append((self.model_data, design_columns, start, stop, self.months,
+                          self.simulation_params, self.root_seed, self.common_random_numbers,
+                          shm.name, n_configs, path_width))
+
+        try:
+            if max_workers == 1:
+                for task in tasks:
+                    start, stop = _run_chunk(*task)
+                    yield start, stop, metrics[start:stop].copy()
+            else:
+                with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                    futures = [executor.submit(_run_chunk, *task) for task in tasks]
+                    for future in as_completed(futures):
+                        start, stop = future.result()
+                        yield start, stop, metrics[start:stop].copy()
+
+            self.result = SweepResult(self.design, metrics.copy(),
+                                      paths.copy() if paths is not None else None)
+        finally:
+            del metrics, paths
+            shm.close()
+            shm.unlink()
+
+    def run(self, max_workers: Optional[int] = None, chunk_size: Optional[int] = None,
+            progress_callback: Optional[Callable[[int, int], None]] = None) -> SweepResult:
+        """
+        Run the whole sweep
+
+        Args:
+            max_workers (int, optional): Worker processes, defaults to the CPU count
+            chunk_size (int, optional): Configurations per task
+            progress_callback (Callable[[int, int], None], optional): Called with
+                (completed configurations, total configurations) after every chunk
+
+        Returns:
+            SweepResult: Metrics for every configuration
+        """
+        completed = 0
+        for start, stop, _ in self.iter_chunks(max_workers, chunk_size):
+            completed += stop - start
+            if progress_callback is not None:
+                progress_callback(completed, len(self.design))
+        return self.result
@@ -2,6 +2,15 @@ import numpy as np
 import pandas as pd
 from typing import Dict, List, Tuple, Optional, Union
 
+from models.results import PathSimulationResult, SimulationResult
+from models.rng import SeedLike, make_rng
+from models.sampling import REPLICATES, draw_uniform
+from models.vesting import VestingSchedule
+
+# Bump whenever a change to the simulators alters their output, so cached results are not reused
+ENGINE_VERSION = 1
+
+
 class TokenomicsModel:
     """Base class for tokenomics models"""
     
@@ -19,6 +28,7 @@ class TokenomicsModel:
         self.vesting_schedules = {}
         self.token_price_history = []
         self.token_supply_history = []
+        self._release_curve = None
         
     def set_distribution(self, distribution: Dict[str, float]) -> None:
         """
@@ -33,57 +43,125 @@ class TokenomicsModel:
             raise ValueError(f"Distribution percentages must sum to 100%, got {total}%")
             
         self.distribution = distribution
+        self._invalidate_release_curve()
         
     def set_vesting_schedule(self, category: str, 
-                             schedule: List[Tuple[int, float]]) -> None:
+                             schedule: Union[List[Tuple[int, float]], VestingSchedule]) -> None:
         """
         Set vesting schedule for a category
         
         Args:
             category (str): Distribution category
-            schedule (List[Tuple[int, float]]): List of (month, percentage) tuples
+            schedule (List[Tuple[int, float]], VestingSchedule): List of (month, percentage)
+                tuples, or a parametric schedule which is stored as its monthly list
         """
         if category not in self.distribution:
             raise ValueError(f"Category {category} not in distribution")
             
+        if isinstance(schedule, VestingSchedule):
+            schedule = schedule.to_list()
+            
         # Validate schedule percentages sum to 100%
         total = sum(pct for _, pct in schedule)
         if not np.isclose(total, 100.0):
             raise ValueError(f"Vesting schedule must sum to 100%, got {total}%")
             
         self.vesting_schedules[category] = schedule
+        self._invalidate_release_curve()
         
-    def calculate_released_tokens(self, month: int) -> Dict[str, int]:
+    def _invalidate_release_curve(self) -> None:
+        """Drop the compiled release curve so it is rebuilt on next access"""
+        self._release_curve = None
+        
+    def _get_release_curve(self) -> np.ndarray:
         """
-        Calculate tokens released per category at a given month
+        Compile distribution and vesting schedules into a cumulative release curve
+        
+        The curve has one row per distribution category and one column per month
+        up to the last vesting event. After that month every category is fully
+        released, so later months are served from the last column.
         
-        Args:
-            month (int): Month to calculate for (0-indexed)
-            
         Returns:
-            Dict[str, int]: Tokens released per category
+            np.ndarray: Cumulative tokens released, shape (categories, horizon + 1)
         """
-        result = {}
+        if self._release_curve is not None:
+            return self._release_curve
+            
+        horizon = 0
+        for category in self.distribution:
+            for m, _ in self.vesting_schedules.get(category, []):
+                horizon = max(horizon, int(np.ceil(m)))
+                
+        curve = np.zeros((len(self.distribution), horizon + 1))
         
-        for category, percentage in self.distribution.items():
+        for i, (category, percentage) in enumerate(self.distribution.items()):
             category_tokens = self.total_supply * (percentage / 100)
             
             # If no vesting schedule, assume all tokens are released immediately
             if category not in self.vesting_schedules:
-                result[category] = category_tokens
+                curve[i, :] = category_tokens
                 continue
                 
-            # Calculate based on vesting schedule
-            schedule = self.vesting_schedules[category]
-            released_pct = sum(pct for m, pct in schedule if m <= month)
-            result[category] = category_tokens * (released_pct / 100)
+            # Bucket each tranche into the first whole month at which it is released
+            monthly_pct = np.zeros(horizon + 1)
+            for m, pct in self.vesting_schedules[category]:
+                monthly_pct[max(int(np.ceil(m)), 0)] += pct
+            curve[i, :] = category_tokens * (np.cumsum(monthly_pct) / 100)
+            
+        self._release_curve = curve
+        return curve
+        
+    def get_release_matrix(self, months: int) -> np.ndarray:
+        """
+        Get cumulative released tokens per category for months 0..months
+        
+        Args:
+            months (int): Last month to include (0-indexed)
             
+        Returns:
+            np.ndarray: Released tokens, shape (categories, months + 1), rows in distribution order
+        """
+        curve = self._get_release_curve()
+        return curve[:, np.minimum(np.arange(months + 1), curve.shape[1] - 1)]
+        
+    def calculate_released_tokens(self, month: int) -> Dict[str, int]:
+        """
+        Calculate tokens released per category at a given month
+        
+        Args:
+            month (int): Month to calculate for (0-indexed)
+            
+        Returns:
+            Dict[str, int]: Tokens released per category
+        """
+        curve = self._get_release_curve()
+        column = curve[:, min(max(month, 0), curve.shape[1] - 1)]
+        return dict(zip(self.distribution.keys(), column))
+        
+    def simulate_token_price(self, *args, **kwargs) -> Union[pd.DataFrame, PathSimulationResult]:
+        """
+        Simulate token price and return the results as a DataFrame
+        
+        Takes the same arguments as simulate.
+        
+        Returns:
+            Union[pd.DataFrame, PathSimulationResult]: Token price simulation results, or a
+                per-month quantile summary when n_paths is given
+        """
+        result = self.simulate(*args, **kwargs)
+        if isinstance(result, SimulationResult):
+            return result.to_dataframe()
         return result
         
-    def simulate_token_price(self, months: int, 
-                             initial_price: float, 
-                             market_factors: List[Tuple[str, float]] = None,
-                             volatility: float = 0.1) -> pd.DataFrame:
+    def simulate(self, months: int, 
+                 initial_price: float, 
+                 market_factors: List[Tuple[str, float]] = None,
+                 volatility: float = 0.1,
+                 n_paths: Optional[int] = None,
+                 keep_paths: bool = False,
+                 rng: SeedLike = None,
+                 dtype: Optional[Union[str, np.dtype]] = None,
+                 sampling: str = 'pseudo_random') -> Union[SimulationResult, PathSimulationResult]:
         """
         Simulate token price over time based on vesting and market factors
         
@@ -92,65 +170,98 @@ class TokenomicsModel:
             initial_price (float): Initial token price
             market_factors (List[Tuple[str, float]], optional): List of (factor_name, impact) tuples
             volatility (float, optional): Random volatility factor
+            n_paths (int, optional): Number of random paths to simulate in one batch
+            keep_paths (bool, optional): Keep the full paths in the batched result
+            rng (int, Generator, optional): Seed or random generator for the price shocks
+            dtype (str, np.dtype, optional): Storage dtype of the results, e.g. np.float32
+            sampling (str, optional): How the shocks are drawn, one of SAMPLING_METHODS
             
         Returns:
-            pd.DataFrame: Token price simulation results
+            Union[SimulationResult, PathSimulationResult]: Columnar token price simulation
+                results, or a per-month quantile summary when n_paths is given
         """
         if market_factors is None:
             market_factors = []
             
-        price = initial_price
-        prices = [price]
-        circulating_supply = [0]
-        market_cap = [0]
-        
-        for month in range(months + 1):
-            # Calculate circulating supply based on vesting
-            released = self.calculate_released_tokens(month)
-            total_released = sum(released.values())
-            
-            # Apply market factors
-            factor_impact = 1.0
-            for _, impact in market_factors:
-                factor_impact *= (1 + impact)
-                
-            # Apply supply impact (simplified model: more supply = lower price)
-            supply_impact = 1.0
-            if month > 0:
-                supply_ratio = total_released / circulating_supply[-1] if circulating_supply[-1] > 0 else 1.0
-                if supply_ratio > 1.0:
-                    # Supply increased
-                    supply_impact = 0.98  # Price decreases slightly with more supply
-                
-            # Apply random volatility
-            random_impact = 1.0 + np.random.uniform(-volatility, volatility)
+        # Apply market factors
+        factor_impact = 1.0
+        for _, impact in market_factors:
+            factor_impact *= (1 + impact)
             
-            # Calculate new price
-            if month > 0:  # Keep initial price for month 0
-                price = prices[-1] * factor_impact * supply_impact * random_impact
-                
-            prices.append(price)
-            circulating_supply.append(total_released)
-            market_cap.append(price * total_released)
-            
-        # Create dataframe
-        data = {
-            'Month': list(range(len(prices))),
-            'Price': prices,
-            'Circulating_Supply': circulating_supply,
-            'Market_Cap': market_cap
+        # Released tokens per category for every row of the result
+        release_matrix = self.get_release_matrix(months + 1)
+        total_released = release_matrix.sum(axis=0)[:months + 1]
+        
+        # Apply supply impact (simplified model: more supply = lower price)
+        supply_ratio = np.ones(months)
+        np.divide(total_released[1:], total_released[:-1], out=supply_ratio,
+                  where=total_released[:-1] > 0)
+        supply_impact = np.where(supply_ratio > 1.0, 0.98, 1.0)
+        
+        # Apply random volatility (month 0 keeps the initial price)
+        random_impact = 1.0 + self._draw_shocks(rng, n_paths, months + 1, volatility, sampling)[:, 1:]
+        
+        # Calculate price paths, shape (paths, months + 2)
+        price = np.empty((random_impact.shape[0], months + 2))
+        price[:, :2] = initial_price
+        price[:, 2:] = initial_price * np.cumprod(
+            factor_impact * supply_impact * random_impact, axis=1
+        )
+        
+        columns = {
+            'Price': price,
+            'Circulating_Supply': np.concatenate(([0], total_released)),
+            'Market_Cap': np.concatenate(
+                (np.zeros((len(price), 1)), price[:, 1:] * total_released), axis=1
+            )
         }
         
-        # Add released tokens by category
-        for category in self.distribution.keys():
-            # Garantir que todos os arrays tenham o mesmo comprimento
-            released_tokens = []
-            for m in range(len(prices)):
-                released_tokens.append(self.calculate_released_tokens(m).get(category, 0))
+        return self._build_simulation_result(columns, release_matrix, n_paths, keep_paths, dtype)
+        
+    def _draw_shocks(self, rng: SeedLike, n_paths: Optional[int], steps: int,
+                     volatility: float, sampling: str = 'pseudo_random') -> np.ndarray:
+        """
+        Draw uniform price shocks for all paths at once
+        
+        Args:
+            rng (int, Generator, optional): Seed or random generator
+            n_paths (int, optional): Number of paths, None for a single path
+            steps (int): Number of shocks per path
+            volatility (float): Random volatility factor
+            sampling (str, optional): One of SAMPLING_METHODS
+            
+        Returns:
+            np.ndarray: Shocks in [-volatility, volatility], shape (paths, steps)
+        """
+        if sampling == 'pseudo_random':
+            return make_rng(rng).uniform(-volatility, volatility, size=(n_paths or 1, steps))
+        return volatility * (2.0 * draw_uniform(rng, n_paths or 1, steps, sampling) - 1.0)
+        
+    def _build_simulation_result(self, columns: Dict[str, np.ndarray],
+                                 release_matrix: np.ndarray,
+                                 n_paths: Optional[int],
+                                 keep_paths: bool,
+                                 dtype: Optional[Union[str, np.dtype]] = None) -> Union[SimulationResult, PathSimulationResult]:
+        """
+        Assemble simulated columns into a columnar result or a batched path summary
+        
+        Args:
+            columns (Dict[str, np.ndarray]): Simulated metrics, 2-D (paths, rows) for random
+                metrics and 1-D (rows,) for deterministic ones
+            release_matrix (np.ndarray): Released tokens per category, shape (categories, rows)
+            n_paths (int, optional): Number of simulated paths, None for single-path mode
+            keep_paths (bool): Keep the full paths in the batched result
+            dtype (str, np.dtype, optional): Storage dtype of the results
             
-            data[f'{category}_Released'] = released_tokens
+        Returns:
+            Union[SimulationResult, PathSimulationResult]: Simulation results
+        """
+        if n_paths is not None:
+            return PathSimulationResult(columns, list(self.distribution.keys()), release_matrix,
+                                        keep_paths=keep_paths, dtype=dtype, replicates=REPLICATES)
             
-        return pd.DataFrame(data)
+        metrics = {name: values[0] if values.ndim == 2 else values for name, values in columns.items()}
+        return SimulationResult(metrics, list(self.distribution.keys()), release_matrix, dtype=dtype)
         
     def to_dict(self) -> Dict:
         """
@@ -201,10 +312,15 @@ class UtilityTokenModel(TokenomicsModel):
         self.initial_users = initial_users
         self.user_growth_rate = user_growth_rate
         
-    def simulate_token_price(self, months: int, 
-                             initial_price: float,
-                             tokens_per_user: float = 10.0,
-                             volatility: float = 0.1) -> pd.DataFrame:
+    def simulate(self, months: int, 
+                 initial_price: float,
+                 tokens_per_user: float = 10.0,
+                 volatility: float = 0.1,
+                 n_paths: Optional[int] = None,
+                 keep_paths: bool = False,
+                 rng: SeedLike = None,
+                 dtype: Optional[Union[str, np.dtype]] = None,
+                 sampling: str = 'pseudo_random') -> Union[SimulationResult, PathSimulationResult]:
         """
         Simulate token price with network effects and user growth
         
@@ -213,63 +329,50 @@ class UtilityTokenModel(TokenomicsModel):
             initial_price (float): Initial token price
             tokens_per_user (float): Average tokens used per user
             volatility (float): Random volatility factor
+            n_paths (int, optional): Number of random paths to simulate in one batch
+            keep_paths (bool): Keep the full paths in the batched result
+            rng (int, Generator, optional): Seed or random generator for the price shocks
+            dtype (str, np.dtype, optional): Storage dtype of the results, e.g. np.float32
+            sampling (str, optional): How the shocks are drawn, one of SAMPLING_METHODS
             
         Returns:
-            pd.DataFrame: Token price simulation results
+            Union[SimulationResult, PathSimulationResult]: Columnar token price simulation
+                results, or a per-month quantile summary when n_paths is given
         """
-        price = initial_price
-        prices = [price]
-        users = [self.initial_users]
-        demand = [self.initial_users * tokens_per_user]
-        circulating_supply = [0]
-        market_cap = [0]
+        # Update user count with growth rate
+        growth = np.full(months + 1, 1 + self.user_growth_rate)
+        growth[0] = self.initial_users
+        users = np.cumprod(growth)
         
-        for month in range(1, months + 1):
-            # Update user count with growth rate
-            new_users = users[-1] * (1 + self.user_growth_rate)
-            users.append(new_users)
-            
-            # Calculate token demand
-            new_demand = new_users * tokens_per_user
-            demand.append(new_demand)
-            
-            # Calculate circulating supply
-            released = self.calculate_released_tokens(month)
-            total_released = sum(released.values())
-            circulating_supply.append(total_released)
-            
-            # Apply supply/demand dynamics to price
-            supply_demand_ratio = min(new_demand / max(1, total_released), 2.0)  # Cap the effect
-            
-            # Apply random volatility
-            random_impact = 1.0 + np.random.uniform(-volatility, volatility)
-            
-            # Calculate new price 
-            price = prices[-1] * supply_demand_ratio * random_impact
-            prices.append(price)
-            
-            market_cap.append(price * total_released)
-            
-        # Create dataframe
-        data = {
-            'Month': list(range(len(prices))),
-            'Price': prices,
+        # Calculate token demand
+        demand = users * tokens_per_user
+        
+        # Calculate circulating supply
+        release_matrix = self.get_release_matrix(months)
+        total_released = release_matrix.sum(axis=0)[1:]
+        
+        # Apply supply/demand dynamics to price
+        supply_demand_ratio = np.minimum(demand[1:] / np.maximum(1, total_released), 2.0)  # Cap the effect
+        
+        # Apply random volatility
+        random_impact = 1.0 + self._draw_shocks(rng, n_paths, months, volatility, sampling)
+        
+        # Calculate price paths, shape (paths, months + 1)
+        price = np.empty((random_impact.shape[0], months + 1))
+        price[:, 0] = initial_price
+        price[:, 1:] = initial_price * np.cumprod(supply_demand_ratio * random_impact, axis=1)
+        
+        columns = {
+            'Price': price,
             'Users': users,
             'Token_Demand': demand,
-            'Circulating_Supply': circulating_supply,
-            'Market_Cap': market_cap
+            'Circulating_Supply': np.concatenate(([0], total_released)),
+            'Market_Cap': np.concatenate(
+                (np.zeros((len(price), 1)), price[:, 1:] * total_released), axis=1
+            )
         }
         
-        # Add released tokens by category
-        for category in self.distribution.keys():
-            # Garantir que todos os arrays tenham o mesmo comprimento
-            released_tokens = []
-            for m in range(len(prices)):
-                released_tokens.append(self.calculate_released_tokens(m).get(category, 0))
-            
-            data[f'{category}_Released'] = released_tokens
-            
-        return pd.DataFrame(data)
+        return self._build_simulation_result(columns, release_matrix, n_paths, keep_paths, dtype)
         
     def to_dict(self) -> Dict:
         """Convert model to dictionary with additional utility token parameters"""
@@ -313,10 +416,15 @@ class GovernanceTokenModel(TokenomicsModel):
         self.initial_staking_rate = initial_staking_rate
         self.staking_apy = staking_apy
         
-    def simulate_token_price(self, months: int, 
-                             initial_price: float,
-                             staking_growth: float = 0.01,
-                             volatility: float = 0.1) -> pd.DataFrame:
+    def simulate(self, months: int, 
+                 initial_price: float,
+                 staking_growth: float = 0.01,
+                 volatility: float = 0.1,
+                 n_paths: Optional[int] = None,
+                 keep_paths: bool = False,
+                 rng: SeedLike = None,
+                 dtype: Optional[Union[str, np.dtype]] = None,
+                 sampling: str = 'pseudo_random') -> Union[SimulationResult, PathSimulationResult]:
         """
         Simulate token price with staking mechanics
         
@@ -325,68 +433,53 @@ class GovernanceTokenModel(TokenomicsModel):
             initial_price (float): Initial token price
             staking_growth (float): Monthly growth in staking rate
             volatility (float): Random volatility factor
+            n_paths (int, optional): Number of random paths to simulate in one batch
+            keep_paths (bool): Keep the full paths in the batched result
+            rng (int, Generator, optional): Seed or random generator for the price shocks
+            dtype (str, np.dtype, optional): Storage dtype of the results, e.g. np.float32
+            sampling (str, optional): How the shocks are drawn, one of SAMPLING_METHODS
             
         Returns:
-            pd.DataFrame: Token price simulation results
+            Union[SimulationResult, PathSimulationResult]: Columnar token price simulation
+                results, or a per-month quantile summary when n_paths is given
         """
-        price = initial_price
-        prices = [price]
-        staking_rate = [self.initial_staking_rate]
-        circulating_supply = [0]
-        staked_tokens = [0]
-        liquid_tokens = [0]
-        market_cap = [0]
+        # Calculate circulating supply
+        release_matrix = self.get_release_matrix(months)
+        total_released = release_matrix.sum(axis=0)[1:]
         
+        # Update staking rate with growth (capped at 80%)
+        staking_rate = np.empty(months + 1)
+        staking_rate[0] = self.initial_staking_rate
         for month in range(1, months + 1):
-            # Calculate circulating supply
-            released = self.calculate_released_tokens(month)
-            total_released = sum(released.values())
-            circulating_supply.append(total_released)
-            
-            # Update staking rate with growth (capped at 80%)
-            new_staking_rate = min(staking_rate[-1] + staking_growth, 0.8)
-            staking_rate.append(new_staking_rate)
-            
-            # Calculate staked and liquid tokens
-            staked = total_released * new_staking_rate
-            staked_tokens.append(staked)
+            staking_rate[month] = min(staking_rate[month - 1] + staking_growth, 0.8)
             
-            liquid = total_released - staked
-            liquid_tokens.append(liquid)
-            
-            # Calculate price impact of staking (more staking = higher price due to decreased supply)
-            staking_impact = 1.0 + (new_staking_rate / 10)  # 10% staking = 1% price increase
-            
-            # Apply random volatility
-            random_impact = 1.0 + np.random.uniform(-volatility, volatility)
-            
-            # Calculate new price
-            price = prices[-1] * staking_impact * random_impact
-            prices.append(price)
-            
-            market_cap.append(price * total_released)
-            
-        # Create dataframe
-        data = {
-            'Month': list(range(len(prices))),
-            'Price': prices,
+        # Calculate staked and liquid tokens
+        staked = total_released * staking_rate[1:]
+        liquid = total_released - staked
+        
+        # Calculate price impact of staking (more staking = higher price due to decreased supply)
+        staking_impact = 1.0 + (staking_rate[1:] / 10)  # 10% staking = 1% price increase
+        
+        # Apply random volatility
+        random_impact = 1.0 + self._draw_shocks(rng, n_paths, months, volatility, sampling)
+        
+        # Calculate price paths, shape (paths, months + 1)
+        price = np.empty((random_impact.shape[0], months + 1))
+        price[:, 0] = initial_price
+        price[:, 1:] = initial_price * np.cumprod(staking_impact * random_impact, axis=1)
+        
+        columns = {
+            'Price': price,
             'Staking_Rate': staking_rate,
-            'Circulating_Supply': circulating_supply,
-            'Staked_Tokens': staked_tokens,
-            'Liquid_Tokens': liquid_tokens,
-            'Market_Cap': market_cap
+            'Circulating_Supply': np.concatenate(([0], total_released)),
+            'Staked_Tokens': np.concatenate(([0], staked)),
+            'Liquid_Tokens': np.concatenate(([0], liquid)),
+            'Market_Cap': np.concatenate(
+                (np.zeros((len(price), 1)), price[:, 1:] * total_released), axis=1
+            )
         }
         
-        # Add released tokens by category
-        for category in self.distribution.keys():
-            # Garantir que todos os arrays tenham o mesmo comprimento
-            released_tokens = []
-            for m in range(len(prices)):
-                released_tokens.append(self.calculate_released_tokens(m).get(category, 0))
-            
-            data[f'{category}_Released'] = released_tokens
-            
-        return pd.DataFrame(data)
+        return self._build_simulation_result(columns, release_matrix, n_paths, keep_paths, dtype)
         
     def to_dict(self) -> Dict:
         """Convert model to dictionary with additional governance token parameters"""
@@ -0,0 +1,331 @@
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+# Month length used for day-based grids and release dates, as in the TokenomicsPro release tables
+DAYS_PER_MONTH = 30
+
+
+class VestingSchedule:
+    """Parametric vesting schedule: TGE unlock, cliff, linear or stepped vesting and custom tranches"""
+
+    def __init__(self, tge_percent: float = 0.0, cliff_months: float = 0.0,
+                 vesting_months: float = 0.0, step_months: Optional[float] = None,
+                 tranches: Sequence[Tuple[float, float]] = ()):
+        """
+        Initialize a vesting schedule
+
+        The TGE unlock is released at month 0 and each tranche at its month.
+        Whatever remains of 100% vests over vesting_months after the cliff,
+        continuously (linear) or in equal steps of step_months. The schedule
+        stores only these parameters, so its size does not depend on the
+        horizon or the resolution it is evaluated at.
+
+        Args:
+            tge_percent (float, optional): Percentage unlocked at month 0
+            cliff_months (float, optional): Months before vesting starts
+            vesting_months (float, optional): Duration of the vesting period; 0 releases
+                the remainder at the end of the cliff
+            step_months (float, optional): Months between unlocks for stepped vesting,
+                None for linear vesting
+            tranches (Sequence[Tuple[float, float]], optional): Extra (month, percentage) unlocks
+        """
+        if min(tge_percent, cliff_months, vesting_months) < 0:
+            raise ValueError("TGE, cliff and vesting period must not be negative")
+        if step_months is not None and step_months <= 0:
+            raise ValueError(f"Step must be positive, got {step_months}")
+
+        self.tge_percent = tge_percent
+        self.cliff_months = cliff_months
+        self.vesting_months = vesting_months
+        self.step_months = step_months
+        self.tranches = [(month, pct) for month, pct in tranches]
+
+        # Tranches sorted by month with their running total, for binary search
+        order = sorted(range(len(self.tranches)), key=lambda i: self.tranches[i][0])
+        self._tranche_months = np.array([self.tranches[i][0] for i in order], dtype=float)
+        self._tranche_cumulative = np.cumsum([self.tranches[i][1] for i in order], dtype=float)
+
+        # Rounding error left over by tranches that sum to 100% is not vested
+        self.vesting_percent = 100.0 - tge_percent - sum(pct for _, pct in self.tranches)
+        if np.isclose(self.vesting_percent, 0.0, atol=1e-9):
+            self.vesting_percent = 0.0
+        elif self.vesting_percent < 0:
+            raise ValueError(f"TGE and tranches exceed 100%, leaving {self.vesting_percent}% to vest")
+
+    def __repr__(self) -> str:
+        return (f"VestingSchedule(tge_percent={self.tge_percent}, cliff_months={self.cliff_months}, "
+                f"vesting_months={self.vesting_months}, step_months={self.step_months}, "
+                f"tranches={self.tranches})")
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, VestingSchedule):
+            return NotImplemented
+        return self.to_dict() == other.to_dict()
+
+    @property
+    def end_month(self) -> float:
+        """Month at which the schedule is fully released"""
+        last_tranche = self._tranche_months[-1] if len(self._tranche_months) else 0.0
+        vesting_end = self.cliff_months + self.vesting_months if self.vesting_percent > 0 else 0.0
+        return max(float(last_tranche), vesting_end)
+
+    def released_percent(self, months: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
+        """
+        Get the cumulative percentage released at one or many points in time
+
+        Constant work per point for TGE and vesting, plus a binary search over
+        the tranches, so a whole time grid is evaluated in one vectorized call.
+
+        Args:
+            months (float, np.ndarray): Time in months since TGE, may be fractional
+
+        Returns:
+            float, np.ndarray: Cumulative percentage released, same shape as months
+        """
+        t = np.asarray(months, dtype=float)
+        released = np.where(t >= 0, self.tge_percent, 0.0)
+
+        if self.vesting_percent > 0:
+            elapsed = t - self.cliff_months
+            if self.vesting_months == 0:
+                fraction = (elapsed >= 0).astype(float)
+            elif self.step_months is None:
+                fraction = np.clip(elapsed / self.vesting_months, 0.0, 1.0)
+            else:
+                # The last step may be shorter, ending exactly at the end of vesting
+                steps = np.floor(elapsed / self.step_months + 1e-9) * self.step_months
+                fraction = np.where(elapsed >= self.vesting_months, 1.0,
+                                    np.clip(steps / self.vesting_months, 0.0, 1.0))
+            released = released + self.vesting_percent * fraction
+
+        if len(self._tranche_months):
+            index = np.searchsorted(self._tranche_months, t, side='right')
+            released = released + np.concatenate(([0.0], self._tranche_cumulative))[index]
+
+        return released if released.ndim else float(released)
+
+    def released_tokens(self, total_tokens: float,
+                        months: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
+        """
+        Get cumulative tokens released at one or many points in time
+
+        Args:
+            total_tokens (float): Tokens allocated to the schedule
+            months (float, np.ndarray): Time in months since TGE
+
+        Returns:
+            float, np.ndarray: Cumulative tokens released, same shape as months
+        """
+        return total_tokens * self.released_percent(months) / 100
+
+    def daily_released_percent(self, days: int) -> np.ndarray:
+        """
+        Get the cumulative percentage released on each day
+
+        Args:
+            days (int): Last day to include
+
+        Returns:
+            np.ndarray: Cumulative percentage for days 0..days
+        """
+        return self.released_percent(np.arange(days + 1) / DAYS_PER_MONTH)
+
+    def to_list(self) -> List[Tuple[float, float]]:
+        """
+        Convert to the (month, percentage) list used by TokenomicsModel.set_vesting_schedule
+
+        Linear vesting is released in monthly steps, which is the resolution
+        TokenomicsModel works at; TGE, stepped vesting and tranches are exact.
+
+        Returns:
+            List[Tuple[float, float]]: Unlocks in month order
+        """
+        schedule = []
+        if self.tge_percent > 0:
+            schedule.append((0, self.tge_percent))
+
+        if self.vesting_percent > 0:
+            if self.vesting_months == 0:
+                schedule.append((self.cliff_months, self.vesting_percent))
+            else:
+                step = 1 if self.step_months is None else self.step_months
+                n_steps = int(np.ceil(self.vesting_months / step - 1e-9))
+                per_step = self.vesting_percent * step / self.vesting_months
+                for i in range(1, n_steps):
+                    schedule.append((self.cliff_months + i * step, per_step))
+
+                # A shorter last step gets the remainder
+                last_step = self.vesting_months - step * (n_steps - 1)
+                last_percent = per_step if last_step == step else self.vesting_percent - per_step * (n_steps - 1)
+                schedule.append((self.cliff_months + self.vesting_months, last_percent))
+
+        schedule.extend(self.tranches)
+        return sorted(schedule, key=lambda unlock: unlock[0])
+
+    @classmethod
+    def from_list(cls, schedule: Sequence[Tuple[float, float]]) -> 'VestingSchedule':
+        """
+        Create a schedule from a (month, percentage) list
+
+        Lists that are a TGE unlock followed by equal, evenly spaced unlocks
+        after a cliff are stored as stepped vesting parameters; anything else is
+        kept as tranches. Either way the schedule releases only at the listed
+        months, and to_list() gives back the same list, sorted by month.
+
+        Args:
+            schedule (Sequence[Tuple[float, float]]): Unlocks as (month, percentage)
+
+        Returns:
+            VestingSchedule: Equivalent schedule
+        """
+        unlocks = sorted(((month, pct) for month, pct in schedule), key=lambda unlock: unlock[0])
+        tranches = cls(tranches=unlocks)
+
+        tge_percent = 0.0
+        if unlocks and unlocks[0][0] == 0 and (len(unlocks) == 1 or unlocks[1][0] > 0):
+            tge_percent = unlocks[0][1]
+            unlocks = unlocks[1:]
+        if len(unlocks) < 2:
+            return tranches
+
+        step = unlocks[1][0] - unlocks[0][0]
+        if step <= 0:
+            return tranches
+        cliff = unlocks[0][0] - step
+        vesting = unlocks[-1][0] - cliff
+        try:
+            candidate = cls(tge_percent, cliff, vesting, step_months=step)
+        except ValueError:
+            return tranches
+        return candidate if candidate.to_list() == tranches.to_list() else tranches
+
+    def to_dict(self) -> Dict:
+        """
+        Convert to a JSON-serializable dictionary
+
+        Returns:
+            Dict: Schedule parameters
+        """
+        return {
+            'tge_percent': self.tge_percent,
+            'cliff_months': self.cliff_months,
+            'vesting_months': self.vesting_months,
+            'step_months': self.step_months,
+            'tranches': [list(tranche) for tranche in self.tranches]
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'VestingSchedule':
+        """
+        Create a schedule from a dictionary
+
+        Accepts the output of to_dict and the vesting schedule dictionaries of
+        the TokenomicsPro vesting page ('cliff_months', 'vesting_months',
+        'tge_percent', plus 'amount' and 'schedule' which are derived and ignored).
+
+        Args:
+            data (Dict): Schedule parameters
+
+        Returns:
+            VestingSchedule: Schedule
+        """
+        return cls(
+            tge_percent=data.get('tge_percent', 0.0),
+            cliff_months=data.get('cliff_months', 0.0),
+            vesting_months=data.get('vesting_months', 0.0),
+            step_months=data.get('step_months'),
+            tranches=[tuple(tranche) for tranche in data.get('tranches', [])]
+        )
+
+    def to_release_records(self, total_tokens: float,
+                           start_date: Optional[datetime] = None) -> List[Dict]:
+        """
+        Build the monthly release table of TokenomicsPro's calculate_vesting_release
+
+        Rows run from month 0 (only when something unlocks at TGE) through the
+        end of the cliff and vesting period, as in calculate_vesting_release.
+        The one difference is vesting_months=0: calculate_vesting_release never
+        releases the remainder after TGE, while this schedule releases it at
+        the end of the cliff, so e.g. a schedule with no TGE, cliff or vesting
+        gets a single month 0 row releasing everything.
+
+        Args:
+            total_tokens (float): Tokens allocated to the schedule
+            start_date (datetime, optional): Date of TGE, now by default
+
+        Returns:
+            List[Dict]: One record per month with 'Month', 'Date', 'Released Tokens',
+                'Cumulative Released', 'Percentage Released' and 'Still Locked'
+        """
+        if start_date is None:
+            start_date = datetime.now()
+
+        # Month 0 only has a row when something unlocks at TGE
+        first_month = 0 if self.released_percent(0) > 0 else 1
+        last_month = int(np.ceil(max(self.end_month, self.cliff_months + self.vesting_months)))
+        months = np.arange(first_month, last_month + 1)
+        cumulative = self.released_tokens(total_tokens, months)
+        released = np.diff(cumulative, prepend=0.0)
+
+        return [
+            {
+                'Month': int(month),
+                'Date': (start_date + timedelta(days=DAYS_PER_MONTH * int(month))).strftime('%Y-%m-%d'),
+                'Released Tokens': float(released_tokens),
+                'Cumulative Released': float(cumulative_tokens),
+                'Percentage Released': float(cumulative_tokens / total_tokens * 100) if total_tokens else 0.0,
+                'Still Locked': float(total_tokens - cumulative_tokens)
+            }
+            for month, released_tokens, cumulative_tokens in zip(months, released, cumulative)
+        ]
+
+    def to_release_dict(self, total_tokens: float, start_date: Optional[datetime] = None) -> Dict:
+        """
+        Convert to the vesting schedule dictionary stored by the TokenomicsPro vesting page
+
+        Only TGE plus cliff plus linear vesting fits that format.
+
+        Args:
+            total_tokens (float): Tokens allocated to the schedule
+            start_date (datetime, optional): Date of TGE, now by default
+
+        Returns:
+            Dict: 'amount', 'cliff_months', 'vesting_months', 'tge_percent' and the
+                'schedule' release records
+        """
+        if self.step_months is not None or self.tranches:
+            raise ValueError("Only linear schedules without tranches have a release dictionary")
+
+        return {
+            'amount': total_tokens,
+            'cliff_months': self.cliff_months,
+            'vesting_months': self.vesting_months,
+            'tge_percent': self.tge_percent,
+            'schedule': self.to_release_records(total_tokens, start_date)
+        }
+
+
+def release_matrix(schedules: Dict[str, VestingSchedule], distribution: Dict[str, float],
+                   total_supply: float, months: np.ndarray) -> np.ndarray:
+    """
+    Evaluate cumulative releases of every category over a time grid
+
+    Args:
+        schedules (Dict[str, VestingSchedule]): Schedule per category; categories
+            without one are fully released at month 0
+        distribution (Dict[str, float]): Percentage of supply per category
+        total_supply (float): Total token supply
+        months (np.ndarray): Time grid in months, e.g. np.arange(3651) / DAYS_PER_MONTH
+
+    Returns:
+        np.ndarray: Released tokens, shape (categories, len(months)), rows in distribution order
+    """
+    months = np.asarray(months, dtype=float)
+    matrix = np.empty((len(distribution), len(months)))
+    for i, (category, percentage) in enumerate(distribution.items()):
+        schedule = schedules.get(category)
+        percent = np.where(months >= 0, 100.0, 0.0) if schedule is None else schedule.released_percent(months)
+        matrix[i] = total_supply * (percentage / 100) * percent / 100
+    return matrix
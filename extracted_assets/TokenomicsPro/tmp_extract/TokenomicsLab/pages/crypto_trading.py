@@ -330,8 +330,8 @@ if 'model' in st.session_state and hasattr(st.session_state.model, 'total_supply
     model = st.session_state.model
     
     # Get the price from simulation
-    df = st.session_state.simulation_result
-    latest_price = df['Price'].iloc[-1]
+    result = st.session_state.simulation_result
+    latest_price = result['Price'][-1]
     market_cap = latest_price * model.total_supply
     
     # Calculate liquidity ratio
@@ -671,10 +671,10 @@ st.subheader("Métricas de Liquidez")
 if 'model' in st.session_state and hasattr(st.session_state.model, 'total_supply') and 'simulation_result' in st.session_state:
     # Get model parameters and price
     model = st.session_state.model
-    df = st.session_state.simulation_result
-    latest_price = df['Price'].iloc[-1]
+    result = st.session_state.simulation_result
+    latest_price = result['Price'][-1]
     market_cap = latest_price * model.total_supply
-    circulating_supply = df['Circulating_Supply'].iloc[-1]
+    circulating_supply = result['Circulating_Supply'][-1]
     circulating_mcap = latest_price * circulating_supply
     
     # Calculate metrics
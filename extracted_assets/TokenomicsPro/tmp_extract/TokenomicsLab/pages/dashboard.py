@@ -10,6 +10,8 @@ import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from models.tokenomics import TokenomicsModel, create_model_from_dict
+from models.cache import cached_simulate, get_simulation_cache
+from models.rng import DEFAULT_SEED
 
 st.set_page_config(
     page_title="Dashboard | Tokenomics Lab",
@@ -59,9 +61,11 @@ if 'model' not in st.session_state:
     # Simulate token price
     simulation_months = 36
     initial_price = 0.1
-    st.session_state.simulation_result = default_model.simulate_token_price(
+    st.session_state.simulation_result = cached_simulate(
+        default_model,
         simulation_months, 
         initial_price,
+        rng=DEFAULT_SEED,
         volatility=0.08
     )
     
@@ -70,6 +74,12 @@ if 'model' not in st.session_state:
 st.sidebar.title("Tokenomics Lab")
 st.sidebar.image("https://cdn.jsdelivr.net/npm/cryptocurrency-icons@0.18.1/svg/icon/btc.svg", width=50)
 
+cache_stats = get_simulation_cache().stats()
+st.sidebar.caption(
+    f"Cache de simulações: {cache_stats['hit_rate']:.0%} de acertos "
+    f"({cache_stats['hits'] + cache_stats['disk_hits']} acertos, {cache_stats['misses']} simulações)"
+)
+
 # Dashboard content
 st.title("Dashboard de Tokenomics")
 st.markdown("Visualize os principais indicadores do seu modelo de tokenomics e acompanhe a evolução ao longo do tempo.")
@@ -79,14 +89,14 @@ if 'simulation_result' not in st.session_state:
     st.warning("Você ainda não simulou nenhum modelo. Vá para a página de Simulação para criar um modelo.")
     st.stop()
 
-df = st.session_state.simulation_result
+result = st.session_state.simulation_result
 
 # Top metrics
 col1, col2, col3, col4 = st.columns(4)
 
 with col1:
-    latest_price = df['Price'].iloc[-1]
-    initial_price = df['Price'].iloc[0]
+    latest_price = result['Price'][-1]
+    initial_price = result['Price'][0]
     price_change = ((latest_price - initial_price) / initial_price) * 100
     
     st.metric(
@@ -96,7 +106,7 @@ with col1:
     )
 
 with col2:
-    latest_supply = df['Circulating_Supply'].iloc[-1]
+    latest_supply = result['Circulating_Supply'][-1]
     total_supply = st.session_state.model.total_supply
     supply_percent = (latest_supply / total_supply) * 100
     
@@ -107,16 +117,16 @@ with col2:
     )
 
 with col3:
-    latest_mcap = df['Market_Cap'].iloc[-1]
+    latest_mcap = result['Market_Cap'][-1]
     st.metric(
         "Market Cap", 
         f"${latest_mcap:,.2f}"
     )
 
 with col4:
-    if 'Users' in df.columns:
-        latest_users = df['Users'].iloc[-1]
-        initial_users = df['Users'].iloc[0]
+    if 'Users' in result:
+        latest_users = result['Users'][-1]
+        initial_users = result['Users'][0]
         users_change = ((latest_users - initial_users) / initial_users) * 100
         
         st.metric(
@@ -124,9 +134,9 @@ with col4:
             f"{latest_users:,.0f}", 
             f"{users_change:.1f}%"
         )
-    elif 'Staking_Rate' in df.columns:
-        latest_staking = df['Staking_Rate'].iloc[-1] * 100
-        initial_staking = df['Staking_Rate'].iloc[0] * 100
+    elif 'Staking_Rate' in result:
+        latest_staking = result['Staking_Rate'][-1] * 100
+        initial_staking = result['Staking_Rate'][0] * 100
         staking_change = latest_staking - initial_staking
         
         st.metric(
@@ -136,7 +146,7 @@ with col4:
         )
     else:
         # For basic model without specific metrics
-        max_month = df['Month'].max()
+        max_month = result['Month'].max()
         st.metric(
             "Período de Simulação",
             f"{max_month} meses"
@@ -157,8 +167,8 @@ fig = make_subplots(
 # Add price line
 fig.add_trace(
     go.Scatter(
-        x=df['Month'], 
-        y=df['Price'],
+        x=result['Month'], 
+        y=result['Price'],
         mode='lines',
         name='Preço',
         line=dict(color='#0068c9', width=2)
@@ -169,8 +179,8 @@ fig.add_trace(
 # Add circulating supply line
 fig.add_trace(
     go.Scatter(
-        x=df['Month'], 
-        y=df['Circulating_Supply'],
+        x=result['Month'], 
+        y=result['Circulating_Supply'],
         mode='lines',
         name='Oferta Circulante',
         line=dict(color='#83c9ff', width=2),
@@ -219,15 +229,13 @@ with col1:
 
 with col2:
     # Get latest month data
-    latest_month = df['Month'].max()
-    latest_data = df[df['Month'] == latest_month].iloc[0]
+    latest_month = result['Month'].max()
     
     # Create data for current distribution
     current_data = {}
     for category in categories:
-        col_name = f'{category}_Released'
-        if col_name in df.columns:
-            current_data[category] = latest_data[col_name]
+        if category in result.categories:
+            current_data[category] = result.category_released(category)[-1]
     
     # Create bar chart
     fig = px.bar(
@@ -280,6 +288,9 @@ if vesting_data:
 else:
     st.info("Não há dados de vesting configurados no modelo atual.")
 
+# The charts below plot columns of the wide DataFrame
+df = result.to_dataframe()
+
 # Market cap chart
 st.subheader("Evolução do Market Cap")
 
@@ -386,15 +397,15 @@ elif 'Staking_Rate' in df.columns and 'Staked_Tokens' in df.columns:
         st.plotly_chart(fig, use_container_width=True)
     
     # Price vs Staking Rate
-    df['Normalized_Price'] = df['Price'] / df['Price'].iloc[0]
-    df['Staking_Rate_Pct'] = df['Staking_Rate'] * 100
+    normalized_price = result['Price'] / result['Price'][0]
+    staking_rate_pct = result['Staking_Rate'] * 100
     
     fig = make_subplots(specs=[[{"secondary_y": True}]])
     
     fig.add_trace(
         go.Scatter(
-            x=df['Month'], 
-            y=df['Normalized_Price'],
+            x=result['Month'], 
+            y=normalized_price,
             mode='lines',
             name='Preço Normalizado',
             line=dict(color='#0068c9', width=2)
@@ -404,8 +415,8 @@ elif 'Staking_Rate' in df.columns and 'Staked_Tokens' in df.columns:
     
     fig.add_trace(
         go.Scatter(
-            x=df['Month'], 
-            y=df['Staking_Rate_Pct'],
+            x=result['Month'], 
+            y=staking_rate_pct,
             mode='lines',
             name='Taxa de Staking (%)',
             line=dict(color='#ff9e0a', width=2)
@@ -5,8 +5,6 @@ import plotly.express as px
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 import statsmodels.api as sm
-from statsmodels.tsa.arima.model import ARIMA
-from statsmodels.tsa.statespace.sarimax import SARIMAX
 import datetime
 
 # Import local modules
@@ -14,6 +12,14 @@ import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from models.tokenomics import TokenomicsModel, create_model_from_dict
+from models.forecast import forecast
+
+# How the fitted forecast model was obtained, as shown under the forecast
+FIT_OUTCOMES = {
+    'hit': "Modelo ajustado reutilizado do cache.",
+    'warm_start': "Modelo reajustado a partir do ajuste anterior desta série.",
+    'cold_fit': "Modelo ajustado do zero."
+}
 
 st.set_page_config(
     page_title="Econometrics | Tokenomics Lab",
@@ -39,8 +45,8 @@ if 'simulation_result' not in st.session_state:
         st.switch_page("pages/simulation.py")
     st.stop()
 
-# Get simulation data
-df = st.session_state.simulation_result
+# Get simulation data; the regressions and forecasts below work on the wide DataFrame
+df = st.session_state.simulation_result.to_dataframe()
 model = st.session_state.model if 'model' in st.session_state else None
 
 # Econometric Analysis Tabs
@@ -85,23 +91,14 @@ with tabs[0]:
             # Fit model based on selection
             if forecast_model == "ARIMA":
                 try:
-                    # Use statsmodels ARIMA
-                    model_fit = ARIMA(y, order=(2,1,2)).fit()
-                    
-                    # Make forecast
-                    forecast_result = model_fit.get_forecast(forecast_period)
-                    forecast_mean = forecast_result.predicted_mean
-                    forecast_ci = forecast_result.conf_int(alpha=(100-confidence_level)/100)
+                    # Fits are cached by series and order (see models/forecast.py), so changing
+                    # only the horizon or the confidence level just re-runs the forecast
+                    forecast_df, fit_outcome = forecast(y, "ARIMA", forecast_period, confidence_level)
+                    st.caption(FIT_OUTCOMES[fit_outcome])
                     
                     # Create forecast dataframe
                     last_month = df['Month'].max()
-                    forecast_index = range(last_month+1, last_month+forecast_period+1)
-                    forecast_df = pd.DataFrame({
-                        'Month': forecast_index,
-                        'Price': forecast_mean.values,
-                        'Lower_CI': forecast_ci.iloc[:, 0].values,
-                        'Upper_CI': forecast_ci.iloc[:, 1].values
-                    })
+                    forecast_df.insert(0, 'Month', range(last_month+1, last_month+forecast_period+1))
                     
                     # Create combined dataframe for plotting
                     combined_df = pd.concat([
@@ -203,23 +200,14 @@ with tabs[0]:
             
             elif forecast_model == "SARIMAX":
                 try:
-                    # Simplified model for demonstration
-                    model_fit = SARIMAX(y, order=(1, 1, 1), seasonal_order=(0, 0, 0, 0)).fit(disp=False)
-                    
-                    # Make forecast
-                    forecast_result = model_fit.get_forecast(forecast_period)
-                    forecast_mean = forecast_result.predicted_mean
-                    forecast_ci = forecast_result.conf_int(alpha=(100-confidence_level)/100)
+                    # Fits are cached by series and order (see models/forecast.py), so changing
+                    # only the horizon or the confidence level just re-runs the forecast
+                    forecast_df, fit_outcome = forecast(y, "SARIMAX", forecast_period, confidence_level)
+                    st.caption(FIT_OUTCOMES[fit_outcome])
                     
                     # Create forecast dataframe
                     last_month = df['Month'].max()
-                    forecast_index = range(last_month+1, last_month+forecast_period+1)
-                    forecast_df = pd.DataFrame({
-                        'Month': forecast_index,
-                        'Price': forecast_mean.values,
-                        'Lower_CI': forecast_ci.iloc[:, 0].values,
-                        'Upper_CI': forecast_ci.iloc[:, 1].values
-                    })
+                    forecast_df.insert(0, 'Month', range(last_month+1, last_month+forecast_period+1))
                     
                     # Create plot
                     fig = go.Figure()
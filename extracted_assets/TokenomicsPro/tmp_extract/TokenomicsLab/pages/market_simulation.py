@@ -1,12 +1,18 @@
 import streamlit as st
-import pandas as pd
 import numpy as np
 import plotly.express as px
 import plotly.graph_objects as go
 import time
-import random
 from datetime import datetime, timedelta
 import math
+import os
+from functools import partial
+
+# Import local modules
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from models.rng import make_rng
+from models.stream import SimulationBuffer, next_batch, simulate_steps
 
 st.set_page_config(
     page_title="Simulação de Mercado | Tokenomics Lab",
@@ -54,11 +60,17 @@ if 'initial_price' not in st.session_state:
     st.session_state.initial_price = 5.0
 if 'initial_holders' not in st.session_state:
     st.session_state.initial_holders = 10000
+if 'simulation_seed' not in st.session_state:
+    st.session_state.simulation_seed = 42
+if 'simulation_rng' not in st.session_state:
+    st.session_state.simulation_rng = None
+if 'simulation_days' not in st.session_state:
+    st.session_state.simulation_days = 30
 
 # Título e introdução
 st.title("Simulação de Mercado")
 st.markdown("""
-    Esta simulação mostra como seu token pode se comportar no mercado ao longo de 30 dias, com base em diferentes fatores
+    Esta simulação mostra como seu token pode se comportar no mercado ao longo de 30 dias a 3 anos, com base em diferentes fatores
     e na volatilidade do mercado. Eventos aleatórios podem ocorrer, afetando tanto o preço quanto o número de holders.
 """)
 
@@ -127,6 +139,31 @@ with col_params:
     )
     st.session_state.speed_multiplier = speed_options[selected_speed]
     
+    duration_options = {
+        "30 dias": 30,
+        "90 dias": 90,
+        "1 ano": 365,
+        "3 anos": 1095
+    }
+    
+    selected_duration = st.selectbox(
+        "Duração da Simulação",
+        options=list(duration_options.keys()),
+        index=list(duration_options.values()).index(st.session_state.simulation_days),
+        disabled=st.session_state.simulation_data is not None,
+        help="Reinicie a simulação para mudar a duração"
+    )
+    st.session_state.simulation_days = duration_options[selected_duration]
+    
+    simulation_seed = st.number_input(
+        "Semente Aleatória",
+        min_value=0,
+        value=st.session_state.simulation_seed,
+        step=1,
+        help="A mesma semente reproduz exatamente a mesma simulação"
+    )
+    st.session_state.simulation_seed = int(simulation_seed)
+    
     # Botões para controlar a simulação
     col_start, col_reset = st.columns(2)
     
@@ -140,8 +177,6 @@ with col_params:
                 # Verificar se tem créditos suficientes
                 if spend_credits("Simulação de Mercado", 3):
                     st.session_state.simulation_running = True
-                    if st.session_state.simulation_data is None:
-                        st.session_state.simulation_data = initialize_simulation(initial_price, initial_holders)
                     st.session_state.last_update_time = datetime.now()
                     st.rerun()
             else:
@@ -152,6 +187,7 @@ with col_params:
             st.session_state.simulation_running = False
             st.session_state.simulation_day = 1
             st.session_state.simulation_data = None
+            st.session_state.simulation_rng = None
             st.session_state.events = []
             st.rerun()
 
@@ -159,18 +195,18 @@ with col_params:
     if st.session_state.simulation_data is not None and len(st.session_state.simulation_data) > 0:
         st.subheader("Métricas Atuais")
         
-        last_row = st.session_state.simulation_data.iloc[-1]
+        last_row = st.session_state.simulation_data.last_row()
         
         metric_cols1, metric_cols2 = st.columns(2)
         with metric_cols1:
             st.metric(
                 "Dia",
-                f"{int(last_row['Day'])} de 30"
+                f"{int(last_row['Day'])} de {st.session_state.simulation_days}"
             )
             
             price_delta = None
             if len(st.session_state.simulation_data) > 1:
-                prev_price = st.session_state.simulation_data.iloc[-2]['Price']
+                prev_price = st.session_state.simulation_data.tail('Price', 2)[0]
                 price_delta = f"{(last_row['Price'] - prev_price) / prev_price * 100:.2f}%"
             
             st.metric(
@@ -211,30 +247,37 @@ with col_params:
                 sentiment_text
             )
 
+# Colunas do histórico da simulação
+SIMULATION_COLUMNS = ['Day', 'Price', 'Holders', 'Volume', 'Market_Cap', 'Price_Change', 'Sentiment']
+
 # Função para inicializar a simulação
-def initialize_simulation(initial_price=5.0, initial_holders=10000):
+def initialize_simulation(initial_price=5.0, initial_holders=10000, days=30, rng=None):
+    rng = make_rng(rng)
+    
     # Parâmetros iniciais
     price = initial_price
     holders = initial_holders
-    volume = price * holders * 0.5 * random.uniform(0.8, 1.2)  # Volume inicial aleatório
+    volume = price * holders * 0.5 * rng.uniform(0.8, 1.2)  # Volume inicial aleatório
     market_cap = price * holders * 100  # Supply implícito de 100 tokens por holder
     
-    # Criar dataframe inicial
-    data = {
-        'Day': [0],
-        'Price': [price],
-        'Holders': [holders],
-        'Volume': [volume],
-        'Market_Cap': [market_cap],
-        'Price_Change': [0.0],
-        'Sentiment': [st.session_state.sentiment]
-    }
-    
-    return pd.DataFrame(data)
+    # Histórico pré-alocado para todos os dias da simulação
+    buffer = SimulationBuffer(SIMULATION_COLUMNS, capacity=days + 1)
+    buffer.append({
+        'Day': 0,
+        'Price': price,
+        'Holders': holders,
+        'Volume': volume,
+        'Market_Cap': market_cap,
+        'Price_Change': 0.0,
+        'Sentiment': st.session_state.sentiment
+    })
+    
+    return buffer
 
-# Função para atualizar a simulação
-def update_simulation(df, volatility, sentiment, event_frequency, day):
-    last_row = df.iloc[-1].copy()
+# Função para calcular o próximo dia da simulação
+def update_simulation(buffer, day, volatility, sentiment, rng=None):
+    rng = make_rng(rng)
+    last_row = buffer.last_row()
     
     # Calcular novas métricas
     volatility_factor = volatility / 10.0  # 0.1 a 1.0
@@ -254,11 +297,11 @@ def update_simulation(df, volatility, sentiment, event_frequency, day):
     # Atualizar sentimento com base em eventos e alguma aleatoriedade
     new_sentiment = min(1.0, max(0.0, last_row['Sentiment'] + 
                                 event_sentiment_effect + 
-                                random.uniform(-0.05, 0.05) * volatility_factor))
+                                rng.uniform(-0.05, 0.05) * volatility_factor))
     
     # Gerar movimento de preço (random walk com viés baseado no sentimento)
     sentiment_price_bias = (new_sentiment - 0.5) * 0.04  # -0.02 a 0.02 (efeito diário)
-    price_change_pct = np.random.normal(sentiment_price_bias, 0.02 * volatility_factor) + price_event_effect
+    price_change_pct = rng.normal(sentiment_price_bias, 0.02 * volatility_factor) + price_event_effect
     
     # Calcular novo preço
     new_price = max(0.01, last_row['Price'] * (1 + price_change_pct))
@@ -266,23 +309,23 @@ def update_simulation(df, volatility, sentiment, event_frequency, day):
     # Calcular novos holders (com correlação com sentimento e preço)
     sentiment_holder_effect = (new_sentiment - 0.5) * 0.03  # -0.015 a 0.015
     price_momentum = 0
-    if len(df) > 5:
-        recent_prices = df.tail(5)['Price'].values
+    if len(buffer) > 5:
+        recent_prices = buffer.tail('Price', 5)
         price_momentum = (recent_prices[-1] / recent_prices[0] - 1) * 0.02  # Efeito de momentum
     
-    holder_change_pct = np.random.normal(sentiment_holder_effect + price_momentum, 0.01 * volatility_factor) + holder_event_effect
+    holder_change_pct = rng.normal(sentiment_holder_effect + price_momentum, 0.01 * volatility_factor) + holder_event_effect
     
     new_holders = max(100, last_row['Holders'] * (1 + holder_change_pct))
     
     # Volume correlacionado com volatilidade, preço e mudança no número de holders
     volume_factor = abs(price_change_pct) * 5 + abs(holder_change_pct) * 3
-    new_volume = new_price * new_holders * 0.2 * (0.8 + volume_factor + random.uniform(0, 0.5) * volatility_factor)
+    new_volume = new_price * new_holders * 0.2 * (0.8 + volume_factor + rng.uniform(0, 0.5) * volatility_factor)
     
     # Market cap
     new_market_cap = new_price * new_holders * 100  # Assumindo 100 tokens por holder
     
-    # Criar nova linha
-    new_row = {
+    # Nova linha (adicionada ao histórico por simulate_steps)
+    return {
         'Day': day,
         'Price': new_price,
         'Holders': new_holders,
@@ -291,106 +334,121 @@ def update_simulation(df, volatility, sentiment, event_frequency, day):
         'Price_Change': price_change_pct * 100,
         'Sentiment': new_sentiment
     }
+
+# Função para simular um dia completo: eventos e mercado
+def simulate_day(buffer, day, volatility, sentiment, event_frequency, rng=None):
+    # Gerenciar eventos existentes
+    for event in st.session_state.events:
+        if event['active']:
+            event['days_left'] -= 1
+            if event['days_left'] <= 0:
+                event['active'] = False
+    
+    # Verificar se ocorre um novo evento
+    new_event = generate_random_event(event_frequency, day, rng=rng)
+    if new_event:
+        st.session_state.events.append(new_event)
     
-    # Atualizar dataframe
-    return pd.concat([df, pd.DataFrame([new_row])], ignore_index=True)
+    return update_simulation(buffer, day, volatility, sentiment, rng=rng)
 
 # Função para gerar eventos aleatórios
-def generate_random_event(event_frequency):
+def generate_random_event(event_frequency, day, rng=None):
+    rng = make_rng(rng)
+    
     # Probabilidade de evento baseada na frequência (5% a 15% por dia)
     event_probability = 0.05 + (event_frequency / 100)
     
-    if random.random() > event_probability:
+    if rng.random() > event_probability:
         return None
     
     events = [
         {
             'name': 'Listagem em Exchange Tier 1',
             'description': 'O token foi listado em uma grande exchange!',
-            'price_effect': random.uniform(0.03, 0.1),
-            'holder_effect': random.uniform(0.02, 0.05),
-            'sentiment_effect': random.uniform(0.05, 0.15),
-            'duration': random.randint(2, 4)
+            'price_effect': rng.uniform(0.03, 0.1),
+            'holder_effect': rng.uniform(0.02, 0.05),
+            'sentiment_effect': rng.uniform(0.05, 0.15),
+            'duration': int(rng.integers(2, 5))
         },
         {
             'name': 'Parceria Estratégica Anunciada',
             'description': 'Uma parceria importante foi anunciada, gerando entusiasmo no mercado.',
-            'price_effect': random.uniform(0.02, 0.07),
-            'holder_effect': random.uniform(0.01, 0.03),
-            'sentiment_effect': random.uniform(0.03, 0.1),
-            'duration': random.randint(1, 3)
+            'price_effect': rng.uniform(0.02, 0.07),
+            'holder_effect': rng.uniform(0.01, 0.03),
+            'sentiment_effect': rng.uniform(0.03, 0.1),
+            'duration': int(rng.integers(1, 4))
         },
         {
             'name': 'Problema de Segurança',
             'description': 'Um possível exploit foi identificado no contrato do token.',
-            'price_effect': random.uniform(-0.15, -0.05),
-            'holder_effect': random.uniform(-0.08, -0.03),
-            'sentiment_effect': random.uniform(-0.2, -0.1),
-            'duration': random.randint(2, 5)
+            'price_effect': rng.uniform(-0.15, -0.05),
+            'holder_effect': rng.uniform(-0.08, -0.03),
+            'sentiment_effect': rng.uniform(-0.2, -0.1),
+            'duration': int(rng.integers(2, 6))
         },
         {
             'name': 'Grande Venda de Whale',
             'description': 'Um grande detentor vendeu uma quantidade significativa de tokens.',
-            'price_effect': random.uniform(-0.12, -0.03),
-            'holder_effect': random.uniform(-0.02, 0),
-            'sentiment_effect': random.uniform(-0.1, -0.02),
-            'duration': random.randint(1, 2)
+            'price_effect': rng.uniform(-0.12, -0.03),
+            'holder_effect': rng.uniform(-0.02, 0),
+            'sentiment_effect': rng.uniform(-0.1, -0.02),
+            'duration': int(rng.integers(1, 3))
         },
         {
             'name': 'Menção por Influenciador',
             'description': 'Um influenciador com grande audiência mencionou positivamente o projeto.',
-            'price_effect': random.uniform(0.05, 0.15),
-            'holder_effect': random.uniform(0.02, 0.07),
-            'sentiment_effect': random.uniform(0.05, 0.15),
-            'duration': random.randint(1, 3)
+            'price_effect': rng.uniform(0.05, 0.15),
+            'holder_effect': rng.uniform(0.02, 0.07),
+            'sentiment_effect': rng.uniform(0.05, 0.15),
+            'duration': int(rng.integers(1, 4))
         },
         {
             'name': 'Atualização do Projeto',
             'description': 'Uma atualização importante do projeto foi lançada com novos recursos.',
-            'price_effect': random.uniform(0.01, 0.05),
-            'holder_effect': random.uniform(0.01, 0.03),
-            'sentiment_effect': random.uniform(0.02, 0.08),
-            'duration': random.randint(2, 5)
+            'price_effect': rng.uniform(0.01, 0.05),
+            'holder_effect': rng.uniform(0.01, 0.03),
+            'sentiment_effect': rng.uniform(0.02, 0.08),
+            'duration': int(rng.integers(2, 6))
         },
         {
             'name': 'Mercado em Queda Geral',
             'description': 'Todo o mercado de criptomoedas está enfrentando uma correção.',
-            'price_effect': random.uniform(-0.08, -0.02),
-            'holder_effect': random.uniform(-0.04, -0.01),
-            'sentiment_effect': random.uniform(-0.15, -0.05),
-            'duration': random.randint(3, 7)
+            'price_effect': rng.uniform(-0.08, -0.02),
+            'holder_effect': rng.uniform(-0.04, -0.01),
+            'sentiment_effect': rng.uniform(-0.15, -0.05),
+            'duration': int(rng.integers(3, 8))
         },
         {
             'name': 'Mercado em Alta Geral',
             'description': 'Todo o mercado de criptomoedas está em alta.',
-            'price_effect': random.uniform(0.02, 0.06),
-            'holder_effect': random.uniform(0.01, 0.03),
-            'sentiment_effect': random.uniform(0.05, 0.15),
-            'duration': random.randint(3, 7)
+            'price_effect': rng.uniform(0.02, 0.06),
+            'holder_effect': rng.uniform(0.01, 0.03),
+            'sentiment_effect': rng.uniform(0.05, 0.15),
+            'duration': int(rng.integers(3, 8))
         },
         {
             'name': 'Notícias Regulatórias Positivas',
             'description': 'Anunciada nova regulamentação favorável para criptomoedas.',
-            'price_effect': random.uniform(0.03, 0.08),
-            'holder_effect': random.uniform(0.02, 0.05),
-            'sentiment_effect': random.uniform(0.05, 0.12),
-            'duration': random.randint(3, 6)
+            'price_effect': rng.uniform(0.03, 0.08),
+            'holder_effect': rng.uniform(0.02, 0.05),
+            'sentiment_effect': rng.uniform(0.05, 0.12),
+            'duration': int(rng.integers(3, 7))
         },
         {
             'name': 'Notícias Regulatórias Negativas',
             'description': 'Anunciada nova regulamentação desfavorável para criptomoedas.',
-            'price_effect': random.uniform(-0.1, -0.03),
-            'holder_effect': random.uniform(-0.05, -0.02),
-            'sentiment_effect': random.uniform(-0.15, -0.05),
-            'duration': random.randint(3, 6)
+            'price_effect': rng.uniform(-0.1, -0.03),
+            'holder_effect': rng.uniform(-0.05, -0.02),
+            'sentiment_effect': rng.uniform(-0.15, -0.05),
+            'duration': int(rng.integers(3, 7))
         }
     ]
     
     # Escolher evento aleatoriamente
-    event = random.choice(events)
+    event = events[rng.integers(len(events))]
     event['active'] = True
     event['days_left'] = event['duration']
-    event['start_day'] = st.session_state.simulation_day
+    event['start_day'] = day
     
     return event
 
@@ -408,6 +466,14 @@ with col_chart:
 
 # Atualização da simulação
 if st.session_state.simulation_running:
+    # Inicializar o histórico na primeira execução
+    if st.session_state.simulation_data is None:
+        st.session_state.simulation_rng = make_rng(st.session_state.simulation_seed)
+        st.session_state.simulation_data = initialize_simulation(
+            initial_price, initial_holders, st.session_state.simulation_days,
+            rng=st.session_state.simulation_rng
+        )
+    
     current_time = datetime.now()
     time_diff = (current_time - st.session_state.last_update_time).total_seconds()
     
@@ -416,39 +482,36 @@ if st.session_state.simulation_running:
     
     if time_diff >= update_interval:
         # Atualizar simulação
-        if st.session_state.simulation_day <= 30:  # Fixar em 30 dias como no exemplo de referência
+        days = st.session_state.simulation_days
+        if st.session_state.simulation_day <= days:
             
-            # Gerenciar eventos existentes
-            for event in st.session_state.events:
-                if event['active']:
-                    event['days_left'] -= 1
-                    if event['days_left'] <= 0:
-                        event['active'] = False
-            
-            # Verificar se ocorre um novo evento
-            new_event = generate_random_event(event_frequency)
-            if new_event:
-                st.session_state.events.append(new_event)
-            
-            # Atualizar dados
+            # Atualizar dados (simulações longas avançam vários dias por atualização)
             if st.session_state.simulation_data is not None:
-                st.session_state.simulation_data = update_simulation(
+                steps = simulate_steps(
+                    partial(
+                        simulate_day,
+                        volatility=market_volatility,
+                        sentiment=market_sentiment,
+                        event_frequency=event_frequency,
+                        rng=st.session_state.simulation_rng
+                    ),
                     st.session_state.simulation_data,
-                    market_volatility,
-                    market_sentiment,
-                    event_frequency,
-                    st.session_state.simulation_day
+                    start=st.session_state.simulation_day,
+                    stop=days + 1
                 )
-                st.session_state.simulation_day += 1
+                new_rows = next_batch(steps, max(1, days // 30))
+                st.session_state.simulation_day += len(new_rows)
                 st.session_state.last_update_time = current_time
         else:
             # Simulação concluída
             st.session_state.simulation_running = False
-            st.success("Simulação de 30 dias concluída!")
+            st.success(f"Simulação de {days} dias concluída!")
 
 # Exibir dados da simulação
 if st.session_state.simulation_data is not None:
     df = st.session_state.simulation_data
+    days = st.session_state.simulation_days
+    line_mode = 'lines+markers' if days <= 90 else 'lines'
     
     # Criar gráfico animado
     fig = go.Figure()
@@ -462,7 +525,7 @@ if st.session_state.simulation_data is not None:
         go.Scatter(
             x=df['Day'],
             y=df['Price'],
-            mode='lines+markers',
+            mode=line_mode,
             name='Preço ($)',
             line=dict(color='#0068c9', width=3),
             marker=dict(size=6, color='#0068c9'),
@@ -475,7 +538,7 @@ if st.session_state.simulation_data is not None:
         go.Scatter(
             x=df['Day'],
             y=df['Holders'],
-            mode='lines+markers',
+            mode=line_mode,
             name='Holders',
             line=dict(color='#ff9e0a', width=3),
             marker=dict(size=6, color='#ff9e0a'),
@@ -487,8 +550,9 @@ if st.session_state.simulation_data is not None:
     for event in st.session_state.events:
         if 'start_day' in event:
             event_day = event['start_day']
-            if event_day in df['Day'].values:
-                event_price = df[df['Day'] == event_day]['Price'].values[0]
+            event_index = np.searchsorted(df['Day'], event_day)
+            if event_index < len(df) and df['Day'][event_index] == event_day:
+                event_price = df['Price'][event_index]
                 event_color = 'green' if event.get('price_effect', 0) > 0 else 'red'
                 event_size = 12 + abs(event.get('price_effect', 0)) * 50
                 
@@ -512,13 +576,13 @@ if st.session_state.simulation_data is not None:
     
     # Configurar layout com eixos y duplos
     fig.update_layout(
-        title='Simulação de Mercado - 30 Dias',
+        title=f'Simulação de Mercado - {days} Dias',
         xaxis=dict(
             title='Dia',
             gridcolor='lightgray',
-            range=[0, 30],  # Fixar em 30 dias
+            range=[0, days],
             tickmode='linear',
-            dtick=5,  # Mostrar tick a cada 5 dias
+            dtick=max(5, days // 6),  # Cerca de 6 ticks no eixo
         ),
         yaxis=dict(
             title='Preço ($)',
@@ -603,7 +667,7 @@ col_info1, col_info2 = st.columns(2)
 with col_info1:
     st.subheader("Sobre a Simulação")
     st.markdown("""
-    Esta simulação mostra como o token poderia se comportar no mercado ao longo de 30 dias, 
+    Esta simulação mostra como o token poderia se comportar no mercado ao longo de 30 dias a 3 anos, 
     com base no sentimento do mercado, volatilidade e eventos aleatórios.
     
     **Métricas simuladas:**
@@ -621,8 +685,13 @@ with col_info2:
     2. Clique em "Iniciar Simulação" (custa 3 créditos)
     3. Observe a evolução do preço e holders em tempo real
     4. Eventos aleatórios podem ocorrer e afetar o mercado
-    5. A simulação vai até o dia 30
+    5. A simulação vai até o último dia da duração escolhida
     
     **Dica:** Aumente a velocidade da simulação se quiser ver os resultados mais rapidamente
     ou diminua para analisar melhor as mudanças diárias.
-    """)
\ No newline at end of file
+    """)
+
+# Continuar a simulação ao vivo até o último dia
+if st.session_state.simulation_running:
+    time.sleep(1.0 / st.session_state.speed_multiplier)
+    st.rerun()
@@ -11,6 +11,7 @@ import os
 import sys
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from models.tokenomics import TokenomicsModel
+from models.sweep import ParameterSweep, grid_design, latin_hypercube_design, random_design
 
 st.set_page_config(
     page_title="Teste de Estresse | Tokenomics Lab",
@@ -258,14 +259,14 @@ if st.button("Executar Simulação de Estresse", type="primary"):
         months = scenario["duration_months"]
         initial_price = 0.1  # default
         if 'simulation_result' in st.session_state and st.session_state.simulation_result is not None:
-            initial_price = st.session_state.simulation_result['Price'].iloc[0]
+            initial_price = st.session_state.simulation_result['Price'][0]
         
         stress_volatility = scenario["volatility"] / 100
         
         # Run stress test simulation
         if hasattr(model, 'initial_users'):
             # Utility token model
-            result = model.simulate_token_price(
+            result = model.simulate(
                 months, 
                 initial_price,
                 tokens_per_user=10.0 * (1 + scenario["liquidity_impact"] / 100),  # Adjust tokens per user based on liquidity impact
@@ -273,7 +274,7 @@ if st.button("Executar Simulação de Estresse", type="primary"):
             )
         elif hasattr(model, 'initial_staking_rate'):
             # Governance token model
-            result = model.simulate_token_price(
+            result = model.simulate(
                 months, 
                 initial_price,
                 staking_growth=0.01 * (1 + scenario["liquidity_impact"] / 100),  # Adjust staking growth based on liquidity impact
@@ -281,7 +282,7 @@ if st.button("Executar Simulação de Estresse", type="primary"):
             )
         else:
             # Basic model
-            result = model.simulate_token_price(
+            result = model.simulate(
                 months, 
                 initial_price,
                 volatility=stress_volatility
@@ -289,8 +290,11 @@ if st.button("Executar Simulação de Estresse", type="primary"):
         
         # Apply price impact to the simulation result
         price_factor = 1 + (scenario["price_impact"] / 100)
-        result['Price'] = result['Price'] * price_factor
-        result['Market_Cap'] = result['Price'] * result['Circulating_Supply']
+        stressed_price = result['Price'] * price_factor
+        result = result.with_metrics(
+            Price=stressed_price,
+            Market_Cap=stressed_price * result['Circulating_Supply']
+        )
         
         # Store the stress test result
         st.session_state.stress_test["simulation_results"][selected_scenario_key] = result
@@ -302,7 +306,8 @@ if selected_scenario_key in st.session_state.stress_test["simulation_results"]:
     st.header("Resultados do Teste de Estresse")
     
     # Get the simulation result
-    df = st.session_state.stress_test["simulation_results"][selected_scenario_key]
+    result = st.session_state.stress_test["simulation_results"][selected_scenario_key]
+    df = result.to_dataframe()
     
     # Get the scenario
     if selected_scenario_key.startswith("custom_"):
@@ -443,17 +448,9 @@ if selected_scenario_key in st.session_state.stress_test["simulation_results"]:
     # Token distribution chart
     st.subheader("Distribuição de Tokens sob Estresse")
     
-    # Identify token release columns
-    release_columns = [col for col in df.columns if col.endswith("_Released")]
-    
-    if release_columns:
+    if result.categories:
         # Create dataframe for released tokens
-        release_df = pd.DataFrame()
-        release_df['Month'] = df['Month']
-        
-        for col in release_columns:
-            category = col.replace("_Released", "")
-            release_df[category] = df[col]
+        release_df = result.release_dataframe()
         
         # Create stacked area chart
         fig = px.area(
@@ -625,17 +622,18 @@ if selected_scenario_key in st.session_state.stress_test["simulation_results"]:
         st.subheader("Comparação com Cenário Base")
         
         # Create a dataframe for comparison
-        base_df = st.session_state.simulation_result
+        base_result = st.session_state.simulation_result
         
-        # Check if length of base_df is sufficient
-        if len(base_df) >= len(df):
-            base_comparison = base_df.iloc[:len(df)].copy()
+        # Check if the base simulation is long enough
+        if len(base_result) >= len(df):
+            base_price = base_result['Price'][:len(df)]
+            base_market_cap = base_result['Market_Cap'][:len(df)]
             
             # Create a comparison dataframe
             comparison_df = pd.DataFrame()
             comparison_df['Month'] = df['Month']
             comparison_df['Cenário de Estresse'] = df['Price']
-            comparison_df['Cenário Base'] = base_comparison['Price']
+            comparison_df['Cenário Base'] = base_price
             
             # Create line chart
             fig = px.line(
@@ -658,12 +656,12 @@ if selected_scenario_key in st.session_state.stress_test["simulation_results"]:
             
             # Calculate impact metrics
             final_price_stress = df['Price'].iloc[-1]
-            final_price_base = base_comparison['Price'].iloc[-1]
+            final_price_base = base_price[-1]
             
             price_impact = ((final_price_stress - final_price_base) / final_price_base) * 100
             
             final_mcap_stress = df['Market_Cap'].iloc[-1]
-            final_mcap_base = base_comparison['Market_Cap'].iloc[-1]
+            final_mcap_base = base_market_cap[-1]
             
             mcap_impact = ((final_mcap_stress - final_mcap_base) / final_mcap_base) * 100
             
@@ -716,4 +714,125 @@ if selected_scenario_key in st.session_state.stress_test["simulation_results"]:
         
     # Data table
     st.subheader("Dados Detalhados da Simulação")
-    st.dataframe(df, height=300)
\ No newline at end of file
+    st.dataframe(df, height=300)
+
+# Parameter Sweep
+st.header("Varredura de Parâmetros")
+st.markdown("""
+    Avalie o modelo em milhares de combinações de parâmetros de uma só vez. As simulações são
+    distribuídas entre os núcleos do processador e os resultados aparecem à medida que cada lote termina.
+""")
+
+sweep_model = st.session_state.model
+
+col1, col2 = st.columns(2)
+
+with col1:
+    design_type = st.selectbox(
+        "Tipo de Desenho",
+        options=["Hipercubo Latino", "Aleatório", "Grade"],
+        help="Hipercubo Latino cobre cada parâmetro de forma uniforme com menos simulações."
+    )
+    
+    n_configs = st.number_input(
+        "Número de Configurações",
+        min_value=10,
+        max_value=50000,
+        value=1000,
+        step=100,
+        help="Para o desenho em grade, é o número aproximado de combinações."
+    )
+    
+    sweep_months = st.slider("Horizonte (Meses)", min_value=12, max_value=120, value=36, step=12)
+    
+    sweep_seed = st.number_input("Semente Aleatória", min_value=0, value=42, step=1, key="sweep_seed")
+
+with col2:
+    volatility_range = st.slider("Faixa de Volatilidade (%)", min_value=5, max_value=100, value=(10, 50))
+    vesting_scale_range = st.slider(
+        "Escala do Vesting",
+        min_value=0.25,
+        max_value=3.0,
+        value=(0.5, 2.0),
+        step=0.25,
+        help="Multiplica os meses de todos os cronogramas de vesting."
+    )
+    
+    if hasattr(sweep_model, 'initial_users'):
+        growth_range = st.slider("Crescimento Mensal de Usuários (%)", min_value=0.0, max_value=30.0, value=(0.0, 10.0))
+    elif hasattr(sweep_model, 'initial_staking_rate'):
+        staking_range = st.slider("Taxa Inicial de Staking (%)", min_value=0, max_value=80, value=(10, 60))
+
+bounds = {
+    "volatility": (volatility_range[0] / 100, volatility_range[1] / 100),
+    "vesting_scale": vesting_scale_range
+}
+if hasattr(sweep_model, 'initial_users'):
+    bounds["user_growth_rate"] = (growth_range[0] / 100, growth_range[1] / 100)
+elif hasattr(sweep_model, 'initial_staking_rate'):
+    bounds["initial_staking_rate"] = (staking_range[0] / 100, staking_range[1] / 100)
+
+if st.button("Executar Varredura"):
+    if design_type == "Hipercubo Latino":
+        design = latin_hypercube_design(bounds, int(n_configs), seed=int(sweep_seed))
+    elif design_type == "Aleatório":
+        design = random_design(bounds, int(n_configs), seed=int(sweep_seed))
+    else:
+        levels = max(2, int(round(n_configs ** (1 / len(bounds)))))
+        design = grid_design({name: np.linspace(low, high, levels) for name, (low, high) in bounds.items()})
+    
+    sweep_initial_price = 0.1
+    if 'simulation_result' in st.session_state and st.session_state.simulation_result is not None:
+        sweep_initial_price = st.session_state.simulation_result['Price'][0]
+    
+    sweep = ParameterSweep(sweep_model, design, sweep_months, sweep_initial_price, seed=int(sweep_seed))
+    
+    progress_bar = st.progress(0.0)
+    status_text = st.empty()
+    sweep_result = sweep.run(
+        progress_callback=lambda done, total: (
+            progress_bar.progress(done / total),
+            status_text.text(f"{done:,} de {total:,} configurações simuladas")
+        )
+    )
+    
+    st.session_state.stress_test["sweep_results"] = sweep_result.to_dataframe()
+
+if st.session_state.stress_test.get("sweep_results") is not None:
+    sweep_df = st.session_state.stress_test["sweep_results"]
+    
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        st.metric("Preço Final Mediano", f"${sweep_df['final_price'].median():.4f}")
+    
+    with col2:
+        st.metric("Preço Final P5", f"${sweep_df['final_price'].quantile(0.05):.4f}")
+    
+    with col3:
+        st.metric("Drawdown Máximo Mediano", f"{sweep_df['max_drawdown'].median() * 100:.1f}%")
+    
+    fig = px.histogram(
+        sweep_df,
+        x="final_price",
+        nbins=50,
+        title="Distribuição do Preço Final entre Configurações",
+        labels={"final_price": "Preço Final ($)"}
+    )
+    
+    st.plotly_chart(fig, use_container_width=True)
+    
+    parameter_columns = [col for col in sweep_df.columns if col in bounds]
+    if parameter_columns:
+        fig = px.scatter(
+            sweep_df,
+            x=parameter_columns[0],
+            y="final_price",
+            color="max_drawdown",
+            title="Preço Final por Parâmetro",
+            labels={"final_price": "Preço Final ($)", "max_drawdown": "Drawdown Máximo"}
+        )
+        
+        st.plotly_chart(fig, use_container_width=True)
+    
+    st.dataframe(sweep_df, height=300)
@@ -11,6 +11,8 @@ from datetime import datetime
 import sys
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from models.tokenomics import TokenomicsModel, UtilityTokenModel, GovernanceTokenModel, create_model_from_dict
+from models.cache import cached_simulate
+from models.rng import DEFAULT_SEED
 
 st.set_page_config(
     page_title="Biblioteca de Modelos | Tokenomics Lab",
@@ -361,23 +363,29 @@ with tab2:
                             initial_price = 0.1
                             
                             if model_data.get("model_type") == "utility":
-                                simulation_result = model.simulate_token_price(
+                                simulation_result = cached_simulate(
+                                    model,
                                     simulation_months, 
                                     initial_price,
+                                    rng=DEFAULT_SEED,
                                     tokens_per_user=10.0,
                                     volatility=0.1
                                 )
                             elif model_data.get("model_type") == "governance":
-                                simulation_result = model.simulate_token_price(
+                                simulation_result = cached_simulate(
+                                    model,
                                     simulation_months, 
                                     initial_price,
+                                    rng=DEFAULT_SEED,
                                     staking_growth=0.01,
                                     volatility=0.1
                                 )
                             else:
-                                simulation_result = model.simulate_token_price(
+                                simulation_result = cached_simulate(
+                                    model,
                                     simulation_months, 
                                     initial_price,
+                                    rng=DEFAULT_SEED,
                                     volatility=0.1
                                 )
                             
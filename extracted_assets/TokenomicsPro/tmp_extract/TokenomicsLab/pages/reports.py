@@ -47,7 +47,7 @@ if 'model' not in st.session_state or 'simulation_result' not in st.session_stat
 
 # Get model and simulation result from session state
 model = st.session_state.model
-df = st.session_state.simulation_result
+result = st.session_state.simulation_result
 
 # Report configuration
 st.header("Configuração do Relatório")
@@ -119,21 +119,21 @@ with preview_tabs[0]:
         model_type = "Governance Token"
     
     # Key metrics
-    latest_price = df['Price'].iloc[-1]
-    initial_price = df['Price'].iloc[0]
+    latest_price = result['Price'][-1]
+    initial_price = result['Price'][0]
     price_change = ((latest_price - initial_price) / initial_price) * 100
     
-    latest_supply = df['Circulating_Supply'].iloc[-1]
+    latest_supply = result['Circulating_Supply'][-1]
     total_supply = model.total_supply
     supply_percent = (latest_supply / total_supply) * 100
     
-    latest_mcap = df['Market_Cap'].iloc[-1]
+    latest_mcap = result['Market_Cap'][-1]
     
     st.markdown(f"""
     Este relatório apresenta uma análise detalhada do modelo de tokenomics para **{model.name}**.
     O modelo é baseado em um token do tipo **{model_type}** com uma oferta total de **{total_supply:,} tokens**.
     
-    **Principais métricas após {df['Month'].max()} meses:**
+    **Principais métricas após {result['Month'].max()} meses:**
     - Preço do Token: **${latest_price:.4f}** ({price_change:.1f}% desde o início)
     - Oferta em Circulação: **{latest_supply:,.0f} tokens** ({supply_percent:.1f}% do total)
     - Market Cap Projetado: **${latest_mcap:,.2f}**
@@ -195,6 +195,9 @@ with preview_tabs[0]:
         """)
 
 with preview_tabs[1]:
+    # The charts plot columns of the wide DataFrame
+    df = result.to_dataframe()
+    
     if include_distribution:
         st.subheader("Distribuição de Tokens")
         
@@ -263,8 +266,8 @@ with preview_tabs[1]:
         # Add price line
         fig.add_trace(
             go.Scatter(
-                x=df['Month'], 
-                y=df['Price'],
+                x=result['Month'], 
+                y=result['Price'],
                 mode='lines',
                 name='Preço',
                 line=dict(color='#0068c9', width=2)
@@ -275,8 +278,8 @@ with preview_tabs[1]:
         # Add circulating supply line
         fig.add_trace(
             go.Scatter(
-                x=df['Month'], 
-                y=df['Circulating_Supply'],
+                x=result['Month'], 
+                y=result['Circulating_Supply'],
                 mode='lines',
                 name='Oferta Circulante',
                 line=dict(color='#83c9ff', width=2),
@@ -319,7 +322,7 @@ with preview_tabs[1]:
     if include_metrics:
         st.subheader("Métricas Específicas")
         
-        if 'Users' in df.columns and 'Token_Demand' in df.columns:
+        if 'Users' in result and 'Token_Demand' in result:
             # Utility token metrics
             col1, col2 = st.columns(2)
             
@@ -364,7 +367,7 @@ with preview_tabs[1]:
             
             st.plotly_chart(fig, use_container_width=True)
             
-        elif 'Staking_Rate' in df.columns and 'Staked_Tokens' in df.columns:
+        elif 'Staking_Rate' in result and 'Staked_Tokens' in result:
             # Governance token metrics
             col1, col2 = st.columns(2)
             
@@ -405,7 +408,7 @@ with preview_tabs[1]:
 
 with preview_tabs[2]:
     st.subheader("Dados da Simulação")
-    st.dataframe(df)
+    st.dataframe(result.to_dataframe())
 
 # Export options
 st.header("Exportar Relatório")
@@ -575,7 +578,7 @@ if st.button("Gerar Relatório", type="primary"):
             if include_price:
                 # Create price chart
                 fig, ax = plt.subplots(figsize=(10, 6))
-                ax.plot(df['Month'], df['Price'], 'b-', linewidth=2)
+                ax.plot(result['Month'], result['Price'], 'b-', linewidth=2)
                 ax.set_title('Evolução do Preço do Token')
                 ax.set_xlabel('Mês')
                 ax.set_ylabel('Preço ($)')
@@ -591,8 +594,8 @@ if st.button("Gerar Relatório", type="primary"):
                 
                 # Create market cap chart
                 fig, ax = plt.subplots(figsize=(10, 6))
-                ax.fill_between(df['Month'], df['Market_Cap'], alpha=0.5, color='blue')
-                ax.plot(df['Month'], df['Market_Cap'], 'b-', linewidth=2)
+                ax.fill_between(result['Month'], result['Market_Cap'], alpha=0.5, color='blue')
+                ax.plot(result['Month'], result['Market_Cap'], 'b-', linewidth=2)
                 ax.set_title('Evolução do Market Cap')
                 ax.set_xlabel('Mês')
                 ax.set_ylabel('Market Cap ($)')
@@ -646,13 +649,10 @@ if st.button("Gerar Relatório", type="primary"):
             st.success("Relatório HTML gerado com sucesso!")
             
         elif export_format == "PDF":
-            # Placeholder for PDF generation
-            df_sample = df.head(10)
-            
             # Generate PDF report
             pdf_data = generate_pdf_report(
                 model, 
-                df, 
+                result, 
                 report_title, 
                 author, 
                 str(report_date),
@@ -671,7 +671,7 @@ if st.button("Gerar Relatório", type="primary"):
             
         elif export_format == "CSV (apenas dados)":
             # CSV export
-            csv = df.to_csv(index=False)
+            csv = result.to_dataframe().to_csv(index=False)
             
             # Provide download link
             st.download_button(
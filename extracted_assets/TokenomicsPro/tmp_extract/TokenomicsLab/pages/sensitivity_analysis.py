@@ -0,0 +1,171 @@
+import streamlit as st
+import plotly.graph_objects as go
+import os
+
+# Import local modules
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from models.sensitivity import SensitivityAnalysis
+
+st.set_page_config(
+    page_title="Análise de Sensibilidade | Tokenomics Lab",
+    page_icon="🎯",
+    layout="wide"
+)
+
+# Sidebar
+st.sidebar.title("Tokenomics Lab")
+st.sidebar.image("https://cdn.jsdelivr.net/npm/cryptocurrency-icons@0.18.1/svg/icon/btc.svg", width=50)
+
+# Main content
+st.title("Análise de Sensibilidade Global")
+st.markdown("""
+    Descubra quais parâmetros realmente determinam o preço final e a oferta circulante do seu token.
+    O método de Morris faz uma triagem rápida; os índices de Sobol quantificam a fração da variância
+    explicada por cada parâmetro, sozinho (S1) e com todas as suas interações (ST).
+""")
+
+# Check if model exists in session state
+if 'model' not in st.session_state:
+    st.warning("Você ainda não criou um modelo de tokenomics. Vá para a página de Simulação para criar um modelo primeiro.")
+
+    # Button to go to simulation page
+    if st.button("Ir para Simulação"):
+        st.switch_page("pages/simulation.py")
+
+    st.stop()
+
+model = st.session_state.model
+
+OUTPUT_LABELS = {
+    "final_price": "Preço Final",
+    "final_circulating_supply": "Oferta Circulante Final"
+}
+
+# Parameter ranges
+st.header("Parâmetros Analisados")
+
+col1, col2 = st.columns(2)
+
+bounds = {}
+
+with col1:
+    volatility_range = st.slider("Volatilidade (%)", min_value=1, max_value=100, value=(5, 40))
+    bounds["volatility"] = (volatility_range[0] / 100, volatility_range[1] / 100)
+
+    tge_range = st.slider(
+        "Liberação no TGE (%)",
+        min_value=0,
+        max_value=50,
+        value=(0, 25),
+        help="Parcela de cada categoria com vesting liberada no mês 0."
+    )
+    bounds["tge_percent"] = tge_range
+
+    vesting_scale_range = st.slider(
+        "Escala do Vesting",
+        min_value=0.25,
+        max_value=3.0,
+        value=(0.5, 2.0),
+        step=0.25,
+        help="Multiplica os meses de todos os cronogramas de vesting."
+    )
+    bounds["vesting_scale"] = vesting_scale_range
+
+with col2:
+    if hasattr(model, 'initial_users'):
+        growth_range = st.slider("Crescimento Mensal de Usuários (%)", min_value=0.0, max_value=30.0, value=(0.0, 10.0))
+        bounds["user_growth_rate"] = (growth_range[0] / 100, growth_range[1] / 100)
+    elif hasattr(model, 'initial_staking_rate'):
+        staking_range = st.slider("Taxa Inicial de Staking (%)", min_value=0, max_value=80, value=(10, 60))
+        bounds["initial_staking_rate"] = (staking_range[0] / 100, staking_range[1] / 100)
+
+        staking_growth_range = st.slider("Crescimento Mensal do Staking (%)", min_value=0.0, max_value=5.0, value=(0.0, 2.0))
+        bounds["staking_growth"] = (staking_growth_range[0] / 100, staking_growth_range[1] / 100)
+
+    months = st.slider("Horizonte (Meses)", min_value=12, max_value=120, value=36, step=12)
+    seed = st.number_input("Semente Aleatória", min_value=0, value=42, step=1)
+
+initial_price = 0.1
+if 'simulation_result' in st.session_state and st.session_state.simulation_result is not None:
+    initial_price = st.session_state.simulation_result['Price'][0]
+
+analysis = SensitivityAnalysis(model, bounds, months, initial_price, seed=int(seed))
+
+# Method selection
+st.header("Método")
+
+method = st.radio("Método de Análise", options=["Morris (triagem)", "Sobol (variância)"], horizontal=True)
+
+if method.startswith("Morris"):
+    trajectories = st.slider("Trajetórias", min_value=4, max_value=50, value=10)
+    st.caption(f"{trajectories * (len(bounds) + 1):,} avaliações do modelo")
+else:
+    n_base = st.select_slider("Amostras Base", options=[64, 128, 256, 512, 1024], value=256)
+    st.caption(f"{n_base * (len(bounds) + 2):,} avaliações do modelo")
+
+if st.button("Executar Análise", type="primary"):
+    with st.spinner("Avaliando o modelo..."):
+        if method.startswith("Morris"):
+            st.session_state.sensitivity_results = ("morris", analysis.morris(trajectories=trajectories))
+        else:
+            st.session_state.sensitivity_results = ("sobol", analysis.sobol(n_base=n_base))
+
+    if analysis.n_evaluations:
+        st.success(f"Análise concluída com {analysis.n_evaluations:,} novas simulações.")
+    else:
+        st.success("Análise concluída usando apenas resultados em cache.")
+
+# Results
+if st.session_state.get("sensitivity_results") is not None:
+    result_method, results = st.session_state.sensitivity_results
+    st.header("Resultados")
+
+    for output, output_df in results.groupby("output", sort=False):
+        st.subheader(OUTPUT_LABELS.get(output, output))
+
+        if result_method == "morris":
+            output_df = output_df.sort_values("mu_star", ascending=True)
+            fig = go.Figure(go.Bar(
+                x=output_df["mu_star"],
+                y=output_df["parameter"],
+                orientation="h",
+                error_x=dict(
+                    type="data",
+                    symmetric=False,
+                    array=output_df["mu_star_high"] - output_df["mu_star"],
+                    arrayminus=output_df["mu_star"] - output_df["mu_star_low"]
+                )
+            ))
+            fig.update_layout(
+                title="Efeito Médio Absoluto (μ*) com Intervalo de Confiança de 95%",
+                xaxis_title="μ*",
+                yaxis_title="Parâmetro"
+            )
+        else:
+            output_df = output_df.sort_values("ST", ascending=True)
+            fig = go.Figure()
+            for index, label in [("S1", "Primeira Ordem (S1)"), ("ST", "Total (ST)")]:
+                fig.add_trace(go.Bar(
+                    x=output_df[index],
+                    y=output_df["parameter"],
+                    orientation="h",
+                    name=label,
+                    error_x=dict(
+                        type="data",
+                        symmetric=False,
+                        array=output_df[f"{index}_high"] - output_df[index],
+                        arrayminus=output_df[index] - output_df[f"{index}_low"]
+                    )
+                ))
+            fig.update_layout(
+                title="Índices de Sobol com Intervalo de Confiança de 95%",
+                xaxis_title="Fração da Variância",
+                yaxis_title="Parâmetro",
+                barmode="group"
+            )
+
+        st.plotly_chart(fig, use_container_width=True)
+
+    with st.expander("Ver Tabela de Índices"):
+        st.dataframe(results)
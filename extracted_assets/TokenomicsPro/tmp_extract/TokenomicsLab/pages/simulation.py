@@ -2,7 +2,6 @@ import streamlit as st
 import numpy as np
 import pandas as pd
 import plotly.express as px
-import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 import json
 from datetime import datetime
@@ -12,6 +11,8 @@ import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from models.tokenomics import TokenomicsModel, UtilityTokenModel, GovernanceTokenModel
+from models.cache import cached_simulate
+from utils.visualization import create_token_release_chart
 
 # Função para gastar créditos (importada do app.py)
 def spend_credits(feature_name, cost=1):
@@ -357,6 +358,14 @@ with col2:
             step=0.1,
             help="Crescimento mensal estimado na taxa de staking."
         ) / 100
+    
+    simulation_seed = st.number_input(
+        "Semente Aleatória",
+        min_value=0,
+        value=42,
+        step=1,
+        help="A mesma semente reproduz exatamente a mesma simulação, e simulações repetidas são servidas do cache"
+    )
 
 # Run Simulation Button
 if st.button("Executar Simulação", type="primary"):
@@ -415,23 +424,29 @@ if st.button("Executar Simulação", type="primary"):
                 
                 # Run simulation based on model type
                 if model_type == "Utility Token":
-                    simulation_result = model.simulate_token_price(
+                    simulation_result = cached_simulate(
+                        model,
                         simulation_months, 
                         initial_price,
+                        rng=int(simulation_seed),
                         tokens_per_user=tokens_per_user,
                         volatility=volatility
                     )
                 elif model_type == "Governance Token":
-                    simulation_result = model.simulate_token_price(
+                    simulation_result = cached_simulate(
+                        model,
                         simulation_months, 
                         initial_price,
+                        rng=int(simulation_seed),
                         staking_growth=staking_growth,
                         volatility=volatility
                     )
                 else:
-                    simulation_result = model.simulate_token_price(
+                    simulation_result = cached_simulate(
+                        model,
                         simulation_months, 
                         initial_price,
+                        rng=int(simulation_seed),
                         volatility=volatility
                     )
                 
@@ -458,7 +473,8 @@ if st.button("Executar Simulação", type="primary"):
 if st.session_state.simulation_result is not None:
     st.header("Resultados da Simulação")
     
-    df = st.session_state.simulation_result
+    result = st.session_state.simulation_result
+    df = result.to_dataframe()
     
     # Show price chart
     st.subheader("Evolução do Preço do Token")
@@ -480,32 +496,7 @@ if st.session_state.simulation_result is not None:
     # Show circulating supply and token release
     st.subheader("Oferta Circulante e Liberação de Tokens")
     
-    # Identify token release columns
-    release_columns = [col for col in df.columns if col.endswith("_Released")]
-    if release_columns:
-        # Prepare data for stacked area chart
-        fig = go.Figure()
-        
-        for col in release_columns:
-            category = col.replace("_Released", "")
-            fig.add_trace(
-                go.Scatter(
-                    x=df["Month"], 
-                    y=df[col],
-                    name=category,
-                    stackgroup='one',
-                    mode='lines'
-                )
-            )
-        
-        fig.update_layout(
-            title="Liberação de Tokens por Categoria",
-            xaxis_title="Mês",
-            yaxis_title="Tokens Liberados",
-            hovermode="x unified"
-        )
-        
-        st.plotly_chart(fig, use_container_width=True)
+    st.plotly_chart(create_token_release_chart(result), use_container_width=True)
     
     # Show market cap
     st.subheader("Market Cap")
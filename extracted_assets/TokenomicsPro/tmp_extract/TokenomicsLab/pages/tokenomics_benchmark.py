@@ -1,6 +1,5 @@
 import streamlit as st
 import pandas as pd
-import numpy as np
 import plotly.express as px
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
@@ -9,6 +8,9 @@ from datetime import datetime, timedelta
 import time
 import math
 from models.tokenomics import TokenomicsModel, UtilityTokenModel, GovernanceTokenModel
+from models.rng import make_rng, spawn_rngs
+from models.stream import SimulationBuffer, next_batch, simulate_steps
+from functools import partial
 
 st.set_page_config(
     page_title="Benchmark de Tokenomics | Tokenomics Lab",
@@ -52,6 +54,13 @@ if 'speed_multiplier' not in st.session_state:
     st.session_state.speed_multiplier = 1
 if 'last_update_time' not in st.session_state:
     st.session_state.last_update_time = datetime.now()
+if 'benchmark_seed' not in st.session_state:
+    st.session_state.benchmark_seed = 42
+if 'benchmark_rngs' not in st.session_state:
+    st.session_state.benchmark_rngs = {}
+
+# Colunas do histórico de cada modelo
+BENCHMARK_COLUMNS = ['Month', 'Price', 'Circulating_Supply', 'Market_Cap', 'Adoption', 'ROI']
 
 # Título e introdução
 st.title("🔍 Benchmark de Estratégias de Tokenomics")
@@ -79,6 +88,7 @@ with tab1:
             max_value=60,
             value=st.session_state.simulation_months,
             step=12,
+            disabled=st.session_state.benchmark_running,
             help="Período de tempo para simular os modelos"
         )
         st.session_state.simulation_months = months
@@ -108,6 +118,15 @@ with tab1:
             help="Quanto maior, mais voláteis serão os preços simulados"
         )
         
+        benchmark_seed = st.number_input(
+            "Semente Aleatória",
+            min_value=0,
+            value=st.session_state.benchmark_seed,
+            step=1,
+            help="A mesma semente reproduz exatamente o mesmo benchmark"
+        )
+        st.session_state.benchmark_seed = int(benchmark_seed)
+        
         speed_options = {
             "0.5x (Lento)": 0.5,
             "1x (Normal)": 1,
@@ -141,19 +160,27 @@ with tab1:
                         st.session_state.current_month = 0
                         st.session_state.last_update_time = datetime.now()
                         
-                        # Inicializar resultados
+                        # Um fluxo aleatório independente por modelo, derivado da semente
+                        st.session_state.benchmark_rngs = dict(zip(
+                            st.session_state.benchmark_models.keys(),
+                            spawn_rngs(st.session_state.benchmark_seed, len(st.session_state.benchmark_models))
+                        ))
+                        
+                        # Inicializar resultados, com histórico pré-alocado para todos os meses
                         st.session_state.benchmark_results = {}
                         for model_id, model in st.session_state.benchmark_models.items():
                             initial_price = 1.0  # Todos começam do mesmo ponto para comparação justa
+                            data = SimulationBuffer(BENCHMARK_COLUMNS, capacity=st.session_state.simulation_months + 1)
+                            data.append({
+                                'Month': 0,
+                                'Price': initial_price,
+                                'Circulating_Supply': 0,
+                                'Market_Cap': 0,
+                                'Adoption': 0,
+                                'ROI': 0
+                            })
                             st.session_state.benchmark_results[model_id] = {
-                                'data': pd.DataFrame({
-                                    'Month': [0],
-                                    'Price': [initial_price],
-                                    'Circulating_Supply': [0],
-                                    'Market_Cap': [0],
-                                    'Adoption': [0],
-                                    'ROI': [0]
-                                }),
+                                'data': data,
                                 'events': []
                             }
                         st.rerun()
@@ -439,8 +466,8 @@ with tab2:
                 with metric_cols[i]:
                     result_data = st.session_state.benchmark_results[model_id]['data']
                     
-                    if not result_data.empty:
-                        last_row = result_data.iloc[-1]
+                    if len(result_data):
+                        last_row = result_data.last_row()
                         
                         # Calcular ROI desde o início
                         roi = (last_row['Price'] / 1.0 - 1) * 100  # 1.0 é o preço inicial
@@ -523,7 +550,7 @@ with tab2:
                         if model_id in st.session_state.benchmark_results:
                             df = st.session_state.benchmark_results[model_id]['data']
                             
-                            if not df.empty:
+                            if len(df):
                                 fig.add_trace(
                                     go.Scatter(
                                         x=df['Month'],
@@ -583,7 +610,7 @@ with tab2:
             
             for model_id, model_info in st.session_state.benchmark_models.items():
                 if model_id in st.session_state.benchmark_results:
-                    last_price = st.session_state.benchmark_results[model_id]['data'].iloc[-1]['Price']
+                    last_price = st.session_state.benchmark_results[model_id]['data'].last_row()['Price']
                     
                     # Simular o preço final sob diferentes condições
                     sensitivity_prices = []
@@ -629,23 +656,24 @@ with tab2:
             st.plotly_chart(sensitivity_fig, use_container_width=True)
 
 # Função para calcular as métricas de um modelo para um determinado mês
-def simulate_month(model_info, current_month, market_bias, volatility, current_data=None):
+def simulate_month(model_info, current_month, market_bias, volatility, current_data, rng=None):
+    rng = make_rng(rng)
     model = model_info['model']
     model_type = model_info['type']
     
     # Se for o primeiro mês, inicializar dados
-    if current_data is None or current_data.empty:
-        return pd.DataFrame({
-            'Month': [0],
-            'Price': [1.0],  # Todos modelos começam com o mesmo preço para comparação justa
-            'Circulating_Supply': [model.calculate_released_tokens(0).get('total', 0)],
-            'Market_Cap': [1.0 * model.calculate_released_tokens(0).get('total', 0)],
-            'Adoption': [1.0],  # Nível de adoção/utilização (1-10)
-            'ROI': [0.0]  # Retorno sobre investimento (%)
-        })
+    if len(current_data) == 0:
+        return {
+            'Month': 0,
+            'Price': 1.0,  # Todos modelos começam com o mesmo preço para comparação justa
+            'Circulating_Supply': model.calculate_released_tokens(0).get('total', 0),
+            'Market_Cap': 1.0 * model.calculate_released_tokens(0).get('total', 0),
+            'Adoption': 1.0,  # Nível de adoção/utilização (1-10)
+            'ROI': 0.0  # Retorno sobre investimento (%)
+        }
     
     # Obter última linha de dados
-    last_row = current_data.iloc[-1].copy()
+    last_row = current_data.last_row()
     
     # Calcular supply circulante baseado no cronograma de vesting
     released_tokens = model.calculate_released_tokens(current_month)
@@ -662,7 +690,7 @@ def simulate_month(model_info, current_month, market_bias, volatility, current_d
         demand_growth = (0.01 + 0.02 * token_utility_factor + 0.02 * usage_frequency_factor)
         
         # Adicionar aleatoriedade e fatores de mercado
-        demand_change = np.random.normal(demand_growth + market_bias, volatility)
+        demand_change = rng.normal(demand_growth + market_bias, volatility)
         
     else:  # Token de Governança
         # Para tokens de governança, a demanda é baseada em staking e governança
@@ -674,7 +702,7 @@ def simulate_month(model_info, current_month, market_bias, volatility, current_d
         demand_growth = (0.005 + 0.015 * governance_power_factor + 0.01 * staking_lock_factor)
         
         # Adicionar aleatoriedade e fatores de mercado
-        demand_change = np.random.normal(demand_growth + market_bias, volatility * 0.8)  # Governança é menos volátil
+        demand_change = rng.normal(demand_growth + market_bias, volatility * 0.8)  # Governança é menos volátil
     
     # Calcular novo preço baseado na oferta e demanda
     # Se a oferta circulante aumentou muito rapidamente, isso pressiona o preço para baixo
@@ -703,13 +731,13 @@ def simulate_month(model_info, current_month, market_bias, volatility, current_d
         new_adoption = min(10, adoption_base + 0.05 * governance_factor)
     
     # Adicionar aleatoriedade à adoção
-    new_adoption = max(1, min(10, new_adoption + np.random.normal(0, 0.1)))
+    new_adoption = max(1, min(10, new_adoption + rng.normal(0, 0.1)))
     
     # Calcular ROI
     new_roi = (new_price / 1.0 - 1) * 100  # 1.0 é o preço inicial
     
-    # Criar nova linha de dados
-    new_row = {
+    # Nova linha de dados (adicionada ao histórico por simulate_steps)
+    return {
         'Month': current_month,
         'Price': new_price,
         'Circulating_Supply': new_circulating_supply,
@@ -717,18 +745,32 @@ def simulate_month(model_info, current_month, market_bias, volatility, current_d
         'Adoption': new_adoption,
         'ROI': new_roi
     }
+
+# Função para simular um mês completo de um modelo: mercado e eventos
+def simulate_model_month(current_data, current_month, model_id, model_info, market_bias, volatility, rng=None):
+    new_row = simulate_month(model_info, current_month, market_bias, volatility, current_data, rng=rng)
+    
+    # Verificar se ocorre um evento
+    new_event = generate_random_event(model_info, current_month, rng=rng)
+    if new_event:
+        st.session_state.benchmark_results[model_id]['events'].append(new_event)
+        
+        # Aplicar impacto do evento no preço e recalcular market cap e ROI
+        new_row['Price'] = new_row['Price'] * (1 + new_event['price_impact'])
+        new_row['Market_Cap'] = new_row['Price'] * new_row['Circulating_Supply']
+        new_row['ROI'] = (new_row['Price'] / 1.0 - 1) * 100
     
-    # Retornar dataframe atualizado
-    return pd.concat([current_data, pd.DataFrame([new_row])], ignore_index=True)
+    return new_row
 
 # Gerar um evento aleatório para o modelo
-def generate_random_event(model_info, current_month):
+def generate_random_event(model_info, current_month, rng=None):
+    rng = make_rng(rng)
     model_type = model_info['type']
     
     # Probabilidade de evento baseada no mês (mais provável no início)
     event_probability = 0.15 if current_month < 6 else 0.08
     
-    if random.random() > event_probability:
+    if rng.random() > event_probability:
         return None
     
     # Eventos comuns a todos os tipos de token
@@ -736,17 +778,17 @@ def generate_random_event(model_info, current_month):
         {
             'name': 'Listagem em Exchange',
             'description': 'O token foi listado em uma nova exchange importante.',
-            'price_impact': random.uniform(0.05, 0.15)
+            'price_impact': rng.uniform(0.05, 0.15)
         },
         {
             'name': 'Parceria Estratégica',
             'description': 'Uma parceria estratégica foi anunciada.',
-            'price_impact': random.uniform(0.03, 0.1)
+            'price_impact': rng.uniform(0.03, 0.1)
         },
         {
             'name': 'Condições Macroeconômicas',
             'description': 'Mudanças nas condições macroeconômicas afetaram o mercado.',
-            'price_impact': random.uniform(-0.1, 0.1)
+            'price_impact': rng.uniform(-0.1, 0.1)
         }
     ]
     
@@ -756,17 +798,17 @@ def generate_random_event(model_info, current_month):
             {
                 'name': 'Novo Caso de Uso',
                 'description': 'Um novo caso de uso para o token foi implementado.',
-                'price_impact': random.uniform(0.04, 0.12)
+                'price_impact': rng.uniform(0.04, 0.12)
             },
             {
                 'name': 'Aumento na Base de Usuários',
                 'description': 'A base de usuários cresceu significativamente.',
-                'price_impact': random.uniform(0.05, 0.15)
+                'price_impact': rng.uniform(0.05, 0.15)
             },
             {
                 'name': 'Problema Técnico',
                 'description': 'Um problema técnico afetou temporariamente a utilidade do token.',
-                'price_impact': random.uniform(-0.15, -0.05)
+                'price_impact': rng.uniform(-0.15, -0.05)
             }
         ]
     else:  # Token de Governança
@@ -774,23 +816,23 @@ def generate_random_event(model_info, current_month):
             {
                 'name': 'Proposta de Governança Importante',
                 'description': 'Uma proposta importante foi aprovada pela governança.',
-                'price_impact': random.uniform(0.03, 0.1)
+                'price_impact': rng.uniform(0.03, 0.1)
             },
             {
                 'name': 'Aumento no APY de Staking',
                 'description': 'O rendimento de staking foi aumentado.',
-                'price_impact': random.uniform(0.05, 0.12)
+                'price_impact': rng.uniform(0.05, 0.12)
             },
             {
                 'name': 'Redução no Período de Lock',
                 'description': 'O período de lock do staking foi reduzido.',
-                'price_impact': random.uniform(-0.08, -0.02)
+                'price_impact': rng.uniform(-0.08, -0.02)
             }
         ]
     
     # Combinar eventos e escolher aleatoriamente
     all_events = common_events + specific_events
-    event = random.choice(all_events)
+    event = all_events[rng.integers(len(all_events))]
     
     # Adicionar mês do evento
     event['month'] = current_month
@@ -810,35 +852,20 @@ if st.session_state.benchmark_running:
         if st.session_state.current_month < st.session_state.simulation_months:
             # Simular cada modelo para o mês atual
             for model_id, model_info in st.session_state.benchmark_models.items():
-                # Obter dados atuais
-                current_data = st.session_state.benchmark_results[model_id]['data'] if model_id in st.session_state.benchmark_results else None
-                
-                # Simular mês atual
-                new_data = simulate_month(
-                    model_info=model_info,
-                    current_month=st.session_state.current_month + 1,
-                    market_bias=market_bias,
-                    volatility=volatility,
-                    current_data=current_data
+                steps = simulate_steps(
+                    partial(
+                        simulate_model_month,
+                        model_id=model_id,
+                        model_info=model_info,
+                        market_bias=market_bias,
+                        volatility=volatility,
+                        rng=st.session_state.benchmark_rngs.get(model_id)
+                    ),
+                    st.session_state.benchmark_results[model_id]['data'],
+                    start=st.session_state.current_month + 1,
+                    stop=st.session_state.simulation_months + 1
                 )
-                
-                # Verificar se ocorre um evento
-                new_event = generate_random_event(model_info, st.session_state.current_month + 1)
-                if new_event:
-                    st.session_state.benchmark_results[model_id]['events'].append(new_event)
-                    
-                    # Aplicar impacto do evento no preço
-                    latest_price = new_data.iloc[-1]['Price']
-                    new_data.iloc[-1, new_data.columns.get_loc('Price')] = latest_price * (1 + new_event['price_impact'])
-                    
-                    # Recalcular market cap e ROI
-                    latest_supply = new_data.iloc[-1]['Circulating_Supply']
-                    latest_price = new_data.iloc[-1]['Price']  # Novo preço após o evento
-                    new_data.iloc[-1, new_data.columns.get_loc('Market_Cap')] = latest_price * latest_supply
-                    new_data.iloc[-1, new_data.columns.get_loc('ROI')] = (latest_price / 1.0 - 1) * 100
-                
-                # Atualizar dados na sessão
-                st.session_state.benchmark_results[model_id]['data'] = new_data
+                next_batch(steps, 1)
             
             # Incrementar mês atual
             st.session_state.current_month += 1
@@ -847,4 +874,8 @@ if st.session_state.benchmark_running:
         else:
             # Simulação concluída
             st.session_state.benchmark_running = False
-            st.success("Benchmark concluído!")
\ No newline at end of file
+            st.success("Benchmark concluído!")
+# Continuar o benchmark ao vivo até o último mês
+if st.session_state.benchmark_running:
+    time.sleep(0.5 / st.session_state.speed_multiplier)
+    st.rerun()
@@ -2,22 +2,36 @@ import pandas as pd
 import numpy as np
 from typing import Dict, List, Tuple, Optional, Union
 
+from models.results import SimulationResult
+
+SimulationData = Union[pd.DataFrame, SimulationResult]
+
 def calculate_token_metrics(
-    df: pd.DataFrame,
+    df: SimulationData,
     initial_price: float,
     total_supply: int
-) -> pd.DataFrame:
+) -> SimulationData:
     """
     Calculate additional token metrics from simulation data
     
     Args:
-        df (pd.DataFrame): Simulation dataframe
+        df (Union[pd.DataFrame, SimulationResult]): Simulation results
         initial_price (float): Initial token price
         total_supply (int): Total token supply
         
     Returns:
-        pd.DataFrame: Enhanced dataframe with additional metrics
+        Union[pd.DataFrame, SimulationResult]: Enhanced results with additional metrics,
+            of the same type as the input
     """
+    if isinstance(df, SimulationResult):
+        price = df['Price']
+        metrics = {'Price_Change_Pct': ((price / initial_price) - 1) * 100}
+        if 'Market_Cap' not in df:
+            metrics['Market_Cap'] = price * df['Circulating_Supply']
+        metrics['Fully_Diluted_Valuation'] = price * total_supply
+        metrics['Circulating_Supply_Pct'] = (df['Circulating_Supply'] / total_supply) * 100
+        return df.with_metrics(**metrics)
+        
     # Make a copy to avoid modifying the original
     result = df.copy()
     
@@ -37,7 +51,7 @@ def calculate_token_metrics(
     return result
 
 def annualize_returns(
-    df: pd.DataFrame,
+    df: SimulationData,
     price_column: str = 'Price',
     periods_per_year: int = 12
 ) -> float:
@@ -45,15 +59,16 @@ def annualize_returns(
     Calculate annualized return from price data
     
     Args:
-        df (pd.DataFrame): Dataframe with price data
+        df (Union[pd.DataFrame, SimulationResult]): Results with price data
         price_column (str): Column name containing price data
         periods_per_year (int): Number of periods in a year (e.g., 12 for monthly data)
         
     Returns:
         float: Annualized return percentage
     """
-    initial_price = df[price_column].iloc[0]
-    final_price = df[price_column].iloc[-1]
+    prices = np.asarray(df[price_column])
+    initial_price = prices[0]
+    final_price = prices[-1]
     num_periods = len(df) - 1
     
     # Calculate total return
@@ -66,21 +81,21 @@ def annualize_returns(
     return annualized_return * 100  # Convert to percentage
 
 def calculate_volatility(
-    df: pd.DataFrame,
+    df: SimulationData,
     price_column: str = 'Price'
 ) -> float:
     """
     Calculate price volatility (standard deviation of returns)
     
     Args:
-        df (pd.DataFrame): Dataframe with price data
+        df (Union[pd.DataFrame, SimulationResult]): Results with price data
         price_column (str): Column name containing price data
         
     Returns:
         float: Volatility as percentage
     """
     # Calculate percentage returns
-    returns = df[price_column].pct_change().dropna()
+    returns = pd.Series(df[price_column]).pct_change().dropna()
     
     # Calculate volatility as standard deviation of returns
     volatility = returns.std() * 100  # Convert to percentage
@@ -141,21 +156,31 @@ def project_token_release(
     return df
 
 def calculate_token_velocity(
-    df: pd.DataFrame,
+    df: SimulationData,
     supply_column: str = 'Circulating_Supply',
     demand_column: str = 'Token_Demand'
-) -> pd.DataFrame:
+) -> SimulationData:
     """
     Calculate token velocity (how quickly tokens change hands)
     
     Args:
-        df (pd.DataFrame): Simulation dataframe
+        df (Union[pd.DataFrame, SimulationResult]): Simulation results
         supply_column (str): Column name for circulating supply
         demand_column (str): Column name for token demand
         
     Returns:
-        pd.DataFrame: Dataframe with velocity metric added
+        Union[pd.DataFrame, SimulationResult]: Results with velocity metric added,
+            of the same type as the input
     """
+    if isinstance(df, SimulationResult):
+        if demand_column in df:
+            with np.errstate(divide='ignore', invalid='ignore'):
+                velocity = np.nan_to_num(df[demand_column] / df[supply_column], nan=0.0,
+                                         posinf=np.inf, neginf=-np.inf)
+        else:
+            velocity = np.full(len(df), np.nan)
+        return df.with_metrics(Token_Velocity=velocity)
+        
     # Make a copy to avoid modifying the original
     result = df.copy()
     
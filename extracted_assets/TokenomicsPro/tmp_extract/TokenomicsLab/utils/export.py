@@ -12,6 +12,7 @@ import os
 from typing import Dict, List, Tuple, Optional, Union, Any
 
 # Import local modules
+from models.results import SimulationResult
 from models.tokenomics import TokenomicsModel
 from utils.visualization import (
     create_matplotlib_distribution_chart,
@@ -29,6 +30,21 @@ try:
     REPORTLAB_AVAILABLE = True
 except ImportError:
     REPORTLAB_AVAILABLE = False
+
+SimulationData = Union[pd.DataFrame, SimulationResult]
+
+def _column(df: SimulationData, column: str) -> np.ndarray:
+    """
+    Get a column of simulation results as an array, for positional access
+    
+    Args:
+        df (Union[pd.DataFrame, SimulationResult]): Simulation results
+        column (str): Column name
+        
+    Returns:
+        np.ndarray: Column values
+    """
+    return np.asarray(df[column])
     
 
 def get_download_link(object_to_download, download_filename, download_link_text):
@@ -58,7 +74,7 @@ def get_download_link(object_to_download, download_filename, download_link_text)
 
 def generate_pdf_report(
     model: TokenomicsModel, 
-    df: pd.DataFrame, 
+    df: SimulationData, 
     report_title: str, 
     author: str, 
     date_str: str,
@@ -75,7 +91,7 @@ def generate_pdf_report(
     
     Args:
         model (TokenomicsModel): Tokenomics model
-        df (pd.DataFrame): Simulation dataframe
+        df (Union[pd.DataFrame, SimulationResult]): Simulation results
         report_title (str): Title of the report
         author (str): Author name
         date_str (str): Date string
@@ -177,15 +193,15 @@ def generate_pdf_report(
         model_type = "Governance Token"
     
     # Key metrics
-    latest_price = df['Price'].iloc[-1]
-    initial_price = df['Price'].iloc[0]
+    latest_price = _column(df, 'Price')[-1]
+    initial_price = _column(df, 'Price')[0]
     price_change = ((latest_price - initial_price) / initial_price) * 100
     
-    latest_supply = df['Circulating_Supply'].iloc[-1]
+    latest_supply = _column(df, 'Circulating_Supply')[-1]
     total_supply = model.total_supply
     supply_percent = (latest_supply / total_supply) * 100
     
-    latest_mcap = df['Market_Cap'].iloc[-1]
+    latest_mcap = _column(df, 'Market_Cap')[-1]
     
     summary_text = f"""
     Este relatório apresenta uma análise detalhada do modelo de tokenomics para <b>{model.name}</b>.
@@ -358,8 +374,8 @@ def generate_pdf_report(
             elements.append(Paragraph("Métricas de Utility Token:", styles['NormalStyle']))
             
             metrics_text = f"""
-            <b>Usuários Finais:</b> {df['Users'].iloc[-1]:,.0f} (crescimento de {((df['Users'].iloc[-1] / df['Users'].iloc[0]) - 1) * 100:.1f}%)<br/>
-            <b>Demanda Final de Tokens:</b> {df['Token_Demand'].iloc[-1]:,.0f} tokens<br/>
+            <b>Usuários Finais:</b> {_column(df, 'Users')[-1]:,.0f} (crescimento de {((_column(df, 'Users')[-1] / _column(df, 'Users')[0]) - 1) * 100:.1f}%)<br/>
+            <b>Demanda Final de Tokens:</b> {_column(df, 'Token_Demand')[-1]:,.0f} tokens<br/>
             """
             
             elements.append(Paragraph(metrics_text, styles['NormalStyle']))
@@ -370,8 +386,8 @@ def generate_pdf_report(
             elements.append(Paragraph("Métricas de Governance Token:", styles['NormalStyle']))
             
             metrics_text = f"""
-            <b>Taxa Final de Staking:</b> {df['Staking_Rate'].iloc[-1]:.1%}<br/>
-            <b>Tokens em Staking:</b> {df['Staked_Tokens'].iloc[-1]:,.0f} tokens ({df['Staked_Tokens'].iloc[-1] / df['Circulating_Supply'].iloc[-1] * 100:.1f}% da oferta circulante)<br/>
+            <b>Taxa Final de Staking:</b> {_column(df, 'Staking_Rate')[-1]:.1%}<br/>
+            <b>Tokens em Staking:</b> {_column(df, 'Staked_Tokens')[-1]:,.0f} tokens ({_column(df, 'Staked_Tokens')[-1] / _column(df, 'Circulating_Supply')[-1] * 100:.1f}% da oferta circulante)<br/>
             """
             
             elements.append(Paragraph(metrics_text, styles['NormalStyle']))
@@ -406,7 +422,7 @@ def generate_pdf_report(
 
 def generate_html_report(
     model: TokenomicsModel, 
-    df: pd.DataFrame, 
+    df: SimulationData, 
     report_title: str, 
     author: str, 
     date_str: str,
@@ -423,7 +439,7 @@ def generate_html_report(
     
     Args:
         model (TokenomicsModel): Tokenomics model
-        df (pd.DataFrame): Simulation dataframe
+        df (Union[pd.DataFrame, SimulationResult]): Simulation results
         report_title (str): Title of the report
         author (str): Author name
         date_str (str): Date string
@@ -446,15 +462,15 @@ def generate_html_report(
         model_type = "Governance Token"
     
     # Key metrics
-    latest_price = df['Price'].iloc[-1]
-    initial_price = df['Price'].iloc[0]
+    latest_price = _column(df, 'Price')[-1]
+    initial_price = _column(df, 'Price')[0]
     price_change = ((latest_price - initial_price) / initial_price) * 100
     
-    latest_supply = df['Circulating_Supply'].iloc[-1]
+    latest_supply = _column(df, 'Circulating_Supply')[-1]
     total_supply = model.total_supply
     supply_percent = (latest_supply / total_supply) * 100
     
-    latest_mcap = df['Market_Cap'].iloc[-1]
+    latest_mcap = _column(df, 'Market_Cap')[-1]
     
     # Create distribution pie chart
     fig = create_matplotlib_distribution_chart(model.distribution)
@@ -634,25 +650,25 @@ def generate_html_report(
         
         if 'Users' in df.columns and 'Token_Demand' in df.columns:
             # Utility token metrics
-            user_growth = ((df['Users'].iloc[-1] / df['Users'].iloc[0]) - 1) * 100
+            user_growth = ((_column(df, 'Users')[-1] / _column(df, 'Users')[0]) - 1) * 100
             
             html_content += f"""
             <h3>Métricas de Utility Token</h3>
             <ul>
-                <li><strong>Usuários Finais:</strong> {df['Users'].iloc[-1]:,.0f} (crescimento de {user_growth:.1f}%)</li>
-                <li><strong>Demanda Final de Tokens:</strong> {df['Token_Demand'].iloc[-1]:,.0f} tokens</li>
+                <li><strong>Usuários Finais:</strong> {_column(df, 'Users')[-1]:,.0f} (crescimento de {user_growth:.1f}%)</li>
+                <li><strong>Demanda Final de Tokens:</strong> {_column(df, 'Token_Demand')[-1]:,.0f} tokens</li>
             </ul>
             """
             
         elif 'Staking_Rate' in df.columns and 'Staked_Tokens' in df.columns:
             # Governance token metrics
-            staked_percent = df['Staked_Tokens'].iloc[-1] / df['Circulating_Supply'].iloc[-1] * 100
+            staked_percent = _column(df, 'Staked_Tokens')[-1] / _column(df, 'Circulating_Supply')[-1] * 100
             
             html_content += f"""
             <h3>Métricas de Governance Token</h3>
             <ul>
-                <li><strong>Taxa Final de Staking:</strong> {df['Staking_Rate'].iloc[-1]:.1%}</li>
-                <li><strong>Tokens em Staking:</strong> {df['Staked_Tokens'].iloc[-1]:,.0f} tokens ({staked_percent:.1f}% da oferta circulante)</li>
+                <li><strong>Taxa Final de Staking:</strong> {_column(df, 'Staking_Rate')[-1]:.1%}</li>
+                <li><strong>Tokens em Staking:</strong> {_column(df, 'Staked_Tokens')[-1]:,.0f} tokens ({staked_percent:.1f}% da oferta circulante)</li>
             </ul>
             """
     
@@ -8,6 +8,38 @@ import matplotlib.pyplot as plt
 import matplotlib.ticker as mtick
 from typing import Dict, List, Tuple, Optional, Union
 
+from models.results import SimulationResult
+
+SimulationData = Union[pd.DataFrame, SimulationResult]
+
+def _select_columns(df: SimulationData, columns: List[str]) -> pd.DataFrame:
+    """
+    Get a narrow DataFrame with only the columns a chart plots
+    
+    Args:
+        df (Union[pd.DataFrame, SimulationResult]): Simulation results
+        columns (List[str]): Column names to keep
+        
+    Returns:
+        pd.DataFrame: Dataframe with the requested columns
+    """
+    return pd.DataFrame({column: df[column] for column in columns})
+
+def _category_releases(df: SimulationData) -> Dict[str, np.ndarray]:
+    """
+    Get cumulative released tokens per category
+    
+    Args:
+        df (Union[pd.DataFrame, SimulationResult]): Simulation results
+        
+    Returns:
+        Dict[str, np.ndarray]: Released tokens per category
+    """
+    if isinstance(df, SimulationResult):
+        return dict(zip(df.categories, df.released))
+    release_columns = [col for col in df.columns if col.endswith("_Released")]
+    return {col.replace("_Released", ""): df[col] for col in release_columns}
+
 def create_distribution_pie_chart(
     distribution: Dict[str, float], 
     title: str = "Distribuição de Tokens"
@@ -34,21 +66,21 @@ def create_distribution_pie_chart(
     return fig
 
 def create_price_chart(
-    df: pd.DataFrame,
+    df: SimulationData,
     title: str = "Evolução do Preço do Token"
 ) -> go.Figure:
     """
     Create a line chart for token price evolution
     
     Args:
-        df (pd.DataFrame): Simulation dataframe
+        df (Union[pd.DataFrame, SimulationResult]): Simulation results
         title (str): Chart title
         
     Returns:
         go.Figure: Plotly figure object
     """
     fig = px.line(
-        df, 
+        _select_columns(df, ["Month", "Price"]), 
         x="Month", 
         y="Price",
         title=title,
@@ -62,21 +94,21 @@ def create_price_chart(
     return fig
 
 def create_market_cap_chart(
-    df: pd.DataFrame,
+    df: SimulationData,
     title: str = "Evolução do Market Cap"
 ) -> go.Figure:
     """
     Create an area chart for market cap evolution
     
     Args:
-        df (pd.DataFrame): Simulation dataframe
+        df (Union[pd.DataFrame, SimulationResult]): Simulation results
         title (str): Chart title
         
     Returns:
         go.Figure: Plotly figure object
     """
     fig = px.area(
-        df, 
+        _select_columns(df, ["Month", "Market_Cap"]), 
         x="Month", 
         y="Market_Cap",
         title=title,
@@ -149,31 +181,27 @@ def create_vesting_chart(
     return fig
 
 def create_token_release_chart(
-    df: pd.DataFrame,
+    df: SimulationData,
     title: str = "Liberação de Tokens por Categoria"
 ) -> go.Figure:
     """
     Create a stacked area chart for token release
     
     Args:
-        df (pd.DataFrame): Simulation dataframe
+        df (Union[pd.DataFrame, SimulationResult]): Simulation results
         title (str): Chart title
         
     Returns:
         go.Figure: Plotly figure object
     """
-    # Identify token release columns
-    release_columns = [col for col in df.columns if col.endswith("_Released")]
-    
     # Create figure
     fig = go.Figure()
     
-    for col in release_columns:
-        category = col.replace("_Released", "")
+    for category, released_tokens in _category_releases(df).items():
         fig.add_trace(
             go.Scatter(
                 x=df["Month"], 
-                y=df[col],
+                y=released_tokens,
                 name=category,
                 stackgroup='one',
                 mode='lines'
@@ -190,7 +218,7 @@ def create_token_release_chart(
     return fig
 
 def create_dual_axis_chart(
-    df: pd.DataFrame, 
+    df: SimulationData, 
     x_column: str,
     y1_column: str, 
     y2_column: str,
@@ -202,7 +230,7 @@ def create_dual_axis_chart(
     Create a chart with dual y-axes
     
     Args:
-        df (pd.DataFrame): Dataframe with chart data
+        df (Union[pd.DataFrame, SimulationResult]): Chart data
         x_column (str): Column name for x-axis
         y1_column (str): Column name for first y-axis
         y2_column (str): Column name for second y-axis
@@ -249,7 +277,7 @@ def create_dual_axis_chart(
     return fig
 
 def create_price_supply_chart(
-    df: pd.DataFrame,
+    df: SimulationData,
     title_price: str = "Preço do Token ($)",
     title_supply: str = "Oferta Circulante de Tokens"
 ) -> go.Figure:
@@ -257,7 +285,7 @@ def create_price_supply_chart(
     Create a chart with price and circulating supply
     
     Args:
-        df (pd.DataFrame): Simulation dataframe
+        df (Union[pd.DataFrame, SimulationResult]): Simulation results
         title_price (str): Title for price subplot
         title_supply (str): Title for supply subplot
         
@@ -312,12 +340,12 @@ def create_price_supply_chart(
 
     return fig
 
-def create_utility_token_charts(df: pd.DataFrame) -> Dict[str, go.Figure]:
+def create_utility_token_charts(df: SimulationData) -> Dict[str, go.Figure]:
     """
     Create charts specific to utility token models
     
     Args:
-        df (pd.DataFrame): Simulation dataframe
+        df (Union[pd.DataFrame, SimulationResult]): Simulation results
         
     Returns:
         Dict[str, go.Figure]: Dictionary of chart name to figure object
@@ -326,7 +354,7 @@ def create_utility_token_charts(df: pd.DataFrame) -> Dict[str, go.Figure]:
     
     # Users chart
     charts['users'] = px.line(
-        df, 
+        _select_columns(df, ["Month", "Users"]), 
         x="Month", 
         y="Users",
         title="Crescimento de Usuários",
@@ -336,7 +364,7 @@ def create_utility_token_charts(df: pd.DataFrame) -> Dict[str, go.Figure]:
     
     # Token demand chart
     charts['demand'] = px.line(
-        df, 
+        _select_columns(df, ["Month", "Token_Demand"]), 
         x="Month", 
         y="Token_Demand",
         title="Demanda de Tokens",
@@ -346,7 +374,7 @@ def create_utility_token_charts(df: pd.DataFrame) -> Dict[str, go.Figure]:
     
     # Supply vs demand chart
     charts['supply_vs_demand'] = px.line(
-        df, 
+        _select_columns(df, ["Month", "Circulating_Supply", "Token_Demand"]), 
         x="Month", 
         y=["Circulating_Supply", "Token_Demand"],
         title="Oferta vs Demanda de Tokens",
@@ -363,12 +391,12 @@ def create_utility_token_charts(df: pd.DataFrame) -> Dict[str, go.Figure]:
     
     return charts
 
-def create_governance_token_charts(df: pd.DataFrame) -> Dict[str, go.Figure]:
+def create_governance_token_charts(df: SimulationData) -> Dict[str, go.Figure]:
     """
     Create charts specific to governance token models
     
     Args:
-        df (pd.DataFrame): Simulation dataframe
+        df (Union[pd.DataFrame, SimulationResult]): Simulation results
         
     Returns:
         Dict[str, go.Figure]: Dictionary of chart name to figure object
@@ -377,7 +405,7 @@ def create_governance_token_charts(df: pd.DataFrame) -> Dict[str, go.Figure]:
     
     # Staking rate chart
     charts['staking_rate'] = px.line(
-        df, 
+        _select_columns(df, ["Month", "Staking_Rate"]), 
         x="Month", 
         y="Staking_Rate",
         title="Taxa de Staking",
@@ -391,7 +419,7 @@ def create_governance_token_charts(df: pd.DataFrame) -> Dict[str, go.Figure]:
     
     # Staked vs liquid tokens chart
     charts['staked_vs_liquid'] = px.line(
-        df, 
+        _select_columns(df, ["Month", "Staked_Tokens", "Liquid_Tokens"]), 
         x="Month", 
         y=["Staked_Tokens", "Liquid_Tokens"],
         title="Tokens em Staking vs Tokens Líquidos",
@@ -409,7 +437,7 @@ def create_governance_token_charts(df: pd.DataFrame) -> Dict[str, go.Figure]:
     # Price vs staking rate chart
     if 'Price' in df.columns and 'Staking_Rate' in df.columns:
         # Normalize price for comparison
-        df_copy = df.copy()
+        df_copy = _select_columns(df, ['Month', 'Price', 'Staking_Rate'])
         df_copy['Normalized_Price'] = df_copy['Price'] / df_copy['Price'].iloc[0]
         df_copy['Staking_Rate_Pct'] = df_copy['Staking_Rate'] * 100
         
@@ -453,14 +481,14 @@ def create_matplotlib_distribution_chart(
     return fig
 
 def create_matplotlib_price_chart(
-    df: pd.DataFrame,
+    df: SimulationData,
     title: str = "Evolução do Preço do Token"
 ) -> plt.Figure:
     """
     Create a Matplotlib line chart for token price evolution
     
     Args:
-        df (pd.DataFrame): Simulation dataframe
+        df (Union[pd.DataFrame, SimulationResult]): Simulation results
         title (str): Chart title
         
     Returns:
@@ -476,14 +504,14 @@ def create_matplotlib_price_chart(
     return fig
 
 def create_matplotlib_market_cap_chart(
-    df: pd.DataFrame,
+    df: SimulationData,
     title: str = "Evolução do Market Cap"
 ) -> plt.Figure:
     """
     Create a Matplotlib area chart for market cap evolution
     
     Args:
-        df (pd.DataFrame): Simulation dataframe
+        df (Union[pd.DataFrame, SimulationResult]): Simulation results
         title (str): Chart title
         
     Returns:
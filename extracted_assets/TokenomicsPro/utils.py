@@ -68,14 +68,15 @@ def calculate_vesting_release(total_tokens, cliff_months, vesting_months, tge_pe
     else:
         monthly_release = remaining_tokens / vesting_months
     
-    # Create schedule dataframe
+    # Create schedule dataframe, with every date counted from the same start
     schedule = []
+    start_date = datetime.now()
     
     # Add TGE release if any
     if tge_percent > 0:
         schedule.append({
             'Month': 0,
-            'Date': datetime.now().strftime('%Y-%m-%d'),
+            'Date': start_date.strftime('%Y-%m-%d'),
             'Released Tokens': tge_release,
             'Cumulative Released': tge_release,
             'Percentage Released': tge_percent,
@@ -86,7 +87,7 @@ def calculate_vesting_release(total_tokens, cliff_months, vesting_months, tge_pe
     
     # Add all months including cliff period
     for month in range(1, cliff_months + vesting_months + 1):
-        date = (datetime.now() + timedelta(days=30*month)).strftime('%Y-%m-%d')
+        date = (start_date + timedelta(days=30*month)).strftime('%Y-%m-%d')
         
         # Determine release for this month
         if month <= cliff_months:
@@ -190,3 +191,26 @@ def get_color_scale():
         '#bcbd22',  # Yellow-green
         '#17becf'   # Cyan
     ]
+
+def make_rng(seed=None):
+    """
+    Return a numpy Generator for a seed, SeedSequence or existing Generator.
+    A Generator is returned unchanged; None seeds from fresh OS entropy.
+    """
+    if isinstance(seed, np.random.Generator):
+        return seed
+    return np.random.default_rng(seed)
+
+def spawn_rngs(seed, n):
+    """
+    Derive n independent child Generators from a parent seed.
+    Child i depends only on the parent seed and i, so work split across any
+    number of workers draws the same numbers as long as task i uses child i.
+    """
+    if isinstance(seed, np.random.Generator):
+        seed_sequence = seed.bit_generator.seed_seq
+    elif isinstance(seed, np.random.SeedSequence):
+        seed_sequence = seed
+    else:
+        seed_sequence = np.random.SeedSequence(seed)
+    return [np.random.default_rng(child) for child in seed_sequence.spawn(n)]